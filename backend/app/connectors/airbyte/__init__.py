@@ -64,11 +64,15 @@ from .protocol import (
     AirbyteTraceType,
     # Utilities
     parse_messages_from_output,
+    sniff_message_type,
     filter_records,
     filter_state,
     get_last_state,
     get_errors,
+    partition_messages,
+    MessageBuckets,
     create_record_message,
+    create_record_messages_batch,
     create_state_message,
     create_log_message,
     create_error_trace,
@@ -80,7 +84,9 @@ from .executor import (
     ExecutionResult,
     AirbyteCommand,
     get_docker_executor,
+    close_docker_executor,
     pull_image,
+    is_image_pulled,
     check_docker_available,
 )
 
@@ -101,6 +107,9 @@ from .registry import (
     get_connector_count,
     get_category_counts,
     AIRBYTE_CONNECTORS,
+    CONNECTORS,
+    CONNECTORS_BY_CATEGORY,
+    INCREMENTAL_CONNECTORS,
 )
 
 # =============================================================================
@@ -148,11 +157,15 @@ __all__ = [
     "AirbyteTraceType",
     # Protocol utilities
     "parse_messages_from_output",
+    "sniff_message_type",
     "filter_records",
     "filter_state",
     "get_last_state",
     "get_errors",
+    "partition_messages",
+    "MessageBuckets",
     "create_record_message",
+    "create_record_messages_batch",
     "create_state_message",
     "create_log_message",
     "create_error_trace",
@@ -162,7 +175,9 @@ __all__ = [
     "ExecutionResult",
     "AirbyteCommand",
     "get_docker_executor",
+    "close_docker_executor",
     "pull_image",
+    "is_image_pulled",
     "check_docker_available",
     # Adapter
     "AirbyteSourceAdapter",
@@ -179,6 +194,9 @@ __all__ = [
     "get_connector_count",
     "get_category_counts",
     "AIRBYTE_CONNECTORS",
+    "CONNECTORS",
+    "CONNECTORS_BY_CATEGORY",
+    "INCREMENTAL_CONNECTORS",
     # ==========================================================================
     # PyAirbyte SDK Execution (Development)
     # ==========================================================================
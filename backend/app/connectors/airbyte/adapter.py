@@ -28,15 +28,13 @@ from .protocol import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
     AirbyteMessage,
-    AirbyteMessageType,
     AirbyteRecordMessage,
+    AirbyteStateMessage,
     AirbyteStream,
     ConfiguredAirbyteCatalog,
     ConfiguredAirbyteStream,
     DestinationSyncMode,
     SyncMode,
-    filter_records,
-    get_last_state,
 )
 from .registry import get_connector_image, get_connector_info
 
@@ -153,7 +151,7 @@ class AirbyteSourceAdapter(SourceConnector):
 
     async def ensure_image_pulled(self) -> bool:
         """Ensure Docker image is available locally."""
-        return await pull_image(self.docker_image)
+        return await pull_image(self.docker_image, docker_host=self.executor.config.docker_host)
 
     async def test_connection(self) -> bool:
         """
@@ -281,10 +279,10 @@ class AirbyteSourceAdapter(SourceConnector):
                 raise RuntimeError(f"Read failed: {result.error}")
 
             # Extract records
-            records = filter_records(result.messages)
+            records = result.records
 
             # Update state for incremental sync
-            last_state = get_last_state(result.messages)
+            last_state = result.last_state
             if last_state and incremental:
                 self._state[table] = self._extract_state_data(last_state)
 
@@ -336,22 +334,24 @@ class AirbyteSourceAdapter(SourceConnector):
         batch_size = 1000
         batch: list[dict[str, Any]] = []
 
-        async for msg in self.executor.read_stream(
+        def save_state(state_msg: AirbyteStateMessage) -> None:
+            self._state[table] = self._extract_state_data(state_msg)
+
+        # Records only feed DataFrames, so take them as plain tuples rather
+        # than building a validated message model for each one
+        async for stream_name, data, _ in self.executor.read_records_raw(
             self.docker_image,
             self.airbyte_config,
             configured_catalog,
             state,
+            on_state=save_state,
         ):
-            if msg.type == AirbyteMessageType.RECORD and msg.record:
-                if msg.record.stream == table:
-                    batch.append(msg.record.data)
-
-                    if len(batch) >= batch_size:
-                        yield pd.DataFrame(batch)
-                        batch = []
+            if stream_name == table:
+                batch.append(data)
 
-            elif msg.type == AirbyteMessageType.STATE and msg.state:
-                self._state[table] = self._extract_state_data(msg.state)
+                if len(batch) >= batch_size:
+                    yield pd.DataFrame(batch)
+                    batch = []
 
         # Yield remaining records
         if batch:
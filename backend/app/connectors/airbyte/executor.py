@@ -15,28 +15,42 @@ Reference: https://docs.airbyte.com/understanding-airbyte/airbyte-protocol
 """
 
 import asyncio
-import json
+import hashlib
 import logging
+import mmap
 import os
+import shutil
 import tempfile
+import time
+from collections import OrderedDict
+from contextlib import aclosing, suppress
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import IO, Any, AsyncIterator, Callable
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
 
 from .protocol import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
     AirbyteConnectionStatusMessage,
+    AirbyteErrorTraceMessage,
     AirbyteMessage,
     AirbyteMessageType,
+    AirbyteRecordMessage,
     AirbyteSpecification,
+    AirbyteStateMessage,
     ConfiguredAirbyteCatalog,
-    filter_records,
-    get_errors,
-    get_last_state,
     parse_messages_from_output,
+    partition_messages,
+    sniff_message_type,
 )
 
 logger = logging.getLogger(__name__)
@@ -61,7 +75,52 @@ class ExecutorConfig:
     memory_limit: str = "2g"  # Container memory limit
     cpu_limit: float = 2.0  # CPU cores limit
     pull_policy: str = "if_not_present"  # always, never, if_not_present
+    prewarm_images: list[str] = field(default_factory=list)  # Images to pull in the background on startup
     working_dir: str = "/tmp/airbyte"  # Working directory for temp files
+    container_reuse_strategy: str = "none"  # none, warm (reuse containers for SPEC/CHECK/DISCOVER)
+    idle_ttl_seconds: int = 300  # Idle time before a warm container is stopped
+    stdout_capture: str = "pipe"  # pipe, file (spool stdout to an anonymous file, parse after exit)
+    cache_ttl_seconds: int = 3600  # SPEC/DISCOVER result cache lifetime (0 disables caching)
+    stream_buffer: int = 1024  # Parsed messages buffered ahead of a streaming consumer
+    log_driver: str | None = "none"  # Container log driver (output is read from stdout, not docker logs)
+    ipc_mode: str | None = "private"  # Container IPC namespace mode
+    pids_limit: int | None = None  # Max processes/threads per container (None: daemon default)
+
+
+@dataclass
+class _WarmContainer:
+    """A long-lived connector container that commands are exec'd into."""
+
+    container_id: str
+    entrypoint: list[str]
+    last_used: float
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+# Commands that are short-lived enough for container startup to dominate
+_WARM_COMMANDS = frozenset({AirbyteCommand.SPEC, AirbyteCommand.CHECK, AirbyteCommand.DISCOVER})
+
+# How often the reaper scans for idle warm containers
+_WARM_REAP_INTERVAL_SECONDS = 60
+
+# Maximum size of a single connector output line (one serialized message)
+_STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+# Requested connector stdout pipe capacity (Linux default is 64 KiB; 1 MiB
+# is the default unprivileged maximum, /proc/sys/fs/pipe-max-size)
+_STDOUT_PIPE_SIZE = 1024 * 1024
+
+# Bytes requested per read from connector stdout
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Bytes of a spooled stdout file split and parsed at a time
+_PARSE_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Message types read_records_raw needs to decode
+_RAW_MESSAGE_TYPES = frozenset({AirbyteMessageType.RECORD, AirbyteMessageType.STATE})
+
+# Maximum number of cached SPEC/DISCOVER results kept per executor
+_RESULT_CACHE_MAX_ENTRIES = 256
 
 
 @dataclass
@@ -76,6 +135,18 @@ class ExecutionResult:
     error: str | None = None
     exit_code: int = 0
 
+    # Derived from messages in a single pass at construction
+    records: list[AirbyteRecordMessage] = field(init=False, repr=False)
+    errors: list[AirbyteErrorTraceMessage] = field(init=False, repr=False)
+    last_state: AirbyteStateMessage | None = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Split messages into records, error traces and the final state."""
+        buckets = partition_messages(self.messages)
+        self.records = buckets.records
+        self.errors = buckets.errors
+        self.last_state = buckets.last_state
+
 
 class AirbyteDockerExecutor:
     """
@@ -96,6 +167,14 @@ class AirbyteDockerExecutor:
             config: Executor configuration
         """
         self.config = config or ExecutorConfig()
+        self._env = _docker_env(self.config.docker_host)
+        self._warm: dict[str, _WarmContainer] = {}
+        # One lock per image, so starting a cold image does not hold up others
+        self._warm_locks: dict[str, asyncio.Lock] = {}
+        self._reaper_task: asyncio.Task | None = None
+        self._prewarm_task: asyncio.Task | None = None
+        self._cleanup_tasks: set[asyncio.Task] = set()
+        self._result_cache: OrderedDict[tuple[str, ...], tuple[Any, float]] = OrderedDict()
         self._ensure_working_dir()
 
         logger.info(
@@ -118,6 +197,11 @@ class AirbyteDockerExecutor:
         Returns:
             AirbyteSpecification with connection requirements
         """
+        cache_key = await self._result_cache_key(image, AirbyteCommand.SPEC)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         result = await self._execute(image, AirbyteCommand.SPEC)
 
         if not result.success:
@@ -126,6 +210,7 @@ class AirbyteDockerExecutor:
         # Find SPEC message
         for msg in result.messages:
             if msg.type == AirbyteMessageType.SPEC and msg.spec:
+                self._cache_put(cache_key, msg.spec)
                 return msg.spec
 
         raise RuntimeError("No SPEC message in connector output")
@@ -157,11 +242,10 @@ class AirbyteDockerExecutor:
                 return msg.connectionStatus
 
         # Check for errors
-        errors = get_errors(result.messages)
-        if errors:
+        if result.errors:
             return AirbyteConnectionStatusMessage(
                 status=AirbyteConnectionStatus.FAILED,
-                message=errors[0].message,
+                message=result.errors[0].message,
             )
 
         if not result.success:
@@ -187,6 +271,11 @@ class AirbyteDockerExecutor:
         Returns:
             AirbyteCatalog with available streams
         """
+        cache_key = await self._result_cache_key(image, AirbyteCommand.DISCOVER, config)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         result = await self._execute(
             image,
             AirbyteCommand.DISCOVER,
@@ -199,6 +288,7 @@ class AirbyteDockerExecutor:
         # Find CATALOG message
         for msg in result.messages:
             if msg.type == AirbyteMessageType.CATALOG and msg.catalog:
+                self._cache_put(cache_key, msg.catalog)
                 return msg.catalog
 
         raise RuntimeError("No CATALOG message in connector output")
@@ -236,6 +326,7 @@ class AirbyteDockerExecutor:
         config: dict[str, Any],
         catalog: ConfiguredAirbyteCatalog,
         state: dict[str, Any] | None = None,
+        message_types: frozenset[AirbyteMessageType] | None = None,
     ) -> AsyncIterator[AirbyteMessage]:
         """
         Stream records from source (for large datasets).
@@ -245,18 +336,65 @@ class AirbyteDockerExecutor:
             config: Connector configuration
             catalog: Configured catalog
             state: Optional state for incremental sync
+            message_types: Only yield these message types (default: all).
+                Other lines are dropped before they are parsed.
 
         Yields:
             AirbyteMessage objects as they arrive
         """
-        async for msg in self._execute_streaming(
+        # aclosing() stops the connector as soon as the caller stops iterating
+        async with aclosing(self._execute_streaming(
+            image,
+            AirbyteCommand.READ,
+            config=config,
+            catalog=catalog,
+            state=state,
+            message_types=message_types,
+        )) as messages:
+            async for msg in messages:
+                yield msg
+
+    async def read_records_raw(
+        self,
+        image: str,
+        config: dict[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: dict[str, Any] | None = None,
+        on_state: Callable[[AirbyteStateMessage], None] | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any], int]]:
+        """
+        Stream records as plain (stream, data, emitted_at) tuples.
+
+        Skips building AirbyteMessage/AirbyteRecordMessage objects for every
+        record, for consumers that only need the data. STATE messages are
+        validated and passed to on_state in output order, i.e. after all
+        records they checkpoint have been yielded. Other messages are
+        dropped.
+
+        Args:
+            image: Docker image name
+            config: Connector configuration
+            catalog: Configured catalog
+            state: Optional state for incremental sync
+            on_state: Optional callback for STATE messages
+
+        Yields:
+            (stream name, record data, emitted_at) tuples
+        """
+        async with aclosing(self._execute_streaming(
             image,
             AirbyteCommand.READ,
             config=config,
             catalog=catalog,
             state=state,
-        ):
-            yield msg
+            parse_line=_parse_record_line,
+        )) as items:
+            async for item in items:
+                if isinstance(item, AirbyteStateMessage):
+                    if on_state is not None:
+                        on_state(item)
+                else:
+                    yield item
 
     async def _execute(
         self,
@@ -265,6 +403,7 @@ class AirbyteDockerExecutor:
         config: dict[str, Any] | None = None,
         catalog: ConfiguredAirbyteCatalog | None = None,
         state: dict[str, Any] | None = None,
+        reuse_container: bool = True,
     ) -> ExecutionResult:
         """
         Execute a connector command.
@@ -275,80 +414,101 @@ class AirbyteDockerExecutor:
             config: Connector configuration
             catalog: Configured catalog (for READ)
             state: State for incremental sync (for READ)
+            reuse_container: Allow running in a warm container (when enabled)
 
         Returns:
             ExecutionResult with messages and status
         """
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
+        temp_files: dict[str, str] = {}
+        warm: _WarmContainer | None = None
+        warm_gone = False
+        capture_file: IO[bytes] | None = None
 
         try:
-            # Prepare temp files for config/catalog/state
-            temp_files = await self._prepare_temp_files(config, catalog, state)
-
-            # Build docker command
-            docker_cmd = self._build_docker_command(
-                image, command, temp_files
-            )
+            # Prepare temp files for config/catalog/state (SPEC needs none)
+            if config or catalog or state:
+                temp_files = await self._prepare_temp_files(config, catalog, state)
+
+            # Build docker command, reusing a warm container when enabled
+            if reuse_container and self._should_reuse_container(command):
+                warm = await self._acquire_warm_container(image)
+
+            if warm is not None:
+                docker_cmd = self._build_exec_command(warm, command, temp_files)
+            else:
+                docker_cmd = self._build_docker_command(
+                    image, command, temp_files
+                )
 
             logger.info(f"Executing: {command.value} on {image}")
             logger.debug(f"Docker command: {' '.join(docker_cmd)}")
 
+            if self.config.stdout_capture == "file":
+                capture_file = tempfile.TemporaryFile(dir=self.config.working_dir)
+
             # Execute docker command
-            process = await asyncio.create_subprocess_exec(
+            process = await self._spawn(
                 *docker_cmd,
-                stdout=asyncio.subprocess.PIPE,
+                stdout=capture_file or asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LINE_LIMIT,
             )
 
+            if capture_file is not None:
+                collector = self._collect_from_file(process, capture_file)
+            else:
+                _enlarge_stdout_pipe(process)
+                collector = self._collect_streaming(process)
+
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                messages, stderr_text = await asyncio.wait_for(
+                    collector,
                     timeout=self.config.timeout_seconds,
                 )
             except asyncio.TimeoutError:
                 process.kill()
                 await process.wait()
+                if warm is not None:
+                    # Killing docker exec leaves the connector running in
+                    # the container, so it must not go back into the pool
+                    await self._evict_warm_container(image, warm)
                 return ExecutionResult(
                     success=False,
                     command=command,
                     error=f"Execution timed out after {self.config.timeout_seconds}s",
+                    duration_seconds=time.monotonic() - start_time,
                     exit_code=-1,
                 )
 
-            # Parse output
-            output = stdout.decode("utf-8", errors="replace")
-            messages = parse_messages_from_output(output)
-
-            # Count records
-            records = filter_records(messages)
-            records_count = len(records)
-
-            # Check for errors
-            errors = get_errors(messages)
-            error_msg = errors[0].message if errors else None
-
-            # Calculate duration
-            duration = (datetime.utcnow() - start_time).total_seconds()
-
-            success = process.returncode == 0 and not errors
-
-            if not success and not error_msg:
-                stderr_text = stderr.decode("utf-8", errors="replace")
-                error_msg = stderr_text[:1000] if stderr_text else f"Exit code: {process.returncode}"
-
-            return ExecutionResult(
-                success=success,
+            result = ExecutionResult(
+                success=process.returncode == 0,
                 command=command,
                 messages=messages,
-                records_count=records_count,
-                duration_seconds=duration,
-                error=error_msg,
+                duration_seconds=time.monotonic() - start_time,
                 exit_code=process.returncode or 0,
             )
+            result.records_count = len(result.records)
+
+            # Check for errors
+            if result.errors:
+                result.success = False
+                result.error = result.errors[0].message
+            elif not result.success:
+                result.error = stderr_text[:1000] if stderr_text else f"Exit code: {process.returncode}"
+
+            if warm is not None and process.returncode != 0:
+                await self._evict_warm_container(image, warm)
+                # No protocol output at all means the exec itself failed
+                # (container stopped or removed), not the connector
+                warm_gone = not messages
+
+            if not warm_gone:
+                return result
 
         except Exception as e:
             logger.error(f"Execution error: {e}", exc_info=True)
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             return ExecutionResult(
                 success=False,
                 command=command,
@@ -358,9 +518,102 @@ class AirbyteDockerExecutor:
             )
 
         finally:
+            if warm is not None:
+                warm.last_used = time.monotonic()
+                warm.lock.release()
+
+            if capture_file is not None:
+                capture_file.close()
+
             # Cleanup temp files
             await self._cleanup_temp_files(temp_files)
 
+        logger.warning(f"Warm container for {image} is gone, retrying with docker run")
+        return await self._execute(
+            image, command, config, catalog, state, reuse_container=False
+        )
+
+    async def _spawn(self, *args: str, **kwargs: Any) -> asyncio.subprocess.Process:
+        """
+        Start a docker CLI process with the executor's environment.
+
+        Uses asyncio's subprocess support directly: on Linux it already
+        spawns through subprocess.Popen (vfork) and reads pipes via epoll,
+        and the spawn cost is dwarfed by docker CLI startup.
+        """
+        return await asyncio.create_subprocess_exec(*args, env=self._env, **kwargs)
+
+    async def _collect_streaming(
+        self,
+        process: asyncio.subprocess.Process,
+    ) -> tuple[list[AirbyteMessage], str]:
+        """
+        Parse connector stdout as it is produced.
+
+        Stderr is drained concurrently so a chatty connector cannot block
+        on a full pipe.
+
+        Returns:
+            Tuple of (parsed messages, captured stderr text)
+        """
+        stderr_lines: list[bytes] = []
+
+        async def read_stderr():
+            """Read stderr in background."""
+            while True:
+                line = await process.stderr.readline()
+                if not line:
+                    break
+                stderr_lines.append(line)
+
+        stderr_task = asyncio.create_task(read_stderr())
+        messages: list[AirbyteMessage] = []
+
+        try:
+            append = messages.append
+            validate = AirbyteMessage.model_validate_json
+
+            async for lines in _read_line_batches(process.stdout):
+                for line in lines:
+                    # Surrounding whitespace is accepted by the JSON parser,
+                    # so lines are not stripped into a copy
+                    if not line or line.isspace():
+                        continue
+
+                    try:
+                        append(validate(line))
+                    except ValueError as e:
+                        # Log but don't fail on unparseable lines
+                        logger.warning(f"Skipping unparseable line: {e}")
+
+            await stderr_task
+            await process.wait()
+        finally:
+            stderr_task.cancel()
+
+        return messages, b"".join(stderr_lines).decode("utf-8", errors="replace")
+
+    async def _collect_from_file(
+        self,
+        process: asyncio.subprocess.Process,
+        capture_file: IO[bytes],
+    ) -> tuple[list[AirbyteMessage], str]:
+        """
+        Wait for a connector whose stdout goes to a file, then parse the file.
+
+        The kernel writes connector output straight to the file, so nothing
+        is copied through Python until parsing, which reads the file through
+        a memory map in a worker thread.
+
+        Returns:
+            Tuple of (parsed messages, captured stderr text)
+        """
+        stderr = await process.stderr.read()
+        await process.wait()
+
+        messages = await asyncio.to_thread(_parse_capture_file, capture_file)
+        return messages, stderr.decode("utf-8", errors="replace")
+
     async def _execute_streaming(
         self,
         image: str,
@@ -368,12 +621,22 @@ class AirbyteDockerExecutor:
         config: dict[str, Any] | None = None,
         catalog: ConfiguredAirbyteCatalog | None = None,
         state: dict[str, Any] | None = None,
-    ) -> AsyncIterator[AirbyteMessage]:
+        message_types: frozenset[AirbyteMessageType] | None = None,
+        parse_line: Callable[[bytes], Any] | None = None,
+    ) -> AsyncIterator[Any]:
         """
         Execute command and stream output line by line.
 
         Useful for large datasets where buffering all output is impractical.
+        When message_types is given, other messages are skipped, using the
+        raw line's leading "type" key to avoid parsing them at all.
+
+        parse_line overrides how each stdout line is decoded; it returns the
+        item to yield, or None to skip the line.
         """
+        if parse_line is None:
+            parse_line = partial(_parse_message_line, message_types=message_types)
+
         temp_files = await self._prepare_temp_files(config, catalog, state)
 
         try:
@@ -381,11 +644,13 @@ class AirbyteDockerExecutor:
 
             logger.info(f"Streaming: {command.value} on {image}")
 
-            process = await asyncio.create_subprocess_exec(
+            process = await self._spawn(
                 *docker_cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LINE_LIMIT,
             )
+            _enlarge_stdout_pipe(process)
 
             async def read_stderr():
                 """Read stderr in background."""
@@ -395,27 +660,58 @@ class AirbyteDockerExecutor:
                         break
                     logger.warning(f"Connector stderr: {line.decode().strip()}")
 
-            # Start stderr reader
-            stderr_task = asyncio.create_task(read_stderr())
-
-            # Stream stdout
-            while True:
-                line = await process.stdout.readline()
-                if not line:
-                    break
-
-                line_str = line.decode("utf-8", errors="replace").strip()
-                if not line_str:
-                    continue
+            # Parsed messages are buffered so a slow consumer does not stall
+            # the connector on a full pipe
+            queue: asyncio.Queue[Any] = asyncio.Queue(
+                maxsize=self.config.stream_buffer,
+            )
 
+            async def produce():
+                """Drain and parse stdout in background."""
+                cancelled = False
                 try:
-                    msg = AirbyteMessage.from_json(line_str)
-                    yield msg
-                except Exception as e:
-                    logger.warning(f"Failed to parse message: {e}")
+                    async for lines in _read_line_batches(process.stdout):
+                        for line in lines:
+                            if not line or line.isspace():
+                                continue
+
+                            try:
+                                item = parse_line(line)
+                            except Exception as e:
+                                logger.warning(f"Failed to parse message: {e}")
+                                continue
+
+                            if item is not None:
+                                await queue.put(item)
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+                finally:
+                    # A cancelled producer has no consumer left to drain the
+                    # queue, so waiting to enqueue the end marker would park
+                    # this task forever
+                    if not cancelled:
+                        await queue.put(None)
+
+            # Start stderr reader and stdout producer
+            stderr_task = asyncio.create_task(read_stderr())
+            producer_task = asyncio.create_task(produce())
 
-            await process.wait()
-            stderr_task.cancel()
+            try:
+                while (item := await queue.get()) is not None:
+                    yield item
+
+                # Surface any read error from the producer
+                await producer_task
+                await process.wait()
+            finally:
+                producer_task.cancel()
+                stderr_task.cancel()
+                # Let both readers finish so neither outlives the process
+                await asyncio.gather(producer_task, stderr_task, return_exceptions=True)
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
 
         finally:
             await self._cleanup_temp_files(temp_files)
@@ -426,37 +722,59 @@ class AirbyteDockerExecutor:
         catalog: ConfiguredAirbyteCatalog | None,
         state: dict[str, Any] | None,
     ) -> dict[str, str]:
-        """Prepare temporary files for Docker mounts."""
-        temp_files = {}
+        """
+        Prepare temporary files for Docker mounts.
+
+        Each call gets its own directory under the working directory, so
+        concurrent executions never overwrite each other's files. The
+        directory is returned under the "dir" key.
+        """
+        if not (config or catalog or state):
+            return {}
+
+        temp_dir = tempfile.mkdtemp(prefix="ab-", dir=self.config.working_dir)
+        # mkdtemp creates the directory 0700; connector images may run as a
+        # non-root user, which needs to reach the files by name. Listing stays
+        # owner-only, since config.json holds connector credentials
+        os.chmod(temp_dir, 0o711)
+        temp_files = {"dir": temp_dir}
 
         if config:
-            config_path = os.path.join(self.config.working_dir, "config.json")
-            with open(config_path, "w") as f:
-                json.dump(config, f)
+            config_path = os.path.join(temp_dir, "config.json")
+            with open(config_path, "wb") as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_NON_STR_KEYS))
             temp_files["config"] = config_path
 
         if catalog:
-            catalog_path = os.path.join(self.config.working_dir, "catalog.json")
-            with open(catalog_path, "w") as f:
-                json.dump(catalog.model_dump(by_alias=True), f)
+            catalog_path = os.path.join(temp_dir, "catalog.json")
+            with open(catalog_path, "wb") as f:
+                f.write(catalog.model_dump_json(by_alias=True).encode())
             temp_files["catalog"] = catalog_path
 
         if state:
-            state_path = os.path.join(self.config.working_dir, "state.json")
-            with open(state_path, "w") as f:
-                json.dump(state, f)
+            state_path = os.path.join(temp_dir, "state.json")
+            with open(state_path, "wb") as f:
+                f.write(orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS))
             temp_files["state"] = state_path
 
         return temp_files
 
     async def _cleanup_temp_files(self, temp_files: dict[str, str]):
-        """Clean up temporary files."""
-        for path in temp_files.values():
-            try:
-                if os.path.exists(path):
-                    os.remove(path)
-            except Exception as e:
-                logger.warning(f"Failed to cleanup {path}: {e}")
+        """
+        Clean up temporary files.
+
+        Removal runs in a worker thread without being awaited, so results
+        are returned without waiting on disk I/O. aclose() drains pending
+        removals.
+        """
+        if "dir" not in temp_files:
+            return
+
+        task = asyncio.create_task(
+            asyncio.to_thread(shutil.rmtree, temp_files["dir"], ignore_errors=True)
+        )
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
 
     def _build_docker_command(
         self,
@@ -468,32 +786,414 @@ class AirbyteDockerExecutor:
         cmd = [
             "docker", "run",
             "--rm",  # Remove container after exit
-            f"--network={self.config.network_mode}",
-            f"--memory={self.config.memory_limit}",
-            f"--cpus={self.config.cpu_limit}",
+            f"--pull={self._pull_flag(image)}",
         ]
 
-        # Mount working directory
-        cmd.extend(["-v", f"{self.config.working_dir}:/data"])
+        # SPEC only prints the connector's schema and needs no network
+        network = "none" if command == AirbyteCommand.SPEC else self.config.network_mode
+        cmd.extend(self._container_options(network))
+
+        # Mount this execution's file directory only when there are files to pass in
+        if temp_files:
+            cmd.extend(["-v", f"{temp_files['dir']}:/data"])
 
         # Add image and command
         cmd.append(image)
         cmd.append(command.value)
+        cmd.extend(self._command_args(command, temp_files))
+
+        return cmd
+
+    def _container_options(self, network: str) -> list[str]:
+        """Build the resource and isolation flags shared by all containers."""
+        options = [
+            f"--network={network}",
+            f"--memory={self.config.memory_limit}",
+            f"--cpus={self.config.cpu_limit}",
+        ]
+
+        if self.config.log_driver:
+            options.append(f"--log-driver={self.config.log_driver}")
+        if self.config.ipc_mode:
+            options.append(f"--ipc={self.config.ipc_mode}")
+        if self.config.pids_limit:
+            options.append(f"--pids-limit={self.config.pids_limit}")
+
+        return options
+
+    def _pull_flag(self, image: str) -> str:
+        """Map the pull policy to docker run's --pull value for an image."""
+        if self.config.pull_policy == "always":
+            return "always"
+        if self.config.pull_policy == "never" or is_image_pulled(image, self.config.docker_host):
+            return "never"
+        return "missing"
+
+    def _build_exec_command(
+        self,
+        warm: _WarmContainer,
+        command: AirbyteCommand,
+        temp_files: dict[str, str],
+    ) -> list[str]:
+        """Build a docker exec command that runs inside a warm container."""
+        cmd = ["docker", "exec", warm.container_id]
+        cmd.extend(warm.entrypoint)
+        cmd.append(command.value)
+
+        # Warm containers mount the whole working directory at /data
+        data_dir = "/data"
+        if temp_files:
+            data_dir = f"/data/{os.path.basename(temp_files['dir'])}"
+
+        cmd.extend(self._command_args(command, temp_files, data_dir))
+        return cmd
+
+    def _command_args(
+        self,
+        command: AirbyteCommand,
+        temp_files: dict[str, str],
+        data_dir: str = "/data",
+    ) -> list[str]:
+        """Build the connector file arguments for a command."""
+        args: list[str] = []
 
-        # Add file arguments based on command
         if command == AirbyteCommand.CHECK:
-            cmd.extend(["--config", "/data/config.json"])
+            args.extend(["--config", f"{data_dir}/config.json"])
 
         elif command == AirbyteCommand.DISCOVER:
-            cmd.extend(["--config", "/data/config.json"])
+            args.extend(["--config", f"{data_dir}/config.json"])
 
         elif command == AirbyteCommand.READ:
-            cmd.extend(["--config", "/data/config.json"])
-            cmd.extend(["--catalog", "/data/catalog.json"])
+            args.extend(["--config", f"{data_dir}/config.json"])
+            args.extend(["--catalog", f"{data_dir}/catalog.json"])
             if "state" in temp_files:
-                cmd.extend(["--state", "/data/state.json"])
+                args.extend(["--state", f"{data_dir}/state.json"])
 
-        return cmd
+        return args
+
+    # ========================================================================
+    # SPEC/DISCOVER Result Cache
+    # ========================================================================
+
+    async def _result_cache_key(
+        self,
+        image: str,
+        command: AirbyteCommand,
+        config: dict[str, Any] | None = None,
+    ) -> tuple[str, ...] | None:
+        """
+        Build the cache key for a deterministic command.
+
+        Keyed by image ID rather than tag, so re-pulling a moved tag
+        naturally misses the cache. Returns None when caching is disabled
+        or the image cannot be resolved.
+        """
+        if self.config.cache_ttl_seconds <= 0:
+            return None
+
+        try:
+            process = await self._spawn(
+                "docker", "image", "inspect", "--format", "{{.Id}}", image,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await process.communicate()
+            if process.returncode != 0:
+                return None
+
+            image_id = stdout.decode("utf-8", errors="replace").strip()
+            if not image_id:
+                return None
+
+            config_hash = hashlib.blake2b(
+                orjson.dumps(config or {}, option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+        except Exception as e:
+            logger.debug(f"Result cache disabled for {image}: {e}")
+            return None
+
+        return (command.value, image_id, config_hash)
+
+    def _cache_get(self, key: tuple[str, ...] | None) -> Any | None:
+        """Return a copy of a cached result if present and not expired."""
+        if key is None or key not in self._result_cache:
+            return None
+
+        value, stored_at = self._result_cache[key]
+        if time.monotonic() - stored_at > self.config.cache_ttl_seconds:
+            del self._result_cache[key]
+            return None
+
+        self._result_cache.move_to_end(key)
+        logger.debug(f"Result cache hit: {key[0]} on {key[1][:19]}")
+        return value.model_copy(deep=True)
+
+    def _cache_put(self, key: tuple[str, ...] | None, value: Any):
+        """Store a result, evicting the least recently used entry when full."""
+        if key is None:
+            return
+
+        self._result_cache[key] = (value.model_copy(deep=True), time.monotonic())
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached SPEC/DISCOVER results."""
+        self._result_cache.clear()
+
+    # ========================================================================
+    # Warm Container Pool
+    # ========================================================================
+
+    def _should_reuse_container(self, command: AirbyteCommand) -> bool:
+        """Check whether a command should run in a warm container."""
+        return self.config.container_reuse_strategy == "warm" and command in _WARM_COMMANDS
+
+    async def _acquire_warm_container(self, image: str) -> _WarmContainer | None:
+        """
+        Get (or start) the warm container for an image and lock it.
+
+        Returns None if a warm container could not be started, in which case
+        the caller falls back to a regular ``docker run``.
+        """
+        lock = self._warm_locks.setdefault(image, asyncio.Lock())
+        try:
+            async with lock:
+                warm = self._warm.get(image)
+                if warm is None:
+                    warm = await self._start_warm_container(image)
+                    self._warm[image] = warm
+                    self._ensure_reaper()
+        except Exception as e:
+            logger.warning(f"Warm container unavailable for {image}, using docker run: {e}")
+            return None
+
+        await warm.lock.acquire()
+        return warm
+
+    async def _start_warm_container(self, image: str) -> _WarmContainer:
+        """Start a container that idles until commands are exec'd into it."""
+        inspect = await self._spawn(
+            "docker", "image", "inspect", "--format", "{{json .Config.Entrypoint}}", image,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await inspect.communicate()
+        if inspect.returncode != 0:
+            raise RuntimeError(stderr.decode("utf-8", errors="replace").strip())
+
+        entrypoint = orjson.loads(stdout.strip() or b"null")
+        if not entrypoint:
+            raise RuntimeError(f"Image {image} has no entrypoint")
+
+        process = await self._spawn(
+            "docker", "run",
+            "-d",
+            "--rm",
+            *self._container_options(self.config.network_mode),
+            "-v", f"{self.config.working_dir}:/data",
+            "--entrypoint", "sleep",
+            image, "infinity",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(stderr.decode("utf-8", errors="replace").strip())
+
+        container_id = stdout.decode("utf-8").strip()
+        logger.info(f"Started warm container {container_id[:12]} for {image}")
+
+        return _WarmContainer(
+            container_id=container_id,
+            entrypoint=entrypoint,
+            last_used=time.monotonic(),
+        )
+
+    async def _evict_warm_container(self, image: str, warm: _WarmContainer):
+        """Drop a warm container after a failed exec and remove it."""
+        if self._warm.get(image) is not warm:
+            return  # Already evicted by another caller
+
+        del self._warm[image]
+        await self._remove_container(warm.container_id)
+
+    def _ensure_reaper(self):
+        """Start the idle-container reaper if it is not running."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_idle_containers())
+
+    async def _reap_idle_containers(self):
+        """Stop warm containers that have been idle longer than the TTL."""
+        # At least a second, so a zero TTL cannot spin while containers are busy
+        interval = max(1, min(_WARM_REAP_INTERVAL_SECONDS, self.config.idle_ttl_seconds))
+
+        while self._warm:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+
+            for image, warm in list(self._warm.items()):
+                if warm.lock.locked():
+                    continue
+                if now - warm.last_used >= self.config.idle_ttl_seconds:
+                    del self._warm[image]
+                    await self._remove_container(warm.container_id)
+
+    async def _remove_container(self, container_id: str):
+        """Force-remove a container, ignoring failures."""
+        try:
+            process = await self._spawn(
+                "docker", "rm", "-f", container_id,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await process.wait()
+            logger.info(f"Removed warm container {container_id[:12]}")
+        except Exception as e:
+            logger.warning(f"Failed to remove container {container_id[:12]}: {e}")
+
+    def start_prewarm(self):
+        """Pull the configured prewarm images in the background."""
+        if self.config.prewarm_images and self._prewarm_task is None:
+            self._prewarm_task = asyncio.create_task(self._prewarm())
+
+    async def _prewarm(self):
+        """Pull configured images so the first run does not wait on a pull."""
+        results = await asyncio.gather(*(
+            pull_image(image, docker_host=self.config.docker_host)
+            for image in self.config.prewarm_images
+        ))
+        logger.info(f"Prewarmed {sum(results)}/{len(results)} connector images")
+
+    async def aclose(self):
+        """Stop background tasks, remove warm containers and finish cleanups."""
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
+
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+
+        warm_containers = list(self._warm.values())
+        self._warm.clear()
+        for warm in warm_containers:
+            await self._remove_container(warm.container_id)
+
+        if self._cleanup_tasks:
+            await asyncio.gather(*self._cleanup_tasks, return_exceptions=True)
+
+
+def _enlarge_stdout_pipe(process: asyncio.subprocess.Process) -> None:
+    """
+    Grow the connector's stdout pipe buffer where the platform allows it.
+
+    A larger pipe lets a fast connector keep writing while the event loop
+    is busy parsing, and lets each read drain more data.
+    """
+    if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+
+    # Best effort: the pipe is reached through asyncio's private transport,
+    # which another event loop or Python version may shape differently, and
+    # the kernel may refuse the size. Either way the default pipe still works
+    with suppress(AttributeError, TypeError, ValueError, OSError):
+        pipe = process._transport.get_pipe_transport(1).get_extra_info("pipe")
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, _STDOUT_PIPE_SIZE)
+
+
+async def _read_line_batches(
+    reader: asyncio.StreamReader,
+    chunk_size: int = _READ_CHUNK_SIZE,
+) -> AsyncIterator[list[bytes]]:
+    """
+    Yield connector output as batches of complete lines.
+
+    Reads the pipe in large chunks and splits them in one call, which is
+    several times cheaper than awaiting readline() once per message. A line
+    spanning several chunks is joined once it completes.
+    """
+    parts: list[bytes] = []
+
+    while chunk := await reader.read(chunk_size):
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            parts.append(chunk)
+            continue
+
+        parts.append(chunk[:end])
+        yield b"".join(parts).split(b"\n")
+        parts = [chunk[end + 1:]]
+
+    tail = b"".join(parts)
+    if tail:
+        yield [tail]
+
+
+def _parse_message_line(
+    line: bytes,
+    message_types: frozenset[AirbyteMessageType] | None = None,
+) -> AirbyteMessage | None:
+    """Parse one stdout line, or return None if its type is not wanted."""
+    if message_types is not None:
+        sniffed = sniff_message_type(line)
+        if sniffed is not None and sniffed not in message_types:
+            return None
+
+    msg = AirbyteMessage.model_validate_json(line)
+    if message_types is None or msg.type in message_types:
+        return msg
+    return None
+
+
+def _parse_record_line(line: bytes) -> tuple[str, dict[str, Any], int] | AirbyteStateMessage | None:
+    """Parse one stdout line into a record tuple, a state message, or None."""
+    msg_type = sniff_message_type(line)
+    if msg_type is not None and msg_type not in _RAW_MESSAGE_TYPES:
+        return None
+
+    data = orjson.loads(line)
+    msg_type = data.get("type")
+
+    if msg_type == AirbyteMessageType.RECORD:
+        record = data["record"]
+        return (record["stream"], record["data"], record["emitted_at"])
+
+    if msg_type == AirbyteMessageType.STATE:
+        return AirbyteStateMessage.model_validate(data["state"])
+
+    return None
+
+
+def _parse_capture_file(capture_file: IO[bytes]) -> list[AirbyteMessage]:
+    """Parse newline-delimited Airbyte messages from a spooled stdout file."""
+    fd = capture_file.fileno()
+    size = os.fstat(fd).st_size
+    messages: list[AirbyteMessage] = []
+
+    if size == 0:
+        return messages
+
+    # Walk the mapping in large slices snapped back to a line break, so that
+    # splitting happens in C a chunk at a time rather than one find() per line
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = min(start + _PARSE_CHUNK_SIZE, size)
+            if end < size:
+                newline = mm.rfind(b"\n", start, end)
+                if newline == -1:
+                    # Line longer than a chunk; extend to its end
+                    newline = mm.find(b"\n", end)
+                    if newline == -1:
+                        newline = size
+                end = newline
+
+            messages.extend(parse_messages_from_output(mm[start:end]))
+            start = end + 1
+
+    return messages
 
 
 # ============================================================================
@@ -501,17 +1201,50 @@ class AirbyteDockerExecutor:
 # ============================================================================
 
 
-async def pull_image(image: str, force: bool = False) -> bool:
+def _docker_env(docker_host: str | None) -> dict[str, str] | None:
+    """
+    Build the environment for docker CLI subprocesses.
+
+    Returns None (inherit the current environment) when no explicit
+    Docker host is configured.
+    """
+    if not docker_host:
+        return None
+    return {**os.environ, "DOCKER_HOST": docker_host}
+
+
+# Images confirmed present locally, keyed by (docker_host, image)
+_pulled_images: set[tuple[str | None, str]] = set()
+
+
+def is_image_pulled(image: str, docker_host: str | None = None) -> bool:
+    """Check whether an image has already been confirmed present locally."""
+    return (docker_host, image) in _pulled_images
+
+
+async def pull_image(image: str, force: bool = False, docker_host: str | None = None) -> bool:
     """
     Pull a Docker image if not present.
 
+    Images confirmed present are remembered, so repeat calls return
+    without running docker.
+
     Args:
         image: Docker image name
         force: Force pull even if present
+        docker_host: Docker host URL (default: local socket)
 
     Returns:
         True if successful
     """
+    env = _docker_env(docker_host)
+    key = (docker_host, image)
+
+    if force:
+        _pulled_images.discard(key)
+    elif key in _pulled_images:
+        return True
+
     try:
         if not force:
             # Check if image exists
@@ -519,10 +1252,12 @@ async def pull_image(image: str, force: bool = False) -> bool:
                 "docker", "image", "inspect", image,
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.DEVNULL,
+                env=env,
             )
             await check.wait()
             if check.returncode == 0:
                 logger.debug(f"Image {image} already exists")
+                _pulled_images.add(key)
                 return True
 
         # Pull image
@@ -531,11 +1266,13 @@ async def pull_image(image: str, force: bool = False) -> bool:
             "docker", "pull", image,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            env=env,
         )
         await process.wait()
 
         if process.returncode == 0:
             logger.info(f"Successfully pulled: {image}")
+            _pulled_images.add(key)
             return True
         else:
             logger.error(f"Failed to pull {image}")
@@ -546,13 +1283,14 @@ async def pull_image(image: str, force: bool = False) -> bool:
         return False
 
 
-async def check_docker_available() -> bool:
+async def check_docker_available(docker_host: str | None = None) -> bool:
     """Check if Docker is available and running."""
     try:
         process = await asyncio.create_subprocess_exec(
             "docker", "info",
             stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.DEVNULL,
+            env=_docker_env(docker_host),
         )
         await process.wait()
         return process.returncode == 0
@@ -583,3 +1321,17 @@ def get_docker_executor(config: ExecutorConfig | None = None) -> AirbyteDockerEx
         _executor = AirbyteDockerExecutor(config)
 
     return _executor
+
+
+async def close_docker_executor() -> None:
+    """
+    Shut down the global Docker executor instance.
+
+    Removes any warm containers and resets the singleton. Call from
+    application shutdown.
+    """
+    global _executor
+
+    if _executor is not None:
+        await _executor.aclose()
+        _executor = None
@@ -17,12 +17,13 @@ Message Types:
 - CONTROL: Connector control messages
 """
 
-import json
 import logging
+import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Collection, Iterable
 
 from pydantic import BaseModel, Field
 
@@ -323,11 +324,12 @@ class AirbyteMessage(BaseModel):
     control: AirbyteControlMessage | None = None
 
     @classmethod
-    def from_json(cls, json_str: str) -> "AirbyteMessage":
-        """Parse an Airbyte message from JSON string."""
+    def from_json(cls, json_str: str | bytes) -> "AirbyteMessage":
+        """Parse an Airbyte message from JSON string or raw bytes."""
         try:
-            data = json.loads(json_str)
-            return cls.model_validate(data)
+            # Parse and validate in one pass inside pydantic-core, without
+            # materializing an intermediate dict
+            return cls.model_validate_json(json_str)
         except Exception as e:
             logger.error(f"Failed to parse Airbyte message: {e}")
             raise ValueError(f"Invalid Airbyte message: {e}")
@@ -362,12 +364,33 @@ def create_record_message(
         record=AirbyteRecordMessage(
             stream=stream,
             data=data,
-            emitted_at=int(datetime.utcnow().timestamp() * 1000),
+            emitted_at=time.time_ns() // 1_000_000,
             namespace=namespace,
         ),
     )
 
 
+def create_record_messages_batch(
+    stream: str,
+    rows: Iterable[dict[str, Any]],
+    namespace: str | None = None,
+) -> list[AirbyteMessage]:
+    """Create RECORD messages for a batch of rows sharing one emitted_at."""
+    emitted_at = time.time_ns() // 1_000_000
+    return [
+        AirbyteMessage(
+            type=AirbyteMessageType.RECORD,
+            record=AirbyteRecordMessage(
+                stream=stream,
+                data=row,
+                emitted_at=emitted_at,
+                namespace=namespace,
+            ),
+        )
+        for row in rows
+    ]
+
+
 def create_state_message(
     stream_name: str,
     stream_namespace: str | None,
@@ -432,31 +455,90 @@ def create_error_trace(
 # ============================================================================
 
 
-def parse_messages_from_output(output: str) -> list[AirbyteMessage]:
+# Connectors serialize "type" as the leading key, so the message type can be
+# read from the raw line before (or instead of) parsing it
+_MESSAGE_TYPE_PATTERN = re.compile(rb'\s*\{\s*"type"\s*:\s*"([A-Z_]+)"')
+_MESSAGE_TYPE_TEXT_PATTERN = re.compile(_MESSAGE_TYPE_PATTERN.pattern.decode())
+_MESSAGE_TYPES_BY_NAME: dict[str | bytes, AirbyteMessageType] = {
+    **{t.value: t for t in AirbyteMessageType},
+    **{t.value.encode(): t for t in AirbyteMessageType},
+}
+
+
+def sniff_message_type(line: str | bytes) -> AirbyteMessageType | None:
+    """
+    Detect the type of a raw Airbyte message line without parsing it.
+
+    Args:
+        line: One line of connector output, as text or bytes
+
+    Returns:
+        The message type, or None if "type" is not the leading key
+    """
+    if isinstance(line, bytes):
+        match = _MESSAGE_TYPE_PATTERN.match(line)
+    else:
+        match = _MESSAGE_TYPE_TEXT_PATTERN.match(line)
+    if match is None:
+        return None
+    return _MESSAGE_TYPES_BY_NAME.get(match.group(1))
+
+
+def parse_messages_from_output(
+    output: str | bytes,
+    message_types: Collection[AirbyteMessageType] | None = None,
+) -> list[AirbyteMessage]:
     """
     Parse multiple Airbyte messages from connector output.
 
-    Connectors output one JSON message per line.
+    Connectors output one JSON message per line. Raw stdout bytes can be
+    passed directly; there is no need to decode them first.
 
     Args:
-        output: Multi-line string output from connector
+        output: Multi-line output from connector, as text or bytes
+        message_types: Only return messages of these types. Lines of other
+            types are recognised from their leading "type" key and skipped
+            without being parsed.
 
     Returns:
         List of parsed AirbyteMessage objects
     """
-    messages = []
-
-    for line in output.strip().split("\n"):
-        line = line.strip()
-        if not line:
+    messages: list[AirbyteMessage] = []
+    separator = b"\n" if isinstance(output, bytes) else "\n"
+    append = messages.append
+    validate = AirbyteMessage.model_validate_json
+    skipped = 0
+    first_error: ValueError | None = None
+
+    if message_types is not None:
+        # Callers may pass any collection; test membership against a set
+        message_types = frozenset(message_types)
+
+    for line in output.split(separator):
+        # The JSON parser tolerates surrounding whitespace, so only blank
+        # lines need skipping and no stripped copy is made per line
+        if not line or line.isspace():
             continue
 
+        if message_types is not None:
+            sniffed = sniff_message_type(line)
+            if sniffed is not None and sniffed not in message_types:
+                continue
+
         try:
-            msg = AirbyteMessage.from_json(line)
-            messages.append(msg)
-        except Exception as e:
-            # Log but don't fail on unparseable lines
-            logger.warning(f"Skipping unparseable line: {e}")
+            msg = validate(line)
+        except ValueError as e:
+            # Don't fail on unparseable lines; report them once at the end
+            skipped += 1
+            if first_error is None:
+                first_error = e
+            continue
+
+        if message_types is None or msg.type in message_types:
+            append(msg)
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} unparseable line(s), first: {first_error}")
 
     return messages
 
@@ -481,41 +563,101 @@ def filter_state(messages: list[AirbyteMessage]) -> list[AirbyteStateMessage]:
 
 def get_last_state(messages: list[AirbyteMessage]) -> AirbyteStateMessage | None:
     """Get the last STATE message (final checkpoint)."""
-    states = filter_state(messages)
-    return states[-1] if states else None
+    for msg in reversed(messages):
+        if msg.type == AirbyteMessageType.STATE and msg.state:
+            return msg.state
+    return None
 
 
-def filter_logs(
-    messages: list[AirbyteMessage],
-    min_level: AirbyteLogLevel = AirbyteLogLevel.INFO,
-) -> list[AirbyteLogMessage]:
-    """Extract LOG messages at or above specified level."""
-    level_order = [
+# Severity rank of each log level, lowest first
+_LOG_LEVEL_RANK: dict[AirbyteLogLevel, int] = {
+    level: rank
+    for rank, level in enumerate([
         AirbyteLogLevel.TRACE,
         AirbyteLogLevel.DEBUG,
         AirbyteLogLevel.INFO,
         AirbyteLogLevel.WARN,
         AirbyteLogLevel.ERROR,
         AirbyteLogLevel.FATAL,
-    ]
-    min_idx = level_order.index(min_level)
+    ])
+}
+
+
+def filter_logs(
+    messages: list[AirbyteMessage],
+    min_level: AirbyteLogLevel = AirbyteLogLevel.INFO,
+) -> list[AirbyteLogMessage]:
+    """Extract LOG messages at or above specified level."""
+    # Resolve the threshold to the set of admitted levels once, so each
+    # message costs a single membership test instead of a rank comparison
+    min_rank = _LOG_LEVEL_RANK[min_level]
+    admitted = frozenset(
+        level for level, rank in _LOG_LEVEL_RANK.items() if rank >= min_rank
+    )
 
     return [
         msg.log
         for msg in messages
         if msg.type == AirbyteMessageType.LOG
         and msg.log
-        and level_order.index(msg.log.level) >= min_idx
+        and msg.log.level in admitted
     ]
 
 
 def get_errors(messages: list[AirbyteMessage]) -> list[AirbyteErrorTraceMessage]:
     """Extract error traces from messages."""
-    errors = []
+    return [
+        msg.trace.error
+        for msg in messages
+        if msg.type == AirbyteMessageType.TRACE
+        and msg.trace
+        and msg.trace.type == AirbyteTraceType.ERROR
+        and msg.trace.error
+    ]
 
-    for msg in messages:
-        if msg.type == AirbyteMessageType.TRACE and msg.trace:
-            if msg.trace.type == AirbyteTraceType.ERROR and msg.trace.error:
-                errors.append(msg.trace.error)
 
-    return errors
+@dataclass(slots=True)
+class MessageBuckets:
+    """Messages split by kind, as produced by partition_messages."""
+
+    records: list[AirbyteRecordMessage] = field(default_factory=list)
+    states: list[AirbyteStateMessage] = field(default_factory=list)
+    logs: list[AirbyteLogMessage] = field(default_factory=list)
+    errors: list[AirbyteErrorTraceMessage] = field(default_factory=list)
+
+    @property
+    def last_state(self) -> AirbyteStateMessage | None:
+        """The last STATE message (final checkpoint)."""
+        return self.states[-1] if self.states else None
+
+
+def partition_messages(messages: list[AirbyteMessage]) -> MessageBuckets:
+    """
+    Split messages into records, states, logs and error traces in one pass.
+
+    Equivalent to calling filter_records, filter_state, filter_logs (at
+    TRACE level) and get_errors, without re-scanning the list for each.
+    """
+    buckets = MessageBuckets()
+    records = buckets.records.append
+    states = buckets.states.append
+    logs = buckets.logs.append
+    errors = buckets.errors.append
+
+    for msg in messages:
+        msg_type = msg.type
+        if msg_type == AirbyteMessageType.RECORD:
+            if msg.record:
+                records(msg.record)
+        elif msg_type == AirbyteMessageType.STATE:
+            if msg.state:
+                states(msg.state)
+        elif msg_type == AirbyteMessageType.LOG:
+            if msg.log:
+                logs(msg.log)
+        elif msg_type == AirbyteMessageType.TRACE:
+            trace = msg.trace
+            if trace and trace.type == AirbyteTraceType.ERROR and trace.error:
+                errors(trace.error)
+
+    return buckets
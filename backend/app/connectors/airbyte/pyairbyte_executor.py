@@ -5,6 +5,7 @@ This module provides a unified interface to Airbyte's connector ecosystem,
 enabling access to databases, APIs, files, and more through a consistent API.
 """
 
+import importlib.util
 import json
 import logging
 from dataclasses import dataclass, field
@@ -323,12 +324,12 @@ class PyAirbyteExecutor:
 
     def _check_pyairbyte(self) -> bool:
         """Check if PyAirbyte is available."""
-        try:
-            import airbyte as ab
+        # Locate the package without importing it; airbyte is only imported
+        # where a connector is actually run
+        if importlib.util.find_spec("airbyte") is not None:
             return True
-        except ImportError:
-            logger.warning("PyAirbyte not installed. Install with: pip install airbyte")
-            return False
+        logger.warning("PyAirbyte not installed. Install with: pip install airbyte")
+        return False
 
     def list_available_connectors(
         self,
@@ -14,27 +14,31 @@ Features:
 - Credential management
 - Stream configuration
 """
+import copy
+import importlib.util
 import os
+import sys
+import time
 import logging
-from typing import Dict, List, Any, Optional, AsyncGenerator
+from typing import Dict, List, Tuple, Any, Literal, Optional, AsyncGenerator
 from dataclasses import dataclass
+from itertools import islice
 from datetime import datetime
 import json
 
 logger = logging.getLogger(__name__)
 
-# Try to import PyAirbyte
-PYAIRBYTE_AVAILABLE = False
-try:
+# Probe for PyAirbyte before importing it
+PYAIRBYTE_AVAILABLE = importlib.util.find_spec("airbyte") is not None
+if PYAIRBYTE_AVAILABLE:
     import airbyte as ab
-    PYAIRBYTE_AVAILABLE = True
     logger.info("PyAirbyte is available - real connectors enabled")
-except ImportError:
+else:
     logger.warning("PyAirbyte not installed - using mock implementation")
     logger.warning("Install with: pip install airbyte")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectorInfo:
     """Information about a connector."""
     name: str
@@ -43,7 +47,7 @@ class ConnectorInfo:
     documentation_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamInfo:
     """Information about a stream."""
     name: str
@@ -54,6 +58,140 @@ class StreamInfo:
     source_defined_primary_key: Optional[List[List[str]]] = None
 
 
+@dataclass(slots=True)
+class _SourceEntry:
+    """A configured source held by RealPyAirbyteExecutor."""
+    source: Any
+    connector_name: str
+    config: Dict[str, Any]
+    created_at: str
+    mode: Literal["real", "mock"]
+
+
+# Popular connectors offered when the PyAirbyte registry is unavailable.
+# Built once; ConnectorInfo is frozen so the instances can be shared.
+_CURATED_CONNECTORS: Tuple[ConnectorInfo, ...] = tuple(
+    ConnectorInfo(name=name, source_name=source_name)
+    for name, source_name in [
+        # Databases
+        ("postgres", "source-postgres"),
+        ("mysql", "source-mysql"),
+        ("mongodb", "source-mongodb"),
+        ("mssql", "source-mssql"),
+        ("snowflake", "source-snowflake"),
+        ("bigquery", "source-bigquery"),
+        ("redshift", "source-redshift"),
+        # CRM
+        ("salesforce", "source-salesforce"),
+        ("hubspot", "source-hubspot"),
+        ("pipedrive", "source-pipedrive"),
+        ("zoho-crm", "source-zoho-crm"),
+        # Marketing
+        ("google-ads", "source-google-ads"),
+        ("facebook-marketing", "source-facebook-marketing"),
+        ("linkedin-ads", "source-linkedin-ads"),
+        ("mailchimp", "source-mailchimp"),
+        # E-commerce
+        ("shopify", "source-shopify"),
+        ("stripe", "source-stripe"),
+        ("woocommerce", "source-woocommerce"),
+        ("amazon-seller-partner", "source-amazon-seller-partner"),
+        # Analytics
+        ("google-analytics-v4", "source-google-analytics-v4"),
+        ("mixpanel", "source-mixpanel"),
+        ("amplitude", "source-amplitude"),
+        # Project Management
+        ("jira", "source-jira"),
+        ("asana", "source-asana"),
+        ("notion", "source-notion"),
+        ("monday", "source-monday"),
+        # Communication
+        ("slack", "source-slack"),
+        ("intercom", "source-intercom"),
+        ("zendesk-support", "source-zendesk-support"),
+        # Storage
+        ("s3", "source-s3"),
+        ("gcs", "source-gcs"),
+        ("google-sheets", "source-google-sheets"),
+        # HR
+        ("greenhouse", "source-greenhouse"),
+        ("lever", "source-lever"),
+        # Finance
+        ("quickbooks", "source-quickbooks"),
+        ("xero", "source-xero"),
+        ("netsuite", "source-netsuite"),
+        # Development
+        ("github", "source-github"),
+        ("gitlab", "source-gitlab"),
+    ]
+)
+
+
+_RELATIONAL_MOCK_CATALOG: Tuple[StreamInfo, ...] = (
+    StreamInfo(
+        name="users",
+        json_schema={"type": "object", "properties": {
+            "id": {"type": "integer"},
+            "email": {"type": "string"},
+            "created_at": {"type": "string", "format": "date-time"}
+        }},
+        supported_sync_modes=["full_refresh", "incremental"],
+        source_defined_cursor=True,
+        default_cursor_field=["updated_at"]
+    ),
+    StreamInfo(
+        name="orders",
+        json_schema={"type": "object", "properties": {
+            "id": {"type": "integer"},
+            "user_id": {"type": "integer"},
+            "total": {"type": "number"},
+            "status": {"type": "string"}
+        }},
+        supported_sync_modes=["full_refresh", "incremental"],
+        source_defined_cursor=True,
+        default_cursor_field=["created_at"]
+    ),
+    StreamInfo(
+        name="products",
+        json_schema={"type": "object", "properties": {
+            "id": {"type": "integer"},
+            "name": {"type": "string"},
+            "price": {"type": "number"}
+        }},
+        supported_sync_modes=["full_refresh"]
+    ),
+)
+
+# Mock streams by connector type, keyed by the name fragment that selects them
+_MOCK_CATALOGS: Dict[str, Tuple[StreamInfo, ...]] = {
+    "postgres": _RELATIONAL_MOCK_CATALOG,
+    "mysql": _RELATIONAL_MOCK_CATALOG,
+    "salesforce": (
+        StreamInfo(name="Account", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+        StreamInfo(name="Contact", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+        StreamInfo(name="Lead", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+        StreamInfo(name="Opportunity", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+    ),
+    "stripe": (
+        StreamInfo(name="customers", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+        StreamInfo(name="charges", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+        StreamInfo(name="subscriptions", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+        StreamInfo(name="invoices", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+    ),
+}
+
+_DEFAULT_MOCK_CATALOG: Tuple[StreamInfo, ...] = (
+    StreamInfo(name="data", json_schema={}, supported_sync_modes=["full_refresh"]),
+    StreamInfo(name="events", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
+)
+
+
+# Stream names the mock data generator shapes as users or orders
+_MOCK_USER_STREAMS = frozenset({"users", "customers", "Account", "Contact"})
+_MOCK_ORDER_STREAMS = frozenset({"orders", "charges", "invoices"})
+_MOCK_ORDER_STATUSES = ("pending", "completed", "failed")
+
+
 class RealPyAirbyteExecutor:
     """
     Real PyAirbyte executor that uses the actual airbyte package.
@@ -63,7 +201,7 @@ class RealPyAirbyteExecutor:
     """
 
     def __init__(self):
-        self._sources: Dict[str, Any] = {}
+        self._sources: Dict[str, _SourceEntry] = {}
         self._cache_dir = os.environ.get(
             'PYAIRBYTE_CACHE_DIR',
             '/tmp/atlas_airbyte_cache'
@@ -101,62 +239,7 @@ class RealPyAirbyteExecutor:
 
     def _get_curated_connectors(self) -> List[ConnectorInfo]:
         """Get curated list of popular connectors."""
-        connectors = [
-            # Databases
-            ("postgres", "source-postgres"),
-            ("mysql", "source-mysql"),
-            ("mongodb", "source-mongodb"),
-            ("mssql", "source-mssql"),
-            ("snowflake", "source-snowflake"),
-            ("bigquery", "source-bigquery"),
-            ("redshift", "source-redshift"),
-            # CRM
-            ("salesforce", "source-salesforce"),
-            ("hubspot", "source-hubspot"),
-            ("pipedrive", "source-pipedrive"),
-            ("zoho-crm", "source-zoho-crm"),
-            # Marketing
-            ("google-ads", "source-google-ads"),
-            ("facebook-marketing", "source-facebook-marketing"),
-            ("linkedin-ads", "source-linkedin-ads"),
-            ("mailchimp", "source-mailchimp"),
-            # E-commerce
-            ("shopify", "source-shopify"),
-            ("stripe", "source-stripe"),
-            ("woocommerce", "source-woocommerce"),
-            ("amazon-seller-partner", "source-amazon-seller-partner"),
-            # Analytics
-            ("google-analytics-v4", "source-google-analytics-v4"),
-            ("mixpanel", "source-mixpanel"),
-            ("amplitude", "source-amplitude"),
-            # Project Management
-            ("jira", "source-jira"),
-            ("asana", "source-asana"),
-            ("notion", "source-notion"),
-            ("monday", "source-monday"),
-            # Communication
-            ("slack", "source-slack"),
-            ("intercom", "source-intercom"),
-            ("zendesk-support", "source-zendesk-support"),
-            # Storage
-            ("s3", "source-s3"),
-            ("gcs", "source-gcs"),
-            ("google-sheets", "source-google-sheets"),
-            # HR
-            ("greenhouse", "source-greenhouse"),
-            ("lever", "source-lever"),
-            # Finance
-            ("quickbooks", "source-quickbooks"),
-            ("xero", "source-xero"),
-            ("netsuite", "source-netsuite"),
-            # Development
-            ("github", "source-github"),
-            ("gitlab", "source-gitlab"),
-        ]
-        return [
-            ConnectorInfo(name=name, source_name=source_name)
-            for name, source_name in connectors
-        ]
+        return list(_CURATED_CONNECTORS)
 
     async def create_source(
         self,
@@ -176,13 +259,15 @@ class RealPyAirbyteExecutor:
             Source ID
         """
         if source_id is None:
-            source_id = f"src_{connector_name}_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+            # Nanosecond suffix keeps ids unique for sources created in the
+            # same second, and avoids a strftime per call
+            source_id = f"src_{connector_name}_{time.time_ns()}"
 
         if PYAIRBYTE_AVAILABLE:
             try:
                 # Create real PyAirbyte source
                 # Remove "source-" prefix if present
-                name = connector_name.replace("source-", "")
+                name = sys.intern(connector_name.removeprefix("source-"))
 
                 source = ab.get_source(
                     name,
@@ -190,13 +275,13 @@ class RealPyAirbyteExecutor:
                     install_if_missing=True
                 )
 
-                self._sources[source_id] = {
-                    "source": source,
-                    "connector_name": connector_name,
-                    "config": config,
-                    "created_at": datetime.utcnow().isoformat(),
-                    "mode": "real"
-                }
+                self._sources[source_id] = _SourceEntry(
+                    source=source,
+                    connector_name=connector_name,
+                    config=config,
+                    created_at=datetime.utcnow().isoformat(),
+                    mode="real"
+                )
 
                 logger.info(f"Created real PyAirbyte source: {source_id}")
                 return source_id
@@ -206,13 +291,13 @@ class RealPyAirbyteExecutor:
                 logger.info("Falling back to mock source")
 
         # Mock implementation
-        self._sources[source_id] = {
-            "source": None,
-            "connector_name": connector_name,
-            "config": config,
-            "created_at": datetime.utcnow().isoformat(),
-            "mode": "mock"
-        }
+        self._sources[source_id] = _SourceEntry(
+            source=None,
+            connector_name=connector_name,
+            config=config,
+            created_at=datetime.utcnow().isoformat(),
+            mode="mock"
+        )
 
         logger.info(f"Created mock source: {source_id}")
         return source_id
@@ -228,9 +313,9 @@ class RealPyAirbyteExecutor:
 
         source_info = self._sources[source_id]
 
-        if source_info["mode"] == "real" and PYAIRBYTE_AVAILABLE:
+        if source_info.mode == "real" and PYAIRBYTE_AVAILABLE:
             try:
-                source = source_info["source"]
+                source = source_info.source
                 catalog = source.get_available_streams()
 
                 return [
@@ -245,65 +330,20 @@ class RealPyAirbyteExecutor:
                 logger.error(f"Failed to discover catalog: {e}")
 
         # Mock catalog
-        return self._get_mock_catalog(source_info["connector_name"])
+        return self._get_mock_catalog(source_info.connector_name)
 
     def _get_mock_catalog(self, connector_name: str) -> List[StreamInfo]:
         """Get mock catalog for a connector."""
         # Common stream patterns by connector type
-        if "postgres" in connector_name or "mysql" in connector_name:
-            return [
-                StreamInfo(
-                    name="users",
-                    json_schema={"type": "object", "properties": {
-                        "id": {"type": "integer"},
-                        "email": {"type": "string"},
-                        "created_at": {"type": "string", "format": "date-time"}
-                    }},
-                    supported_sync_modes=["full_refresh", "incremental"],
-                    source_defined_cursor=True,
-                    default_cursor_field=["updated_at"]
-                ),
-                StreamInfo(
-                    name="orders",
-                    json_schema={"type": "object", "properties": {
-                        "id": {"type": "integer"},
-                        "user_id": {"type": "integer"},
-                        "total": {"type": "number"},
-                        "status": {"type": "string"}
-                    }},
-                    supported_sync_modes=["full_refresh", "incremental"],
-                    source_defined_cursor=True,
-                    default_cursor_field=["created_at"]
-                ),
-                StreamInfo(
-                    name="products",
-                    json_schema={"type": "object", "properties": {
-                        "id": {"type": "integer"},
-                        "name": {"type": "string"},
-                        "price": {"type": "number"}
-                    }},
-                    supported_sync_modes=["full_refresh"]
-                )
-            ]
-        elif "salesforce" in connector_name:
-            return [
-                StreamInfo(name="Account", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-                StreamInfo(name="Contact", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-                StreamInfo(name="Lead", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-                StreamInfo(name="Opportunity", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-            ]
-        elif "stripe" in connector_name:
-            return [
-                StreamInfo(name="customers", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-                StreamInfo(name="charges", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-                StreamInfo(name="subscriptions", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-                StreamInfo(name="invoices", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-            ]
-        else:
-            return [
-                StreamInfo(name="data", json_schema={}, supported_sync_modes=["full_refresh"]),
-                StreamInfo(name="events", json_schema={}, supported_sync_modes=["full_refresh", "incremental"]),
-            ]
+        key = connector_name.removeprefix("source-").split("-", 1)[0]
+        catalog = _MOCK_CATALOGS.get(key)
+        if catalog is None:
+            catalog = next(
+                (streams for name, streams in _MOCK_CATALOGS.items() if name in connector_name),
+                _DEFAULT_MOCK_CATALOG,
+            )
+        # The tables are shared module-level data; callers get their own copies
+        return copy.deepcopy(list(catalog))
 
     async def read_stream(
         self,
@@ -315,24 +355,48 @@ class RealPyAirbyteExecutor:
         """
         Read records from a stream.
 
-        Yields records one at a time for memory efficiency.
+        Yields records one at a time for memory efficiency. Records are
+        not copied; callers that need to mutate one should copy it first.
+        """
+        async for batch in self.read_stream_batches(
+            source_id, stream_name, sync_mode=sync_mode, cursor_value=cursor_value
+        ):
+            for record in batch:
+                yield record
+
+    async def read_stream_batches(
+        self,
+        source_id: str,
+        stream_name: str,
+        sync_mode: str = "full_refresh",
+        cursor_value: Optional[Any] = None,
+        batch_size: int = 1000
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Read records from a stream in lists of up to batch_size.
+
+        Consumers that collect records can extend with each batch rather
+        than resuming the generator once per record.
         """
         if source_id not in self._sources:
             raise ValueError(f"Source {source_id} not found")
 
         source_info = self._sources[source_id]
 
-        if source_info["mode"] == "real" and PYAIRBYTE_AVAILABLE:
+        if source_info.mode == "real" and PYAIRBYTE_AVAILABLE:
             try:
-                source = source_info["source"]
+                source = source_info.source
                 source.select_streams([stream_name])
 
                 # Read to cache and yield records
                 cache = ab.new_local_cache(cache_dir=self._cache_dir)
                 result = source.read(cache=cache)
 
-                for record in result[stream_name]:
-                    yield dict(record)
+                # PyAirbyte records are already dict subclasses; yield them
+                # as-is instead of copying every record into a new dict
+                records = iter(result[stream_name])
+                while batch := list(islice(records, batch_size)):
+                    yield batch
 
                 return
 
@@ -341,40 +405,50 @@ class RealPyAirbyteExecutor:
                 logger.info("Falling back to mock data")
 
         # Mock data generator
-        async for record in self._generate_mock_data(stream_name, 100):
-            yield record
+        records = self._build_mock_records(stream_name, 100)
+        for start in range(0, len(records), batch_size):
+            yield records[start:start + batch_size]
 
-    async def _generate_mock_data(
-        self,
-        stream_name: str,
-        count: int
-    ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Generate mock data for testing."""
+    def _build_mock_records(self, stream_name: str, count: int) -> List[Dict[str, Any]]:
+        """Build a batch of mock records, sharing one timestamp across the batch."""
         import random
 
-        for i in range(count):
-            if stream_name in ["users", "customers", "Account", "Contact"]:
-                yield {
-                    "id": i + 1,
-                    "email": f"user{i+1}@example.com",
-                    "name": f"User {i+1}",
-                    "created_at": datetime.utcnow().isoformat(),
-                    "updated_at": datetime.utcnow().isoformat()
+        now = datetime.utcnow().isoformat()
+        ids = range(1, count + 1)
+
+        if stream_name in _MOCK_USER_STREAMS:
+            return [
+                {
+                    "id": i,
+                    "email": f"user{i}@example.com",
+                    "name": f"User {i}",
+                    "created_at": now,
+                    "updated_at": now
                 }
-            elif stream_name in ["orders", "charges", "invoices"]:
-                yield {
-                    "id": i + 1,
+                for i in ids
+            ]
+
+        if stream_name in _MOCK_ORDER_STREAMS:
+            statuses = random.choices(_MOCK_ORDER_STATUSES, k=count)
+            return [
+                {
+                    "id": i,
                     "user_id": random.randint(1, 100),
                     "amount": round(random.uniform(10, 1000), 2),
-                    "status": random.choice(["pending", "completed", "failed"]),
-                    "created_at": datetime.utcnow().isoformat()
-                }
-            else:
-                yield {
-                    "id": i + 1,
-                    "data": f"Record {i+1}",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "status": status,
+                    "created_at": now
                 }
+                for i, status in zip(ids, statuses)
+            ]
+
+        return [
+            {
+                "id": i,
+                "data": f"Record {i}",
+                "timestamp": now
+            }
+            for i in ids
+        ]
 
     async def read_all(
         self,
@@ -399,8 +473,8 @@ class RealPyAirbyteExecutor:
         results = {}
         for stream in streams:
             records = []
-            async for record in self.read_stream(source_id, stream):
-                records.append(record)
+            async for batch in self.read_stream_batches(source_id, stream):
+                records.extend(batch)
             results[stream] = records
 
         return results
@@ -419,9 +493,9 @@ class RealPyAirbyteExecutor:
 
         source_info = self._sources[source_id]
 
-        if source_info["mode"] == "real" and PYAIRBYTE_AVAILABLE:
+        if source_info.mode == "real" and PYAIRBYTE_AVAILABLE:
             try:
-                source = source_info["source"]
+                source = source_info.source
                 source.check()
                 return {
                     "status": "succeeded",
@@ -453,9 +527,9 @@ class RealPyAirbyteExecutor:
         return [
             {
                 "source_id": source_id,
-                "connector_name": info["connector_name"],
-                "created_at": info["created_at"],
-                "mode": info["mode"]
+                "connector_name": info.connector_name,
+                "created_at": info.created_at,
+                "mode": info.mode
             }
             for source_id, info in self._sources.items()
         ]
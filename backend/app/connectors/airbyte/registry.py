@@ -23,8 +23,13 @@ Usage:
 """
 
 import logging
+import sys
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -47,8 +52,32 @@ class ConnectorCategory(str, Enum):
     STORAGE = "storage"
     OTHER = "other"
 
+    @classmethod
+    @lru_cache(maxsize=64)
+    def from_str(cls, value: str) -> "ConnectorCategory":
+        """
+        Resolve a category from its value or member name, ignoring case.
 
-@dataclass
+        Results are memoized; callers pass the same few strings repeatedly.
+
+        Raises:
+            ValueError: If no category matches
+        """
+        try:
+            return _CATEGORIES_BY_KEY[value.lower()]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+# Both "crm" (value) and "CRM" (name) resolve with one dict lookup
+_CATEGORIES_BY_KEY: dict[str, ConnectorCategory] = {
+    key: category
+    for category in ConnectorCategory
+    for key in (category.value, category.name.lower())
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ConnectorInfo:
     """Information about an Airbyte connector."""
 
@@ -61,960 +90,456 @@ class ConnectorInfo:
     supports_normalization: bool = False
 
 
+_DOCS_BASE_URL = "https://docs.airbyte.com/integrations/sources/"
+
+
+def _ci(
+    name: str,
+    display_name: str,
+    category: ConnectorCategory,
+    *,
+    docs: bool = False,
+    incremental: bool = True,
+) -> ConnectorInfo:
+    """Build a registry entry, deriving the image and docs URL from its name."""
+    # Names and images are compared and used as keys on lookup paths;
+    # interning lets those comparisons short-circuit on identity
+    return ConnectorInfo(
+        name=sys.intern(name),
+        display_name=display_name,
+        category=category,
+        docker_image=sys.intern(f"airbyte/{name}:latest"),
+        documentation_url=f"{_DOCS_BASE_URL}{name.removeprefix('source-')}" if docs else None,
+        supports_incremental=incremental,
+    )
+
+
 # =============================================================================
 # Connector Registry (100+ Connectors)
 # =============================================================================
 
-AIRBYTE_CONNECTORS: dict[str, ConnectorInfo] = {
+_CONNECTORS: dict[str, ConnectorInfo] = {
     # =========================================================================
     # DATABASE CONNECTORS (20+)
     # =========================================================================
-    "source-postgres": ConnectorInfo(
-        name="source-postgres",
-        display_name="PostgreSQL",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-postgres:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/postgres",
-        supports_incremental=True,
-    ),
-    "source-mysql": ConnectorInfo(
-        name="source-mysql",
-        display_name="MySQL",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-mysql:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/mysql",
-        supports_incremental=True,
-    ),
-    "source-mssql": ConnectorInfo(
-        name="source-mssql",
-        display_name="Microsoft SQL Server",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-mssql:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/mssql",
-        supports_incremental=True,
-    ),
-    "source-mongodb-v2": ConnectorInfo(
-        name="source-mongodb-v2",
-        display_name="MongoDB",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-mongodb-v2:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/mongodb-v2",
-        supports_incremental=True,
-    ),
-    "source-oracle": ConnectorInfo(
-        name="source-oracle",
-        display_name="Oracle Database",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-oracle:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/oracle",
-        supports_incremental=True,
-    ),
-    "source-cockroachdb": ConnectorInfo(
-        name="source-cockroachdb",
-        display_name="CockroachDB",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-cockroachdb:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/cockroachdb",
-        supports_incremental=True,
-    ),
-    "source-clickhouse": ConnectorInfo(
-        name="source-clickhouse",
-        display_name="ClickHouse",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-clickhouse:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/clickhouse",
-        supports_incremental=True,
-    ),
-    "source-redshift": ConnectorInfo(
-        name="source-redshift",
-        display_name="Amazon Redshift",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-redshift:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/redshift",
-        supports_incremental=True,
-    ),
-    "source-bigquery": ConnectorInfo(
-        name="source-bigquery",
-        display_name="Google BigQuery",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-bigquery:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/bigquery",
-        supports_incremental=True,
-    ),
-    "source-snowflake": ConnectorInfo(
-        name="source-snowflake",
-        display_name="Snowflake",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-snowflake:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/snowflake",
-        supports_incremental=True,
-    ),
-    "source-mariadb-columnstore": ConnectorInfo(
-        name="source-mariadb-columnstore",
-        display_name="MariaDB ColumnStore",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-mariadb-columnstore:latest",
-        supports_incremental=True,
-    ),
-    "source-tidb": ConnectorInfo(
-        name="source-tidb",
-        display_name="TiDB",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-tidb:latest",
-        supports_incremental=True,
-    ),
-    "source-db2": ConnectorInfo(
-        name="source-db2",
-        display_name="IBM DB2",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-db2:latest",
-        supports_incremental=True,
-    ),
-    "source-elasticsearch": ConnectorInfo(
-        name="source-elasticsearch",
-        display_name="Elasticsearch",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-elasticsearch:latest",
-        supports_incremental=False,
-    ),
-    "source-dynamodb": ConnectorInfo(
-        name="source-dynamodb",
-        display_name="Amazon DynamoDB",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-dynamodb:latest",
-        supports_incremental=True,
-    ),
-    "source-firebase-realtime-database": ConnectorInfo(
-        name="source-firebase-realtime-database",
-        display_name="Firebase Realtime Database",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-firebase-realtime-database:latest",
-        supports_incremental=False,
-    ),
-    "source-couchbase": ConnectorInfo(
-        name="source-couchbase",
-        display_name="Couchbase",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-couchbase:latest",
-        supports_incremental=True,
-    ),
-    "source-neo4j": ConnectorInfo(
-        name="source-neo4j",
-        display_name="Neo4j",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-neo4j:latest",
-        supports_incremental=False,
-    ),
-    "source-timescaledb": ConnectorInfo(
-        name="source-timescaledb",
-        display_name="TimescaleDB",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-timescaledb:latest",
-        supports_incremental=True,
-    ),
-    "source-yugabytedb": ConnectorInfo(
-        name="source-yugabytedb",
-        display_name="YugabyteDB",
-        category=ConnectorCategory.DATABASE,
-        docker_image="airbyte/source-yugabytedb:latest",
-        supports_incremental=True,
-    ),
+    "source-postgres": _ci("source-postgres", "PostgreSQL", ConnectorCategory.DATABASE, docs=True),
+    "source-mysql": _ci("source-mysql", "MySQL", ConnectorCategory.DATABASE, docs=True),
+    "source-mssql": _ci(
+        "source-mssql",
+        "Microsoft SQL Server",
+        ConnectorCategory.DATABASE,
+        docs=True,
+    ),
+    "source-mongodb-v2": _ci("source-mongodb-v2", "MongoDB", ConnectorCategory.DATABASE, docs=True),
+    "source-oracle": _ci("source-oracle", "Oracle Database", ConnectorCategory.DATABASE, docs=True),
+    "source-cockroachdb": _ci(
+        "source-cockroachdb",
+        "CockroachDB",
+        ConnectorCategory.DATABASE,
+        docs=True,
+    ),
+    "source-clickhouse": _ci(
+        "source-clickhouse",
+        "ClickHouse",
+        ConnectorCategory.DATABASE,
+        docs=True,
+    ),
+    "source-redshift": _ci(
+        "source-redshift",
+        "Amazon Redshift",
+        ConnectorCategory.DATABASE,
+        docs=True,
+    ),
+    "source-bigquery": _ci(
+        "source-bigquery",
+        "Google BigQuery",
+        ConnectorCategory.DATABASE,
+        docs=True,
+    ),
+    "source-snowflake": _ci("source-snowflake", "Snowflake", ConnectorCategory.DATABASE, docs=True),
+    "source-mariadb-columnstore": _ci(
+        "source-mariadb-columnstore",
+        "MariaDB ColumnStore",
+        ConnectorCategory.DATABASE,
+    ),
+    "source-tidb": _ci("source-tidb", "TiDB", ConnectorCategory.DATABASE),
+    "source-db2": _ci("source-db2", "IBM DB2", ConnectorCategory.DATABASE),
+    "source-elasticsearch": _ci(
+        "source-elasticsearch",
+        "Elasticsearch",
+        ConnectorCategory.DATABASE,
+        incremental=False,
+    ),
+    "source-dynamodb": _ci("source-dynamodb", "Amazon DynamoDB", ConnectorCategory.DATABASE),
+    "source-firebase-realtime-database": _ci(
+        "source-firebase-realtime-database",
+        "Firebase Realtime Database",
+        ConnectorCategory.DATABASE,
+        incremental=False,
+    ),
+    "source-couchbase": _ci("source-couchbase", "Couchbase", ConnectorCategory.DATABASE),
+    "source-neo4j": _ci("source-neo4j", "Neo4j", ConnectorCategory.DATABASE, incremental=False),
+    "source-timescaledb": _ci("source-timescaledb", "TimescaleDB", ConnectorCategory.DATABASE),
+    "source-yugabytedb": _ci("source-yugabytedb", "YugabyteDB", ConnectorCategory.DATABASE),
 
     # =========================================================================
     # CRM CONNECTORS (10+)
     # =========================================================================
-    "source-salesforce": ConnectorInfo(
-        name="source-salesforce",
-        display_name="Salesforce",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-salesforce:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/salesforce",
-        supports_incremental=True,
-    ),
-    "source-hubspot": ConnectorInfo(
-        name="source-hubspot",
-        display_name="HubSpot",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-hubspot:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/hubspot",
-        supports_incremental=True,
-    ),
-    "source-pipedrive": ConnectorInfo(
-        name="source-pipedrive",
-        display_name="Pipedrive",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-pipedrive:latest",
-        supports_incremental=True,
-    ),
-    "source-zoho-crm": ConnectorInfo(
-        name="source-zoho-crm",
-        display_name="Zoho CRM",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-zoho-crm:latest",
-        supports_incremental=True,
-    ),
-    "source-freshsales": ConnectorInfo(
-        name="source-freshsales",
-        display_name="Freshsales",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-freshsales:latest",
-        supports_incremental=True,
-    ),
-    "source-close-com": ConnectorInfo(
-        name="source-close-com",
-        display_name="Close.com",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-close-com:latest",
-        supports_incremental=True,
-    ),
-    "source-intercom": ConnectorInfo(
-        name="source-intercom",
-        display_name="Intercom",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-intercom:latest",
-        supports_incremental=True,
-    ),
-    "source-zendesk-support": ConnectorInfo(
-        name="source-zendesk-support",
-        display_name="Zendesk Support",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-zendesk-support:latest",
-        supports_incremental=True,
-    ),
-    "source-zendesk-chat": ConnectorInfo(
-        name="source-zendesk-chat",
-        display_name="Zendesk Chat",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-zendesk-chat:latest",
-        supports_incremental=True,
-    ),
-    "source-drift": ConnectorInfo(
-        name="source-drift",
-        display_name="Drift",
-        category=ConnectorCategory.CRM,
-        docker_image="airbyte/source-drift:latest",
-        supports_incremental=True,
-    ),
+    "source-salesforce": _ci("source-salesforce", "Salesforce", ConnectorCategory.CRM, docs=True),
+    "source-hubspot": _ci("source-hubspot", "HubSpot", ConnectorCategory.CRM, docs=True),
+    "source-pipedrive": _ci("source-pipedrive", "Pipedrive", ConnectorCategory.CRM),
+    "source-zoho-crm": _ci("source-zoho-crm", "Zoho CRM", ConnectorCategory.CRM),
+    "source-freshsales": _ci("source-freshsales", "Freshsales", ConnectorCategory.CRM),
+    "source-close-com": _ci("source-close-com", "Close.com", ConnectorCategory.CRM),
+    "source-intercom": _ci("source-intercom", "Intercom", ConnectorCategory.CRM),
+    "source-zendesk-support": _ci(
+        "source-zendesk-support",
+        "Zendesk Support",
+        ConnectorCategory.CRM,
+    ),
+    "source-zendesk-chat": _ci("source-zendesk-chat", "Zendesk Chat", ConnectorCategory.CRM),
+    "source-drift": _ci("source-drift", "Drift", ConnectorCategory.CRM),
 
     # =========================================================================
     # MARKETING CONNECTORS (15+)
     # =========================================================================
-    "source-google-ads": ConnectorInfo(
-        name="source-google-ads",
-        display_name="Google Ads",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-google-ads:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/google-ads",
-        supports_incremental=True,
-    ),
-    "source-facebook-marketing": ConnectorInfo(
-        name="source-facebook-marketing",
-        display_name="Facebook Marketing",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-facebook-marketing:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/facebook-marketing",
-        supports_incremental=True,
-    ),
-    "source-linkedin-ads": ConnectorInfo(
-        name="source-linkedin-ads",
-        display_name="LinkedIn Ads",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-linkedin-ads:latest",
-        supports_incremental=True,
-    ),
-    "source-twitter-ads": ConnectorInfo(
-        name="source-twitter-ads",
-        display_name="Twitter Ads",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-twitter-ads:latest",
-        supports_incremental=True,
-    ),
-    "source-tiktok-marketing": ConnectorInfo(
-        name="source-tiktok-marketing",
-        display_name="TikTok Marketing",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-tiktok-marketing:latest",
-        supports_incremental=True,
-    ),
-    "source-snapchat-marketing": ConnectorInfo(
-        name="source-snapchat-marketing",
-        display_name="Snapchat Marketing",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-snapchat-marketing:latest",
-        supports_incremental=True,
-    ),
-    "source-mailchimp": ConnectorInfo(
-        name="source-mailchimp",
-        display_name="Mailchimp",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-mailchimp:latest",
-        supports_incremental=True,
-    ),
-    "source-sendgrid": ConnectorInfo(
-        name="source-sendgrid",
-        display_name="SendGrid",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-sendgrid:latest",
-        supports_incremental=True,
-    ),
-    "source-klaviyo": ConnectorInfo(
-        name="source-klaviyo",
-        display_name="Klaviyo",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-klaviyo:latest",
-        supports_incremental=True,
-    ),
-    "source-braze": ConnectorInfo(
-        name="source-braze",
-        display_name="Braze",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-braze:latest",
-        supports_incremental=True,
-    ),
-    "source-iterable": ConnectorInfo(
-        name="source-iterable",
-        display_name="Iterable",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-iterable:latest",
-        supports_incremental=True,
-    ),
-    "source-marketo": ConnectorInfo(
-        name="source-marketo",
-        display_name="Marketo",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-marketo:latest",
-        supports_incremental=True,
-    ),
-    "source-google-search-console": ConnectorInfo(
-        name="source-google-search-console",
-        display_name="Google Search Console",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-google-search-console:latest",
-        supports_incremental=True,
-    ),
-    "source-bing-ads": ConnectorInfo(
-        name="source-bing-ads",
-        display_name="Bing Ads",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-bing-ads:latest",
-        supports_incremental=True,
-    ),
-    "source-pinterest": ConnectorInfo(
-        name="source-pinterest",
-        display_name="Pinterest Ads",
-        category=ConnectorCategory.MARKETING,
-        docker_image="airbyte/source-pinterest:latest",
-        supports_incremental=True,
-    ),
+    "source-google-ads": _ci(
+        "source-google-ads",
+        "Google Ads",
+        ConnectorCategory.MARKETING,
+        docs=True,
+    ),
+    "source-facebook-marketing": _ci(
+        "source-facebook-marketing",
+        "Facebook Marketing",
+        ConnectorCategory.MARKETING,
+        docs=True,
+    ),
+    "source-linkedin-ads": _ci("source-linkedin-ads", "LinkedIn Ads", ConnectorCategory.MARKETING),
+    "source-twitter-ads": _ci("source-twitter-ads", "Twitter Ads", ConnectorCategory.MARKETING),
+    "source-tiktok-marketing": _ci(
+        "source-tiktok-marketing",
+        "TikTok Marketing",
+        ConnectorCategory.MARKETING,
+    ),
+    "source-snapchat-marketing": _ci(
+        "source-snapchat-marketing",
+        "Snapchat Marketing",
+        ConnectorCategory.MARKETING,
+    ),
+    "source-mailchimp": _ci("source-mailchimp", "Mailchimp", ConnectorCategory.MARKETING),
+    "source-sendgrid": _ci("source-sendgrid", "SendGrid", ConnectorCategory.MARKETING),
+    "source-klaviyo": _ci("source-klaviyo", "Klaviyo", ConnectorCategory.MARKETING),
+    "source-braze": _ci("source-braze", "Braze", ConnectorCategory.MARKETING),
+    "source-iterable": _ci("source-iterable", "Iterable", ConnectorCategory.MARKETING),
+    "source-marketo": _ci("source-marketo", "Marketo", ConnectorCategory.MARKETING),
+    "source-google-search-console": _ci(
+        "source-google-search-console",
+        "Google Search Console",
+        ConnectorCategory.MARKETING,
+    ),
+    "source-bing-ads": _ci("source-bing-ads", "Bing Ads", ConnectorCategory.MARKETING),
+    "source-pinterest": _ci("source-pinterest", "Pinterest Ads", ConnectorCategory.MARKETING),
 
     # =========================================================================
     # ANALYTICS CONNECTORS (10+)
     # =========================================================================
-    "source-google-analytics-v4": ConnectorInfo(
-        name="source-google-analytics-v4",
-        display_name="Google Analytics (UA)",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-google-analytics-v4:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/google-analytics-v4",
-        supports_incremental=True,
-    ),
-    "source-google-analytics-data-api": ConnectorInfo(
-        name="source-google-analytics-data-api",
-        display_name="Google Analytics 4 (GA4)",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-google-analytics-data-api:latest",
-        supports_incremental=True,
-    ),
-    "source-mixpanel": ConnectorInfo(
-        name="source-mixpanel",
-        display_name="Mixpanel",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-mixpanel:latest",
-        supports_incremental=True,
-    ),
-    "source-amplitude": ConnectorInfo(
-        name="source-amplitude",
-        display_name="Amplitude",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-amplitude:latest",
-        supports_incremental=True,
-    ),
-    "source-segment": ConnectorInfo(
-        name="source-segment",
-        display_name="Segment",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-segment:latest",
-        supports_incremental=True,
-    ),
-    "source-heap": ConnectorInfo(
-        name="source-heap",
-        display_name="Heap",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-heap:latest",
-        supports_incremental=True,
-    ),
-    "source-posthog": ConnectorInfo(
-        name="source-posthog",
-        display_name="PostHog",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-posthog:latest",
-        supports_incremental=True,
-    ),
-    "source-pendo": ConnectorInfo(
-        name="source-pendo",
-        display_name="Pendo",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-pendo:latest",
-        supports_incremental=True,
-    ),
-    "source-hotjar": ConnectorInfo(
-        name="source-hotjar",
-        display_name="Hotjar",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-hotjar:latest",
-        supports_incremental=False,
-    ),
-    "source-fullstory": ConnectorInfo(
-        name="source-fullstory",
-        display_name="FullStory",
-        category=ConnectorCategory.ANALYTICS,
-        docker_image="airbyte/source-fullstory:latest",
-        supports_incremental=True,
-    ),
+    "source-google-analytics-v4": _ci(
+        "source-google-analytics-v4",
+        "Google Analytics (UA)",
+        ConnectorCategory.ANALYTICS,
+        docs=True,
+    ),
+    "source-google-analytics-data-api": _ci(
+        "source-google-analytics-data-api",
+        "Google Analytics 4 (GA4)",
+        ConnectorCategory.ANALYTICS,
+    ),
+    "source-mixpanel": _ci("source-mixpanel", "Mixpanel", ConnectorCategory.ANALYTICS),
+    "source-amplitude": _ci("source-amplitude", "Amplitude", ConnectorCategory.ANALYTICS),
+    "source-segment": _ci("source-segment", "Segment", ConnectorCategory.ANALYTICS),
+    "source-heap": _ci("source-heap", "Heap", ConnectorCategory.ANALYTICS),
+    "source-posthog": _ci("source-posthog", "PostHog", ConnectorCategory.ANALYTICS),
+    "source-pendo": _ci("source-pendo", "Pendo", ConnectorCategory.ANALYTICS),
+    "source-hotjar": _ci("source-hotjar", "Hotjar", ConnectorCategory.ANALYTICS, incremental=False),
+    "source-fullstory": _ci("source-fullstory", "FullStory", ConnectorCategory.ANALYTICS),
 
     # =========================================================================
     # E-COMMERCE CONNECTORS (10+)
     # =========================================================================
-    "source-shopify": ConnectorInfo(
-        name="source-shopify",
-        display_name="Shopify",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-shopify:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/shopify",
-        supports_incremental=True,
-    ),
-    "source-stripe": ConnectorInfo(
-        name="source-stripe",
-        display_name="Stripe",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-stripe:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/stripe",
-        supports_incremental=True,
-    ),
-    "source-woocommerce": ConnectorInfo(
-        name="source-woocommerce",
-        display_name="WooCommerce",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-woocommerce:latest",
-        supports_incremental=True,
-    ),
-    "source-amazon-seller-partner": ConnectorInfo(
-        name="source-amazon-seller-partner",
-        display_name="Amazon Seller Partner",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-amazon-seller-partner:latest",
-        supports_incremental=True,
-    ),
-    "source-magento": ConnectorInfo(
-        name="source-magento",
-        display_name="Magento",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-magento:latest",
-        supports_incremental=True,
-    ),
-    "source-bigcommerce": ConnectorInfo(
-        name="source-bigcommerce",
-        display_name="BigCommerce",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-bigcommerce:latest",
-        supports_incremental=True,
-    ),
-    "source-square": ConnectorInfo(
-        name="source-square",
-        display_name="Square",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-square:latest",
-        supports_incremental=True,
-    ),
-    "source-paypal-transaction": ConnectorInfo(
-        name="source-paypal-transaction",
-        display_name="PayPal Transactions",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-paypal-transaction:latest",
-        supports_incremental=True,
-    ),
-    "source-recharge": ConnectorInfo(
-        name="source-recharge",
-        display_name="Recharge",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-recharge:latest",
-        supports_incremental=True,
-    ),
-    "source-chargebee": ConnectorInfo(
-        name="source-chargebee",
-        display_name="Chargebee",
-        category=ConnectorCategory.ECOMMERCE,
-        docker_image="airbyte/source-chargebee:latest",
-        supports_incremental=True,
-    ),
+    "source-shopify": _ci("source-shopify", "Shopify", ConnectorCategory.ECOMMERCE, docs=True),
+    "source-stripe": _ci("source-stripe", "Stripe", ConnectorCategory.ECOMMERCE, docs=True),
+    "source-woocommerce": _ci("source-woocommerce", "WooCommerce", ConnectorCategory.ECOMMERCE),
+    "source-amazon-seller-partner": _ci(
+        "source-amazon-seller-partner",
+        "Amazon Seller Partner",
+        ConnectorCategory.ECOMMERCE,
+    ),
+    "source-magento": _ci("source-magento", "Magento", ConnectorCategory.ECOMMERCE),
+    "source-bigcommerce": _ci("source-bigcommerce", "BigCommerce", ConnectorCategory.ECOMMERCE),
+    "source-square": _ci("source-square", "Square", ConnectorCategory.ECOMMERCE),
+    "source-paypal-transaction": _ci(
+        "source-paypal-transaction",
+        "PayPal Transactions",
+        ConnectorCategory.ECOMMERCE,
+    ),
+    "source-recharge": _ci("source-recharge", "Recharge", ConnectorCategory.ECOMMERCE),
+    "source-chargebee": _ci("source-chargebee", "Chargebee", ConnectorCategory.ECOMMERCE),
 
     # =========================================================================
     # FINANCE CONNECTORS (10+)
     # =========================================================================
-    "source-quickbooks": ConnectorInfo(
-        name="source-quickbooks",
-        display_name="QuickBooks",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-quickbooks:latest",
-        supports_incremental=True,
-    ),
-    "source-xero": ConnectorInfo(
-        name="source-xero",
-        display_name="Xero",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-xero:latest",
-        supports_incremental=True,
-    ),
-    "source-netsuite": ConnectorInfo(
-        name="source-netsuite",
-        display_name="NetSuite",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-netsuite:latest",
-        supports_incremental=True,
-    ),
-    "source-freshbooks": ConnectorInfo(
-        name="source-freshbooks",
-        display_name="FreshBooks",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-freshbooks:latest",
-        supports_incremental=True,
-    ),
-    "source-recurly": ConnectorInfo(
-        name="source-recurly",
-        display_name="Recurly",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-recurly:latest",
-        supports_incremental=True,
-    ),
-    "source-zuora": ConnectorInfo(
-        name="source-zuora",
-        display_name="Zuora",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-zuora:latest",
-        supports_incremental=True,
-    ),
-    "source-harvest": ConnectorInfo(
-        name="source-harvest",
-        display_name="Harvest",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-harvest:latest",
-        supports_incremental=True,
-    ),
-    "source-plaid": ConnectorInfo(
-        name="source-plaid",
-        display_name="Plaid",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-plaid:latest",
-        supports_incremental=False,
-    ),
-    "source-braintree": ConnectorInfo(
-        name="source-braintree",
-        display_name="Braintree",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-braintree:latest",
-        supports_incremental=True,
-    ),
-    "source-sage-intacct": ConnectorInfo(
-        name="source-sage-intacct",
-        display_name="Sage Intacct",
-        category=ConnectorCategory.FINANCE,
-        docker_image="airbyte/source-sage-intacct:latest",
-        supports_incremental=True,
-    ),
+    "source-quickbooks": _ci("source-quickbooks", "QuickBooks", ConnectorCategory.FINANCE),
+    "source-xero": _ci("source-xero", "Xero", ConnectorCategory.FINANCE),
+    "source-netsuite": _ci("source-netsuite", "NetSuite", ConnectorCategory.FINANCE),
+    "source-freshbooks": _ci("source-freshbooks", "FreshBooks", ConnectorCategory.FINANCE),
+    "source-recurly": _ci("source-recurly", "Recurly", ConnectorCategory.FINANCE),
+    "source-zuora": _ci("source-zuora", "Zuora", ConnectorCategory.FINANCE),
+    "source-harvest": _ci("source-harvest", "Harvest", ConnectorCategory.FINANCE),
+    "source-plaid": _ci("source-plaid", "Plaid", ConnectorCategory.FINANCE, incremental=False),
+    "source-braintree": _ci("source-braintree", "Braintree", ConnectorCategory.FINANCE),
+    "source-sage-intacct": _ci("source-sage-intacct", "Sage Intacct", ConnectorCategory.FINANCE),
 
     # =========================================================================
     # PRODUCTIVITY / PROJECT MANAGEMENT (10+)
     # =========================================================================
-    "source-jira": ConnectorInfo(
-        name="source-jira",
-        display_name="Jira",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-jira:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/jira",
-        supports_incremental=True,
-    ),
-    "source-asana": ConnectorInfo(
-        name="source-asana",
-        display_name="Asana",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-asana:latest",
-        supports_incremental=True,
-    ),
-    "source-trello": ConnectorInfo(
-        name="source-trello",
-        display_name="Trello",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-trello:latest",
-        supports_incremental=False,
-    ),
-    "source-monday": ConnectorInfo(
-        name="source-monday",
-        display_name="Monday.com",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-monday:latest",
-        supports_incremental=True,
-    ),
-    "source-notion": ConnectorInfo(
-        name="source-notion",
-        display_name="Notion",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-notion:latest",
-        supports_incremental=True,
-    ),
-    "source-airtable": ConnectorInfo(
-        name="source-airtable",
-        display_name="Airtable",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-airtable:latest",
-        supports_incremental=False,
-    ),
-    "source-clickup-api": ConnectorInfo(
-        name="source-clickup-api",
-        display_name="ClickUp",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-clickup-api:latest",
-        supports_incremental=True,
-    ),
-    "source-smartsheets": ConnectorInfo(
-        name="source-smartsheets",
-        display_name="Smartsheet",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-smartsheets:latest",
-        supports_incremental=False,
-    ),
-    "source-basecamp": ConnectorInfo(
-        name="source-basecamp",
-        display_name="Basecamp",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-basecamp:latest",
-        supports_incremental=False,
-    ),
-    "source-todoist": ConnectorInfo(
-        name="source-todoist",
-        display_name="Todoist",
-        category=ConnectorCategory.PRODUCTIVITY,
-        docker_image="airbyte/source-todoist:latest",
-        supports_incremental=False,
+    "source-jira": _ci("source-jira", "Jira", ConnectorCategory.PRODUCTIVITY, docs=True),
+    "source-asana": _ci("source-asana", "Asana", ConnectorCategory.PRODUCTIVITY),
+    "source-trello": _ci(
+        "source-trello",
+        "Trello",
+        ConnectorCategory.PRODUCTIVITY,
+        incremental=False,
+    ),
+    "source-monday": _ci("source-monday", "Monday.com", ConnectorCategory.PRODUCTIVITY),
+    "source-notion": _ci("source-notion", "Notion", ConnectorCategory.PRODUCTIVITY),
+    "source-airtable": _ci(
+        "source-airtable",
+        "Airtable",
+        ConnectorCategory.PRODUCTIVITY,
+        incremental=False,
+    ),
+    "source-clickup-api": _ci("source-clickup-api", "ClickUp", ConnectorCategory.PRODUCTIVITY),
+    "source-smartsheets": _ci(
+        "source-smartsheets",
+        "Smartsheet",
+        ConnectorCategory.PRODUCTIVITY,
+        incremental=False,
+    ),
+    "source-basecamp": _ci(
+        "source-basecamp",
+        "Basecamp",
+        ConnectorCategory.PRODUCTIVITY,
+        incremental=False,
+    ),
+    "source-todoist": _ci(
+        "source-todoist",
+        "Todoist",
+        ConnectorCategory.PRODUCTIVITY,
+        incremental=False,
     ),
 
     # =========================================================================
     # HR / RECRUITING (8+)
     # =========================================================================
-    "source-greenhouse": ConnectorInfo(
-        name="source-greenhouse",
-        display_name="Greenhouse",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-greenhouse:latest",
-        supports_incremental=True,
-    ),
-    "source-lever-hiring": ConnectorInfo(
-        name="source-lever-hiring",
-        display_name="Lever",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-lever-hiring:latest",
-        supports_incremental=True,
-    ),
-    "source-bamboo-hr": ConnectorInfo(
-        name="source-bamboo-hr",
-        display_name="BambooHR",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-bamboo-hr:latest",
-        supports_incremental=True,
-    ),
-    "source-workday": ConnectorInfo(
-        name="source-workday",
-        display_name="Workday",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-workday:latest",
-        supports_incremental=True,
-    ),
-    "source-personio": ConnectorInfo(
-        name="source-personio",
-        display_name="Personio",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-personio:latest",
-        supports_incremental=True,
-    ),
-    "source-recruitee": ConnectorInfo(
-        name="source-recruitee",
-        display_name="Recruitee",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-recruitee:latest",
-        supports_incremental=True,
-    ),
-    "source-gusto": ConnectorInfo(
-        name="source-gusto",
-        display_name="Gusto",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-gusto:latest",
-        supports_incremental=True,
-    ),
-    "source-namely": ConnectorInfo(
-        name="source-namely",
-        display_name="Namely",
-        category=ConnectorCategory.HR,
-        docker_image="airbyte/source-namely:latest",
-        supports_incremental=True,
-    ),
+    "source-greenhouse": _ci("source-greenhouse", "Greenhouse", ConnectorCategory.HR),
+    "source-lever-hiring": _ci("source-lever-hiring", "Lever", ConnectorCategory.HR),
+    "source-bamboo-hr": _ci("source-bamboo-hr", "BambooHR", ConnectorCategory.HR),
+    "source-workday": _ci("source-workday", "Workday", ConnectorCategory.HR),
+    "source-personio": _ci("source-personio", "Personio", ConnectorCategory.HR),
+    "source-recruitee": _ci("source-recruitee", "Recruitee", ConnectorCategory.HR),
+    "source-gusto": _ci("source-gusto", "Gusto", ConnectorCategory.HR),
+    "source-namely": _ci("source-namely", "Namely", ConnectorCategory.HR),
 
     # =========================================================================
     # COMMUNICATION (8+)
     # =========================================================================
-    "source-slack": ConnectorInfo(
-        name="source-slack",
-        display_name="Slack",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-slack:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/slack",
-        supports_incremental=True,
-    ),
-    "source-microsoft-teams": ConnectorInfo(
-        name="source-microsoft-teams",
-        display_name="Microsoft Teams",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-microsoft-teams:latest",
-        supports_incremental=True,
-    ),
-    "source-twilio": ConnectorInfo(
-        name="source-twilio",
-        display_name="Twilio",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-twilio:latest",
-        supports_incremental=True,
-    ),
-    "source-mailgun": ConnectorInfo(
-        name="source-mailgun",
-        display_name="Mailgun",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-mailgun:latest",
-        supports_incremental=True,
-    ),
-    "source-zendesk-talk": ConnectorInfo(
-        name="source-zendesk-talk",
-        display_name="Zendesk Talk",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-zendesk-talk:latest",
-        supports_incremental=True,
-    ),
-    "source-dixa": ConnectorInfo(
-        name="source-dixa",
-        display_name="Dixa",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-dixa:latest",
-        supports_incremental=True,
-    ),
-    "source-front": ConnectorInfo(
-        name="source-front",
-        display_name="Front",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-front:latest",
-        supports_incremental=True,
-    ),
-    "source-lemlist": ConnectorInfo(
-        name="source-lemlist",
-        display_name="Lemlist",
-        category=ConnectorCategory.COMMUNICATION,
-        docker_image="airbyte/source-lemlist:latest",
-        supports_incremental=False,
+    "source-slack": _ci("source-slack", "Slack", ConnectorCategory.COMMUNICATION, docs=True),
+    "source-microsoft-teams": _ci(
+        "source-microsoft-teams",
+        "Microsoft Teams",
+        ConnectorCategory.COMMUNICATION,
+    ),
+    "source-twilio": _ci("source-twilio", "Twilio", ConnectorCategory.COMMUNICATION),
+    "source-mailgun": _ci("source-mailgun", "Mailgun", ConnectorCategory.COMMUNICATION),
+    "source-zendesk-talk": _ci(
+        "source-zendesk-talk",
+        "Zendesk Talk",
+        ConnectorCategory.COMMUNICATION,
+    ),
+    "source-dixa": _ci("source-dixa", "Dixa", ConnectorCategory.COMMUNICATION),
+    "source-front": _ci("source-front", "Front", ConnectorCategory.COMMUNICATION),
+    "source-lemlist": _ci(
+        "source-lemlist",
+        "Lemlist",
+        ConnectorCategory.COMMUNICATION,
+        incremental=False,
     ),
 
     # =========================================================================
     # DEVELOPMENT / DEVOPS (10+)
     # =========================================================================
-    "source-github": ConnectorInfo(
-        name="source-github",
-        display_name="GitHub",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-github:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/github",
-        supports_incremental=True,
-    ),
-    "source-gitlab": ConnectorInfo(
-        name="source-gitlab",
-        display_name="GitLab",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-gitlab:latest",
-        supports_incremental=True,
-    ),
-    "source-bitbucket": ConnectorInfo(
-        name="source-bitbucket",
-        display_name="Bitbucket",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-bitbucket:latest",
-        supports_incremental=True,
-    ),
-    "source-datadog": ConnectorInfo(
-        name="source-datadog",
-        display_name="Datadog",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-datadog:latest",
-        supports_incremental=True,
-    ),
-    "source-pagerduty": ConnectorInfo(
-        name="source-pagerduty",
-        display_name="PagerDuty",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-pagerduty:latest",
-        supports_incremental=True,
-    ),
-    "source-sentry": ConnectorInfo(
-        name="source-sentry",
-        display_name="Sentry",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-sentry:latest",
-        supports_incremental=True,
-    ),
-    "source-sonar-cloud": ConnectorInfo(
-        name="source-sonar-cloud",
-        display_name="SonarCloud",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-sonar-cloud:latest",
-        supports_incremental=False,
-    ),
-    "source-circleci": ConnectorInfo(
-        name="source-circleci",
-        display_name="CircleCI",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-circleci:latest",
-        supports_incremental=True,
-    ),
-    "source-jenkins": ConnectorInfo(
-        name="source-jenkins",
-        display_name="Jenkins",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-jenkins:latest",
-        supports_incremental=False,
-    ),
-    "source-linear": ConnectorInfo(
-        name="source-linear",
-        display_name="Linear",
-        category=ConnectorCategory.DEVELOPMENT,
-        docker_image="airbyte/source-linear:latest",
-        supports_incremental=True,
-    ),
+    "source-github": _ci("source-github", "GitHub", ConnectorCategory.DEVELOPMENT, docs=True),
+    "source-gitlab": _ci("source-gitlab", "GitLab", ConnectorCategory.DEVELOPMENT),
+    "source-bitbucket": _ci("source-bitbucket", "Bitbucket", ConnectorCategory.DEVELOPMENT),
+    "source-datadog": _ci("source-datadog", "Datadog", ConnectorCategory.DEVELOPMENT),
+    "source-pagerduty": _ci("source-pagerduty", "PagerDuty", ConnectorCategory.DEVELOPMENT),
+    "source-sentry": _ci("source-sentry", "Sentry", ConnectorCategory.DEVELOPMENT),
+    "source-sonar-cloud": _ci(
+        "source-sonar-cloud",
+        "SonarCloud",
+        ConnectorCategory.DEVELOPMENT,
+        incremental=False,
+    ),
+    "source-circleci": _ci("source-circleci", "CircleCI", ConnectorCategory.DEVELOPMENT),
+    "source-jenkins": _ci(
+        "source-jenkins",
+        "Jenkins",
+        ConnectorCategory.DEVELOPMENT,
+        incremental=False,
+    ),
+    "source-linear": _ci("source-linear", "Linear", ConnectorCategory.DEVELOPMENT),
 
     # =========================================================================
     # FILE / STORAGE (8+)
     # =========================================================================
-    "source-s3": ConnectorInfo(
-        name="source-s3",
-        display_name="Amazon S3",
-        category=ConnectorCategory.STORAGE,
-        docker_image="airbyte/source-s3:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/s3",
-        supports_incremental=True,
-    ),
-    "source-gcs": ConnectorInfo(
-        name="source-gcs",
-        display_name="Google Cloud Storage",
-        category=ConnectorCategory.STORAGE,
-        docker_image="airbyte/source-gcs:latest",
-        supports_incremental=True,
-    ),
-    "source-azure-blob-storage": ConnectorInfo(
-        name="source-azure-blob-storage",
-        display_name="Azure Blob Storage",
-        category=ConnectorCategory.STORAGE,
-        docker_image="airbyte/source-azure-blob-storage:latest",
-        supports_incremental=True,
-    ),
-    "source-sftp": ConnectorInfo(
-        name="source-sftp",
-        display_name="SFTP",
-        category=ConnectorCategory.STORAGE,
-        docker_image="airbyte/source-sftp:latest",
-        supports_incremental=True,
-    ),
-    "source-google-drive": ConnectorInfo(
-        name="source-google-drive",
-        display_name="Google Drive",
-        category=ConnectorCategory.STORAGE,
-        docker_image="airbyte/source-google-drive:latest",
-        supports_incremental=False,
-    ),
-    "source-dropbox": ConnectorInfo(
-        name="source-dropbox",
-        display_name="Dropbox",
-        category=ConnectorCategory.STORAGE,
-        docker_image="airbyte/source-dropbox:latest",
-        supports_incremental=False,
-    ),
-    "source-onedrive": ConnectorInfo(
-        name="source-onedrive",
-        display_name="OneDrive",
-        category=ConnectorCategory.STORAGE,
-        docker_image="airbyte/source-onedrive:latest",
-        supports_incremental=False,
-    ),
-    "source-google-sheets": ConnectorInfo(
-        name="source-google-sheets",
-        display_name="Google Sheets",
-        category=ConnectorCategory.FILE,
-        docker_image="airbyte/source-google-sheets:latest",
-        documentation_url="https://docs.airbyte.com/integrations/sources/google-sheets",
-        supports_incremental=False,
+    "source-s3": _ci("source-s3", "Amazon S3", ConnectorCategory.STORAGE, docs=True),
+    "source-gcs": _ci("source-gcs", "Google Cloud Storage", ConnectorCategory.STORAGE),
+    "source-azure-blob-storage": _ci(
+        "source-azure-blob-storage",
+        "Azure Blob Storage",
+        ConnectorCategory.STORAGE,
+    ),
+    "source-sftp": _ci("source-sftp", "SFTP", ConnectorCategory.STORAGE),
+    "source-google-drive": _ci(
+        "source-google-drive",
+        "Google Drive",
+        ConnectorCategory.STORAGE,
+        incremental=False,
+    ),
+    "source-dropbox": _ci(
+        "source-dropbox",
+        "Dropbox",
+        ConnectorCategory.STORAGE,
+        incremental=False,
+    ),
+    "source-onedrive": _ci(
+        "source-onedrive",
+        "OneDrive",
+        ConnectorCategory.STORAGE,
+        incremental=False,
+    ),
+    "source-google-sheets": _ci(
+        "source-google-sheets",
+        "Google Sheets",
+        ConnectorCategory.FILE,
+        docs=True,
+        incremental=False,
     ),
 
     # =========================================================================
     # API / GENERIC (5+)
     # =========================================================================
-    "source-http-request": ConnectorInfo(
-        name="source-http-request",
-        display_name="HTTP Request",
-        category=ConnectorCategory.API,
-        docker_image="airbyte/source-http-request:latest",
-        supports_incremental=False,
-    ),
-    "source-graphql": ConnectorInfo(
-        name="source-graphql",
-        display_name="GraphQL",
-        category=ConnectorCategory.API,
-        docker_image="airbyte/source-graphql:latest",
-        supports_incremental=False,
-    ),
-    "source-faker": ConnectorInfo(
-        name="source-faker",
-        display_name="Faker (Sample Data)",
-        category=ConnectorCategory.OTHER,
-        docker_image="airbyte/source-faker:latest",
-        supports_incremental=False,
-    ),
-    "source-file": ConnectorInfo(
-        name="source-file",
-        display_name="File (CSV, JSON, etc.)",
-        category=ConnectorCategory.FILE,
-        docker_image="airbyte/source-file:latest",
-        supports_incremental=False,
-    ),
-    "source-pokeapi": ConnectorInfo(
-        name="source-pokeapi",
-        display_name="PokeAPI (Sample)",
-        category=ConnectorCategory.OTHER,
-        docker_image="airbyte/source-pokeapi:latest",
-        supports_incremental=False,
+    "source-http-request": _ci(
+        "source-http-request",
+        "HTTP Request",
+        ConnectorCategory.API,
+        incremental=False,
+    ),
+    "source-graphql": _ci("source-graphql", "GraphQL", ConnectorCategory.API, incremental=False),
+    "source-faker": _ci(
+        "source-faker",
+        "Faker (Sample Data)",
+        ConnectorCategory.OTHER,
+        incremental=False,
+    ),
+    "source-file": _ci(
+        "source-file",
+        "File (CSV, JSON, etc.)",
+        ConnectorCategory.FILE,
+        incremental=False,
+    ),
+    "source-pokeapi": _ci(
+        "source-pokeapi",
+        "PokeAPI (Sample)",
+        ConnectorCategory.OTHER,
+        incremental=False,
     ),
 }
 
 
+# Read-only view of the registry; entries are shared, never copied
+AIRBYTE_CONNECTORS: Mapping[str, ConnectorInfo] = MappingProxyType(_CONNECTORS)
+
+# All entries in registry order, for callers that iterate rather than look up
+CONNECTORS: tuple[ConnectorInfo, ...] = tuple(_CONNECTORS.values())
+
+
+# Secondary indexes, built once in a single pass over the registry
+_by_category: dict[ConnectorCategory, list[ConnectorInfo]] = defaultdict(list)
+for _connector in CONNECTORS:
+    _by_category[_connector.category].append(_connector)
+
+CONNECTORS_BY_CATEGORY: dict[ConnectorCategory, tuple[ConnectorInfo, ...]] = {
+    category: tuple(connectors) for category, connectors in _by_category.items()
+}
+INCREMENTAL_CONNECTORS: frozenset[str] = frozenset(
+    connector.name for connector in CONNECTORS if connector.supports_incremental
+)
+_CATEGORY_COUNTS: dict[str, int] = dict(
+    Counter(connector.category.value for connector in CONNECTORS)
+)
+del _by_category, _connector
+
+# The same entries ordered by display name, as list_connectors returns them
+_ALL_SORTED: tuple[ConnectorInfo, ...] = tuple(
+    sorted(CONNECTORS, key=lambda c: c.display_name)
+)
+_SORTED_BY_CATEGORY: dict[ConnectorCategory, tuple[ConnectorInfo, ...]] = {
+    category: tuple(sorted(connectors, key=lambda c: c.display_name))
+    for category, connectors in CONNECTORS_BY_CATEGORY.items()
+}
+
+# Lowercased (name, display name, connector) rows scanned by search_connectors
+_SEARCH_INDEX: tuple[tuple[str, str, ConnectorInfo], ...] = tuple(
+    (connector.name.lower(), connector.display_name.lower(), connector)
+    for connector in CONNECTORS
+)
+
+# Trigram -> positions in _SEARCH_INDEX of connectors containing it
+_SEARCH_TRIGRAMS: dict[str, set[int]] = defaultdict(set)
+for _position, (_name, _display_name, _) in enumerate(_SEARCH_INDEX):
+    for _text in (_name, _display_name):
+        for _i in range(len(_text) - 2):
+            _SEARCH_TRIGRAMS[_text[_i:_i + 3]].add(_position)
+_SEARCH_TRIGRAMS = dict(_SEARCH_TRIGRAMS)
+del _position, _name, _display_name, _text, _i
+
+# Every accepted lookup key, lowercased: display name ("postgresql"), short
+# name ("postgres") and full name ("source-postgres"). Later keys win, so a
+# connector name always takes precedence over another entry's display name.
+_CONNECTORS_BY_ANY_NAME: dict[str, ConnectorInfo] = {
+    connector.display_name.lower(): connector for connector in CONNECTORS
+}
+for _connector in CONNECTORS:
+    _CONNECTORS_BY_ANY_NAME[_connector.name.removeprefix("source-")] = _connector
+_CONNECTORS_BY_ANY_NAME.update(_CONNECTORS)
+del _connector
+
+
 # =============================================================================
 # Registry Functions
 # =============================================================================
 
 
+@lru_cache(maxsize=512)
 def get_connector_image(connector_name: str) -> str:
     """
     Get Docker image for a connector.
 
+    Results are memoized, so the fallback warning for an unknown connector
+    is only logged the first time it is resolved.
+
     Args:
         connector_name: Connector name (e.g., "source-postgres" or "postgres")
 
@@ -1024,14 +549,14 @@ def get_connector_image(connector_name: str) -> str:
     Raises:
         ValueError: If connector not found
     """
+    connector = _find_connector(connector_name)
+    if connector:
+        return connector.docker_image
+
     # Normalize name
     if not connector_name.startswith("source-"):
         connector_name = f"source-{connector_name}"
 
-    connector = AIRBYTE_CONNECTORS.get(connector_name)
-    if connector:
-        return connector.docker_image
-
     # Fallback: construct default image name
     logger.warning(
         f"Connector '{connector_name}' not in registry, using default image pattern"
@@ -1049,10 +574,18 @@ def get_connector_info(connector_name: str) -> ConnectorInfo | None:
     Returns:
         ConnectorInfo or None if not found
     """
-    if not connector_name.startswith("source-"):
-        connector_name = f"source-{connector_name}"
+    return _find_connector(connector_name)
+
 
-    return AIRBYTE_CONNECTORS.get(connector_name)
+@lru_cache(maxsize=512)
+def _find_connector(connector_name: str) -> ConnectorInfo | None:
+    """
+    Resolve a connector from its name, short name or display name.
+
+    Matching ignores case and surrounding whitespace. Results are memoized,
+    as callers tend to resolve the same few connectors repeatedly.
+    """
+    return _CONNECTORS_BY_ANY_NAME.get(connector_name.strip().lower())
 
 
 def list_connectors(
@@ -1065,16 +598,14 @@ def list_connectors(
         category: Optional category filter
 
     Returns:
-        List of ConnectorInfo objects
+        List of ConnectorInfo objects, sorted by display name
     """
-    connectors = list(AIRBYTE_CONNECTORS.values())
-
     if category:
-        if isinstance(category, str):
-            category = ConnectorCategory(category)
-        connectors = [c for c in connectors if c.category == category]
+        if not isinstance(category, ConnectorCategory):
+            category = ConnectorCategory.from_str(category)
+        return list(_SORTED_BY_CATEGORY.get(category, ()))
 
-    return sorted(connectors, key=lambda c: c.display_name)
+    return list(_ALL_SORTED)
 
 
 def list_categories() -> list[ConnectorCategory]:
@@ -1093,38 +624,53 @@ def search_connectors(query: str) -> list[ConnectorInfo]:
         List of matching ConnectorInfo objects
     """
     query = query.lower()
-    return [
-        c
-        for c in AIRBYTE_CONNECTORS.values()
-        if query in c.name.lower() or query in c.display_name.lower()
-    ]
+    rows = _SEARCH_INDEX
+
+    if len(query) >= 3:
+        postings = [_SEARCH_TRIGRAMS.get(query[i:i + 3]) for i in range(len(query) - 2)]
+        if not all(postings):
+            return []
+
+        # Only verify connectors containing every trigram of the query,
+        # unless the query is so common that a plain scan is cheaper
+        postings.sort(key=len)
+        if len(postings[0]) <= len(rows) // 2:
+            candidates = postings[0].intersection(*postings[1:])
+            rows = tuple(rows[i] for i in sorted(candidates))
+
+    return [c for name, display_name, c in rows if query in name or query in display_name]
 
 
 def get_connector_count() -> int:
     """Get total number of registered connectors."""
-    return len(AIRBYTE_CONNECTORS)
+    return len(_CONNECTORS)
 
 
 def get_category_counts() -> dict[str, int]:
     """Get connector counts by category."""
-    counts: dict[str, int] = {}
-    for connector in AIRBYTE_CONNECTORS.values():
-        cat = connector.category.value
-        counts[cat] = counts.get(cat, 0) + 1
-    return counts
+    return dict(_CATEGORY_COUNTS)
 
 
 # =============================================================================
 # Registry Summary
 # =============================================================================
 
-REGISTRY_SUMMARY = f"""
+
+@cache
+def _build_registry_summary() -> str:
+    """Render the registry summary text (built on first use, then reused)."""
+    counts = get_category_counts()
+    categories = "\n".join(
+        f"  - {cat.value}: {counts.get(cat.value, 0)}" for cat in ConnectorCategory
+    )
+
+    return f"""
 Airbyte Connector Registry
 ==========================
 Total Connectors: {get_connector_count()}
 
 Categories:
-{chr(10).join(f'  - {cat.value}: {get_category_counts().get(cat.value, 0)}' for cat in ConnectorCategory)}
+{categories}
 
 Popular Connectors:
   - Database: PostgreSQL, MySQL, MongoDB, Snowflake, BigQuery
@@ -1135,5 +681,14 @@ Popular Connectors:
   - Development: GitHub, GitLab, Jira
 """
 
+
+def __getattr__(name: str):
+    # REGISTRY_SUMMARY is only rendered when someone asks for it, rather than
+    # on every import of the registry
+    if name == "REGISTRY_SUMMARY":
+        return _build_registry_summary()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
-    print(REGISTRY_SUMMARY)
+    print(_build_registry_summary())
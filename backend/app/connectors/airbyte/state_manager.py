@@ -5,18 +5,59 @@ Manages state persistence for Airbyte connectors to enable incremental syncs.
 State is stored in PostgreSQL for production use, with in-memory caching.
 """
 
+import asyncio
+import atexit
 import asyncpg
-import json
+import contextlib
+import hashlib
 import logging
+import os
+import sys
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp, treating naive values (older state files) as UTC."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _isoformat(value: datetime) -> str:
+    """
+    Format a timestamp as naive UTC ISO text.
+
+    Serialized state and API responses keep the offset-free format they
+    used before timestamps became timezone-aware.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings that repeat across many streams (sync modes, cursor fields)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class StreamState:
     """State for a single stream within a source."""
     stream_name: str
@@ -34,7 +75,7 @@ class StreamState:
             "cursor_field": self.cursor_field,
             "cursor_value": self.cursor_value,
             "sync_mode": self.sync_mode,
-            "last_synced_at": self.last_synced_at.isoformat() if self.last_synced_at else None,
+            "last_synced_at": _isoformat(self.last_synced_at) if self.last_synced_at else None,
             "records_synced": self.records_synced,
             "metadata": self.metadata
         }
@@ -44,28 +85,28 @@ class StreamState:
         """Create from dictionary."""
         last_synced = data.get("last_synced_at")
         if last_synced and isinstance(last_synced, str):
-            last_synced = datetime.fromisoformat(last_synced)
+            last_synced = _parse_timestamp(last_synced)
 
         return cls(
             stream_name=data["stream_name"],
-            cursor_field=data.get("cursor_field"),
+            cursor_field=_intern(data.get("cursor_field")),
             cursor_value=data.get("cursor_value"),
-            sync_mode=data.get("sync_mode", "full_refresh"),
+            sync_mode=_intern(data.get("sync_mode", "full_refresh")),
             last_synced_at=last_synced,
             records_synced=data.get("records_synced", 0),
             metadata=data.get("metadata", {})
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceState:
     """Complete state for a source connector."""
     source_name: str
     source_id: str
     streams: Dict[str, StreamState] = field(default_factory=dict)
     global_state: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     version: int = 1
 
     def to_dict(self) -> Dict[str, Any]:
@@ -75,8 +116,8 @@ class SourceState:
             "source_id": self.source_id,
             "streams": {name: state.to_dict() for name, state in self.streams.items()},
             "global_state": self.global_state,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
             "version": self.version
         }
 
@@ -89,15 +130,15 @@ class SourceState:
 
         created_at = data.get("created_at")
         if created_at and isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
+            created_at = _parse_timestamp(created_at)
         else:
-            created_at = datetime.utcnow()
+            created_at = _utcnow()
 
         updated_at = data.get("updated_at")
         if updated_at and isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
+            updated_at = _parse_timestamp(updated_at)
         else:
-            updated_at = datetime.utcnow()
+            updated_at = _utcnow()
 
         return cls(
             source_name=data["source_name"],
@@ -123,14 +164,17 @@ class SourceState:
         metadata: Optional[Dict[str, Any]] = None
     ) -> StreamState:
         """Set or update state for a stream."""
-        if stream_name in self.streams:
-            state = self.streams[stream_name]
+        now = _utcnow()
+        cursor_field = _intern(cursor_field)
+        sync_mode = _intern(sync_mode)
+        state = self.streams.get(stream_name)
+        if state is not None:
             if cursor_field is not None:
                 state.cursor_field = cursor_field
             if cursor_value is not None:
                 state.cursor_value = cursor_value
             state.sync_mode = sync_mode
-            state.last_synced_at = datetime.utcnow()
+            state.last_synced_at = now
             state.records_synced += records_synced
             if metadata:
                 state.metadata.update(metadata)
@@ -140,34 +184,81 @@ class SourceState:
                 cursor_field=cursor_field,
                 cursor_value=cursor_value,
                 sync_mode=sync_mode,
-                last_synced_at=datetime.utcnow(),
+                last_synced_at=now,
                 records_synced=records_synced,
                 metadata=metadata or {}
             )
             self.streams[stream_name] = state
 
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         self.version += 1
         return state
 
 
+# Threads used to read state files concurrently at startup
+_LOAD_WORKERS = 16
+
+# Live managers, flushed once at interpreter exit without keeping them alive
+_MANAGERS: "weakref.WeakSet[StateManager]" = weakref.WeakSet()
+
+
+def _flush_managers() -> None:
+    """Persist pending updates of every live state manager."""
+    for manager in list(_MANAGERS):
+        manager.flush()
+
+
+atexit.register(_flush_managers)
+
+
+def _read_state_file(state_file: Path) -> Optional[SourceState]:
+    """Read one persisted state file, or None if it cannot be parsed."""
+    try:
+        return SourceState.from_dict(orjson.loads(state_file.read_bytes()))
+    except Exception as e:
+        logger.warning(f"Failed to load state file {state_file.name}: {e}")
+        return None
+
+
 class StateManager:
     """
     Manages state persistence for PyAirbyte connectors.
 
     Provides in-memory caching with PostgreSQL persistence for production.
     Falls back to file-based persistence if database is unavailable.
+
+    Stream updates are persisted in the background: a source touched several
+    times within ``persist_interval`` seconds is written once. Pending writes
+    are flushed on interpreter exit, or explicitly via ``flush()``.
     """
 
-    def __init__(self, database_url: Optional[str] = None, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        storage_path: Optional[Path] = None,
+        persist_interval: float = 0.5,
+    ):
         """
         Initialize state manager.
 
         Args:
             database_url: PostgreSQL connection URL (preferred)
             storage_path: Path for file-based persistence fallback (optional)
+            persist_interval: Seconds to coalesce stream updates before
+                persisting them (0 persists every update immediately)
         """
         self._states: Dict[str, SourceState] = {}
+        self._persist_interval = persist_interval
+        self._dirty: Set[str] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        # _lock guards in-memory state and is only held briefly. _io_lock
+        # orders persistence: snapshots are taken and written under it, so a
+        # newer snapshot is never overwritten by an older one. It is always
+        # acquired before _lock.
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        # Digest of the last file written per source, to skip identical rewrites
+        self._file_digests: Dict[str, bytes] = {}
         self._database_url = database_url
         self._storage_path = storage_path or Path("/tmp/atlas_airbyte_state")
         self._storage_path.mkdir(parents=True, exist_ok=True)
@@ -176,7 +267,6 @@ class StateManager:
         # Initialize database table if using database
         if self._use_database:
             try:
-                import asyncio
                 asyncio.get_event_loop().run_until_complete(self._ensure_database_table())
                 asyncio.get_event_loop().run_until_complete(self._load_persisted_states_from_db())
                 logger.info(f"State manager using PostgreSQL persistence")
@@ -187,6 +277,8 @@ class StateManager:
         else:
             self._load_persisted_states_from_files()
 
+        _MANAGERS.add(self)
+
     async def _ensure_database_table(self) -> None:
         """Ensure pipeline.connector_state table exists."""
         try:
@@ -243,7 +335,7 @@ class StateManager:
                         try:
                             state_data = row['state_data']
                             if isinstance(state_data, str):
-                                state_data = json.loads(state_data)
+                                state_data = orjson.loads(state_data)
 
                             state = SourceState.from_dict(state_data)
                             self._states[state.source_id] = state
@@ -257,22 +349,25 @@ class StateManager:
     def _load_persisted_states_from_files(self) -> None:
         """Load states from disk (fallback mode)."""
         try:
-            for state_file in self._storage_path.glob("*.json"):
-                with open(state_file, "r") as f:
-                    data = json.load(f)
-                    state = SourceState.from_dict(data)
-                    self._states[state.source_id] = state
+            # Move files from the old flat layout into their shard directories
+            for legacy_file in self._storage_path.glob("*.json"):
+                state_file = self._state_file(legacy_file.stem)
+                state_file.parent.mkdir(exist_ok=True)
+                os.replace(legacy_file, state_file)
+
+            state_files = list(self._storage_path.glob("*/*.json"))
+            # Reads are dominated by I/O latency, so overlap them across threads
+            with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as pool:
+                for state in pool.map(_read_state_file, state_files):
+                    if state is not None:
+                        self._states[state.source_id] = state
             logger.info(f"Loaded {len(self._states)} persisted states from files")
         except Exception as e:
             logger.warning(f"Failed to load persisted states from files: {e}")
 
-    async def _persist_state_to_db(self, source_id: str) -> None:
-        """Persist a single source's state to PostgreSQL."""
-        if source_id not in self._states:
-            return
-
+    async def _persist_state_to_db(self, source_id: str, data: Dict[str, Any]) -> None:
+        """Persist a snapshot of a single source's state to PostgreSQL."""
         try:
-            state = self._states[source_id]
             async with asyncpg.create_pool(self._database_url, min_size=1, max_size=3) as pool:
                 async with pool.acquire() as conn:
                     # Upsert source-level state
@@ -286,14 +381,15 @@ class StateManager:
                             updated_at = NOW(),
                             version = EXCLUDED.version
                     """,
-                        state.source_id,
-                        state.source_name,
-                        json.dumps(state.to_dict()),
-                        state.version
+                        data["source_id"],
+                        data["source_name"],
+                        orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode(),
+                        data["version"]
                     )
 
                     # Upsert each stream state
-                    for stream_name, stream_state in state.streams.items():
+                    for stream_name, stream_data in data["streams"].items():
+                        last_synced = stream_data["last_synced_at"]
                         await conn.execute("""
                             INSERT INTO pipeline.connector_state
                             (source_id, source_name, stream_name, cursor_field, cursor_value,
@@ -309,49 +405,115 @@ class StateManager:
                                 records_synced = EXCLUDED.records_synced,
                                 updated_at = NOW()
                         """,
-                            state.source_id,
-                            state.source_name,
+                            data["source_id"],
+                            data["source_name"],
                             stream_name,
-                            stream_state.cursor_field,
-                            str(stream_state.cursor_value) if stream_state.cursor_value else None,
-                            stream_state.sync_mode,
-                            json.dumps(stream_state.to_dict()),
-                            stream_state.last_synced_at,
-                            stream_state.records_synced
+                            stream_data["cursor_field"],
+                            str(stream_data["cursor_value"]) if stream_data["cursor_value"] else None,
+                            stream_data["sync_mode"],
+                            orjson.dumps(stream_data, option=orjson.OPT_NON_STR_KEYS).decode(),
+                            # TIMESTAMP column: store as naive UTC
+                            _parse_timestamp(last_synced).replace(tzinfo=None)
+                            if last_synced else None,
+                            stream_data["records_synced"]
                         )
 
                     logger.debug(f"Persisted state for {source_id} to database")
         except Exception as e:
             logger.error(f"Failed to persist state to database for {source_id}: {e}")
             # Fallback to file persistence
-            self._persist_state_to_file(source_id)
+            self._persist_state_to_file(source_id, data)
 
-    def _persist_state_to_file(self, source_id: str) -> None:
-        """Persist a single source's state to disk (fallback)."""
-        if source_id not in self._states:
-            return
+    def _state_file(self, source_id: str) -> Path:
+        """
+        Path of a source's state file.
 
+        Files are spread over up to 256 subdirectories keyed by a hash of the
+        source ID, so no single directory grows with the number of sources.
+        """
+        shard = hashlib.blake2b(source_id.encode(), digest_size=1).hexdigest()
+        return self._storage_path / shard / f"{source_id}.json"
+
+    def _persist_state_to_file(self, source_id: str, data: Dict[str, Any]) -> None:
+        """Persist a snapshot of a single source's state to disk (fallback)."""
+        tmp_path = None
         try:
-            state = self._states[source_id]
-            state_file = self._storage_path / f"{source_id}.json"
-            with open(state_file, "w") as f:
-                json.dump(state.to_dict(), f, indent=2)
+            content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            digest = hashlib.blake2b(content, digest_size=16).digest()
+            if self._file_digests.get(source_id) == digest:
+                return
+
+            # Write to a uniquely named file beside the target and swap it in,
+            # so a crash mid-write never leaves a truncated state file behind
+            state_file = self._state_file(source_id)
+            state_file.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=state_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, state_file)
+            tmp_path = None
+            self._file_digests[source_id] = digest
             logger.debug(f"Persisted state for {source_id} to file")
         except Exception as e:
             logger.error(f"Failed to persist state to file for {source_id}: {e}")
+        finally:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
 
-    def _persist_state(self, source_id: str) -> None:
-        """Persist state using configured method."""
+    def _write_state(self, source_id: str, data: Dict[str, Any]) -> None:
+        """Write a state snapshot using configured method. Caller must hold _io_lock."""
         if self._use_database:
-            # Run async persistence
-            import asyncio
+            # Run async persistence (also called from the flush timer thread)
             try:
-                asyncio.get_event_loop().run_until_complete(self._persist_state_to_db(source_id))
+                asyncio.run(self._persist_state_to_db(source_id, data))
             except Exception as e:
                 logger.warning(f"Database persistence failed, falling back to file: {e}")
-                self._persist_state_to_file(source_id)
+                self._persist_state_to_file(source_id, data)
         else:
-            self._persist_state_to_file(source_id)
+            self._persist_state_to_file(source_id, data)
+
+    def _persist_state(self, source_id: str) -> None:
+        """Persist a source's current state. Must not be called with _lock held."""
+        with self._io_lock:
+            with self._lock:
+                state = self._states.get(source_id)
+                if state is None:
+                    return
+                data = state.to_dict()
+            self._write_state(source_id, data)
+
+    def _mark_dirty(self, source_id: str) -> None:
+        """Schedule a source for persistence on the next background flush."""
+        if self._persist_interval <= 0:
+            self._persist_state(source_id)
+            return
+
+        with self._lock:
+            self._dirty.add(source_id)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._persist_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Persist every source with pending stream updates."""
+        with self._io_lock:
+            # Snapshot under the lock, then write without holding it, so
+            # stream updates are not blocked behind disk or database I/O
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                dirty, self._dirty = self._dirty, set()
+                snapshots = {
+                    source_id: state.to_dict()
+                    for source_id in dirty
+                    if (state := self._states.get(source_id)) is not None
+                }
+
+            for source_id, data in snapshots.items():
+                self._write_state(source_id, data)
 
     def get_state(self, source_id: str) -> Optional[SourceState]:
         """
@@ -394,7 +556,8 @@ class StateManager:
             for stream_name in streams:
                 state.streams[stream_name] = StreamState(stream_name=stream_name)
 
-        self._states[source_id] = state
+        with self._lock:
+            self._states[source_id] = state
         self._persist_state(source_id)
 
         logger.info(f"Created state for source {source_name} ({source_id})")
@@ -425,22 +588,48 @@ class StateManager:
         Returns:
             Updated StreamState or None if source not found
         """
+        updated = self.update_stream_states(source_id, [{
+            "stream_name": stream_name,
+            "cursor_field": cursor_field,
+            "cursor_value": cursor_value,
+            "sync_mode": sync_mode,
+            "records_synced": records_synced,
+            "metadata": metadata,
+        }])
+        return updated[0] if updated else None
+
+    def update_stream_states(
+        self,
+        source_id: str,
+        updates: List[Dict[str, Any]]
+    ) -> Optional[List[StreamState]]:
+        """
+        Update state for several streams of a source at once.
+
+        The source is looked up and scheduled for persistence once for the
+        whole batch, rather than once per stream.
+
+        Args:
+            source_id: Source identifier
+            updates: One dict per stream, holding ``stream_name`` plus any of
+                the keyword arguments accepted by ``update_stream_state``
+
+        Returns:
+            Updated StreamStates in input order, or None if source not found
+        """
         state = self._states.get(source_id)
         if not state:
             logger.warning(f"Source {source_id} not found for state update")
             return None
 
-        stream_state = state.set_stream_state(
-            stream_name=stream_name,
-            cursor_field=cursor_field,
-            cursor_value=cursor_value,
-            sync_mode=sync_mode,
-            records_synced=records_synced,
-            metadata=metadata
-        )
+        with self._lock:
+            stream_states = [
+                state.set_stream_state(**{"sync_mode": "incremental", **update})
+                for update in updates
+            ]
 
-        self._persist_state(source_id)
-        return stream_state
+        self._mark_dirty(source_id)
+        return stream_states
 
     def get_cursor_value(
         self,
@@ -458,14 +647,11 @@ class StateManager:
             Cursor value or None
         """
         state = self._states.get(source_id)
-        if not state:
-            return None
-
-        stream_state = state.get_stream_state(stream_name)
-        if not stream_state:
+        if state is None:
             return None
 
-        return stream_state.cursor_value
+        stream_state = state.streams.get(stream_name)
+        return stream_state.cursor_value if stream_state is not None else None
 
     def reset_stream_state(self, source_id: str, stream_name: str) -> bool:
         """
@@ -483,12 +669,13 @@ class StateManager:
             return False
 
         if stream_name in state.streams:
-            state.streams[stream_name] = StreamState(
-                stream_name=stream_name,
-                sync_mode="full_refresh"
-            )
-            state.updated_at = datetime.utcnow()
-            state.version += 1
+            with self._lock:
+                state.streams[stream_name] = StreamState(
+                    stream_name=stream_name,
+                    sync_mode="full_refresh"
+                )
+                state.updated_at = _utcnow()
+                state.version += 1
             self._persist_state(source_id)
             logger.info(f"Reset state for stream {stream_name} in {source_id}")
             return True
@@ -509,15 +696,16 @@ class StateManager:
         if not state:
             return False
 
-        for stream_name in list(state.streams.keys()):
-            state.streams[stream_name] = StreamState(
-                stream_name=stream_name,
-                sync_mode="full_refresh"
-            )
+        with self._lock:
+            for stream_name in list(state.streams.keys()):
+                state.streams[stream_name] = StreamState(
+                    stream_name=stream_name,
+                    sync_mode="full_refresh"
+                )
 
-        state.global_state = {}
-        state.updated_at = datetime.utcnow()
-        state.version += 1
+            state.global_state = {}
+            state.updated_at = _utcnow()
+            state.version += 1
         self._persist_state(source_id)
 
         logger.info(f"Reset all state for source {source_id}")
@@ -533,15 +721,17 @@ class StateManager:
         Returns:
             True if deleted, False if not found
         """
-        if source_id not in self._states:
-            return False
-
-        del self._states[source_id]
-
-        # Remove persisted file
-        state_file = self._storage_path / f"{source_id}.json"
-        if state_file.exists():
-            state_file.unlink()
+        with self._io_lock:
+            with self._lock:
+                if self._states.pop(source_id, None) is None:
+                    return False
+                self._dirty.discard(source_id)
+            self._file_digests.pop(source_id, None)
+
+            # Remove persisted file
+            state_file = self._state_file(source_id)
+            if state_file.exists():
+                state_file.unlink()
 
         logger.info(f"Deleted state for source {source_id}")
         return True
@@ -559,8 +749,8 @@ class StateManager:
                 "source_name": state.source_name,
                 "stream_count": len(state.streams),
                 "version": state.version,
-                "created_at": state.created_at.isoformat(),
-                "updated_at": state.updated_at.isoformat()
+                "created_at": _isoformat(state.created_at),
+                "updated_at": _isoformat(state.updated_at)
             }
             for source_id, state in self._states.items()
         ]
@@ -579,21 +769,23 @@ class StateManager:
         if not state:
             return None
 
-        total_records = sum(s.records_synced for s in state.streams.values())
-        last_sync = max(
-            (s.last_synced_at for s in state.streams.values() if s.last_synced_at),
-            default=None
-        )
-
+        # Totals and per-stream rows are gathered in a single pass
+        total_records = 0
+        last_sync = None
         streams_summary = []
         for stream_name, stream_state in state.streams.items():
+            total_records += stream_state.records_synced
+            synced_at = stream_state.last_synced_at
+            if synced_at and (last_sync is None or synced_at > last_sync):
+                last_sync = synced_at
+
             streams_summary.append({
                 "stream_name": stream_name,
                 "sync_mode": stream_state.sync_mode,
                 "cursor_field": stream_state.cursor_field,
                 "cursor_value": stream_state.cursor_value,
                 "records_synced": stream_state.records_synced,
-                "last_synced_at": stream_state.last_synced_at.isoformat() if stream_state.last_synced_at else None
+                "last_synced_at": _isoformat(synced_at) if synced_at else None
             })
 
         return {
@@ -601,7 +793,7 @@ class StateManager:
             "source_name": state.source_name,
             "total_streams": len(state.streams),
             "total_records_synced": total_records,
-            "last_sync_at": last_sync.isoformat() if last_sync else None,
+            "last_sync_at": _isoformat(last_sync) if last_sync else None,
             "version": state.version,
             "streams": streams_summary
         }
@@ -632,7 +824,8 @@ class StateManager:
             Imported SourceState
         """
         state = SourceState.from_dict(state_data)
-        self._states[state.source_id] = state
+        with self._lock:
+            self._states[state.source_id] = state
         self._persist_state(state.source_id)
         logger.info(f"Imported state for source {state.source_name} ({state.source_id})")
         return state
@@ -6,16 +6,81 @@ Provides job scheduling, execution tracking, and history for PyAirbyte connector
 
 import asyncio
 import asyncpg
+import heapq
 import logging
-import uuid
+import secrets
+import sys
+import time
+from bisect import bisect_right
+from collections import deque
+from contextlib import suppress
+from itertools import islice
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from threading import Lock
 
 logger = logging.getLogger(__name__)
 
+try:
+    from croniter import croniter
+except ImportError:
+    # Declared as a dependency; installs without it fall back to a
+    # simplified parser covering a few common expressions
+    croniter = None
+
+# Longest the tick loop sleeps before re-checking the due heap, so a wall
+# clock change cannot postpone scheduled syncs indefinitely
+_MAX_TICK_SECONDS = 60.0
+
+
+def _intern_names(names: List[str]) -> List[str]:
+    """Intern stream names, which repeat across every job of a source."""
+    return [sys.intern(name) for name in names]
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@lru_cache(maxsize=1024)
+def _next_run_for(cron_expression: str, minute: int) -> datetime:
+    """
+    Next run time for a cron expression, as seen from the start of a minute.
+
+    Cron fires on minute boundaries, so every moment within the same minute
+    has the same next run. Keying on the minute lets schedules sharing an
+    expression reuse one computation.
+    """
+    now = _EPOCH + timedelta(minutes=minute)
+
+    if croniter is not None:
+        try:
+            return croniter(cron_expression, now).get_next(datetime)
+        except ValueError as e:
+            logger.warning(f"Invalid cron expression '{cron_expression}': {e}")
+
+    # Simplified fallback when croniter is unavailable
+    parts = cron_expression.split()
+    if len(parts) >= 5:
+        minute_field = parts[0]
+        hour_field = parts[1]
+
+        if minute_field == "*" and hour_field == "*":
+            # Every minute
+            return now + timedelta(minutes=1)
+        elif minute_field.isdigit() and hour_field == "*":
+            # Every hour at minute X
+            next_run = now.replace(minute=int(minute_field))
+            return next_run if next_run > now else next_run + timedelta(hours=1)
+        elif minute_field.isdigit() and hour_field.isdigit():
+            # Daily at specific time
+            next_run = now.replace(hour=int(hour_field), minute=int(minute_field))
+            return next_run if next_run > now else next_run + timedelta(days=1)
+
+    return now + timedelta(hours=1)
+
 
 class SyncStatus(str, Enum):
     """Status of a sync job."""
@@ -32,7 +97,7 @@ class SyncMode(str, Enum):
     INCREMENTAL = "incremental"
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncJob:
     """Represents a sync job."""
     job_id: str
@@ -47,6 +112,10 @@ class SyncJob:
     records_synced: int = 0
     error_message: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Monotonic start/end readings taken by the scheduler, for durations that
+    # are immune to wall-clock adjustments
+    _started_perf: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _completed_perf: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -68,13 +137,19 @@ class SyncJob:
 
     def _get_duration(self) -> Optional[float]:
         """Get job duration in seconds."""
+        if self._started_perf is not None:
+            end_perf = self._completed_perf
+            if end_perf is None:
+                end_perf = time.perf_counter()
+            return end_perf - self._started_perf
+
         if not self.started_at:
             return None
         end = self.completed_at or datetime.utcnow()
         return (end - self.started_at).total_seconds()
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledSync:
     """Represents a scheduled recurring sync."""
     schedule_id: str
@@ -128,15 +203,34 @@ class SyncScheduler:
         """
         self._jobs: Dict[str, SyncJob] = {}
         self._schedules: Dict[str, ScheduledSync] = {}
-        self._job_history: List[SyncJob] = []
+        # Min-heap of (next_run_at, schedule_id); entries made stale by updates,
+        # deletes or disabling are discarded when popped
+        self._due_heap: List[Tuple[datetime, str]] = []
+        # Only the last 100 finished jobs are kept; older ones fall off the left
+        self._job_history: Deque[SyncJob] = deque(maxlen=100)
         self._running_jobs: set = set()
         self._lock = Lock()
         self._max_concurrent = max_concurrent_jobs
+        # Jobs beyond the limit wait for a free slot, in arrival order
+        self._job_slots = asyncio.Semaphore(max_concurrent_jobs)
+        # Running totals for get_stats, updated as jobs finish
+        self._stat_completed = 0
+        self._stat_failed = 0
+        self._stat_records = 0
+        # Per-event listeners; _callbacks maps event names onto the same lists
+        self._on_job_start: List[Callable] = []
+        self._on_job_complete: List[Callable] = []
+        self._on_job_fail: List[Callable] = []
         self._callbacks: Dict[str, List[Callable]] = {
-            "on_job_start": [],
-            "on_job_complete": [],
-            "on_job_fail": [],
+            "on_job_start": self._on_job_start,
+            "on_job_complete": self._on_job_complete,
+            "on_job_fail": self._on_job_fail,
         }
+        # Background loop firing due schedules, see start()/stop()
+        self._tick_task: Optional[asyncio.Task] = None
+        self._tick_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tick_wakeup: Optional[asyncio.Event] = None
+        self._scheduled_tasks: set = set()
 
     def create_sync_job(
         self,
@@ -159,13 +253,13 @@ class SyncScheduler:
         Returns:
             Created SyncJob
         """
-        job_id = f"sync_{uuid.uuid4().hex[:12]}"
+        job_id = f"sync_{secrets.token_hex(6)}"
 
         job = SyncJob(
             job_id=job_id,
-            source_id=source_id,
-            source_name=source_name,
-            streams=streams,
+            source_id=sys.intern(source_id),
+            source_name=sys.intern(source_name),
+            streams=_intern_names(streams),
             sync_mode=sync_mode,
             metadata=metadata or {}
         )
@@ -184,6 +278,9 @@ class SyncScheduler:
         """
         Run a sync job.
 
+        If the maximum number of concurrent jobs is already running, waits
+        for one of them to finish first.
+
         Args:
             job_id: Job ID to run
             executor_fn: Optional custom executor function
@@ -198,22 +295,32 @@ class SyncScheduler:
         if job.status == SyncStatus.RUNNING:
             raise ValueError(f"Job {job_id} is already running")
 
-        # Check concurrent job limit
-        with self._lock:
-            if len(self._running_jobs) >= self._max_concurrent:
-                raise ValueError(f"Maximum concurrent jobs ({self._max_concurrent}) reached")
-            self._running_jobs.add(job_id)
+        # Wait for a slot under the concurrent job limit
+        await self._job_slots.acquire()
 
-        # Update job status
-        job.status = SyncStatus.RUNNING
-        job.started_at = datetime.utcnow()
+        # Check and claim the job in one step: another caller may have run it,
+        # or it may have been cancelled, while this one was queued
+        with self._lock:
+            status = job.status
+            if status == SyncStatus.PENDING:
+                job.status = SyncStatus.RUNNING
+                job.started_at = datetime.utcnow()
+                job._started_perf = time.perf_counter()
+                self._running_jobs.add(job_id)
+
+        if status != SyncStatus.PENDING:
+            self._job_slots.release()
+            if status == SyncStatus.CANCELLED:
+                return job
+            raise ValueError(f"Job {job_id} is already {status.value}")
 
         # Fire start callbacks
-        for callback in self._callbacks["on_job_start"]:
-            try:
-                callback(job)
-            except Exception as e:
-                logger.warning(f"Callback error: {e}")
+        if self._on_job_start:
+            for callback in self._on_job_start:
+                try:
+                    callback(job)
+                except Exception as e:
+                    logger.warning(f"Callback error: {e}")
 
         try:
             # Execute sync with orchestrator
@@ -276,16 +383,21 @@ class SyncScheduler:
 
             job.status = SyncStatus.COMPLETED
             job.completed_at = datetime.utcnow()
+            job._completed_perf = time.perf_counter()
+            with self._lock:
+                self._stat_completed += 1
+                self._stat_records += job.records_synced
 
             # Persist job history to database
             await self._persist_job_history(job)
 
             # Fire complete callbacks
-            for callback in self._callbacks["on_job_complete"]:
-                try:
-                    callback(job)
-                except Exception as e:
-                    logger.warning(f"Callback error: {e}")
+            if self._on_job_complete:
+                for callback in self._on_job_complete:
+                    try:
+                        callback(job)
+                    except Exception as e:
+                        logger.warning(f"Callback error: {e}")
 
             logger.info(f"Sync job {job_id} completed: {job.records_synced} records")
 
@@ -293,13 +405,17 @@ class SyncScheduler:
             job.status = SyncStatus.FAILED
             job.error_message = str(e)
             job.completed_at = datetime.utcnow()
+            job._completed_perf = time.perf_counter()
+            with self._lock:
+                self._stat_failed += 1
 
             # Fire fail callbacks
-            for callback in self._callbacks["on_job_fail"]:
-                try:
-                    callback(job, e)
-                except Exception as ce:
-                    logger.warning(f"Callback error: {ce}")
+            if self._on_job_fail:
+                for callback in self._on_job_fail:
+                    try:
+                        callback(job, e)
+                    except Exception as ce:
+                        logger.warning(f"Callback error: {ce}")
 
             logger.error(f"Sync job {job_id} failed: {e}")
 
@@ -307,10 +423,8 @@ class SyncScheduler:
             with self._lock:
                 self._running_jobs.discard(job_id)
                 # Move to history
-                self._job_history.append(job)
-                # Keep only last 100 jobs in history
-                if len(self._job_history) > 100:
-                    self._job_history = self._job_history[-100:]
+                self._add_to_history(job)
+            self._job_slots.release()
 
         return job
 
@@ -333,6 +447,7 @@ class SyncScheduler:
 
         job.status = SyncStatus.CANCELLED
         job.completed_at = datetime.utcnow()
+        job._completed_perf = time.perf_counter()
 
         with self._lock:
             self._running_jobs.discard(job_id)
@@ -346,10 +461,12 @@ class SyncScheduler:
 
     def get_running_jobs(self) -> List[SyncJob]:
         """Get all running jobs."""
-        return [
-            job for job in self._jobs.values()
-            if job.status == SyncStatus.RUNNING
-        ]
+        # _running_jobs tracks exactly the jobs started and not yet finished,
+        # so there is no need to scan every job ever created
+        with self._lock:
+            running_ids = tuple(self._running_jobs)
+        jobs = self._jobs
+        return [job for job_id in running_ids if (job := jobs.get(job_id)) is not None]
 
     def get_job_history(
         self,
@@ -366,15 +483,30 @@ class SyncScheduler:
         Returns:
             List of historical jobs
         """
-        history = self._job_history.copy()
+        # History is kept in created_at order, so newest first is a reverse walk
+        with self._lock:
+            history = reversed(list(self._job_history))
 
         if source_id:
-            history = [j for j in history if j.source_id == source_id]
-
-        # Sort by created_at descending
-        history.sort(key=lambda j: j.created_at, reverse=True)
-
-        return history[:limit]
+            history = (j for j in history if j.source_id == source_id)
+
+        return list(islice(history, limit))
+
+    def _add_to_history(self, job: SyncJob) -> None:
+        """Add a finished job to history, keeping it ordered by created_at."""
+        history = self._job_history
+        if not history or job.created_at >= history[-1].created_at:
+            history.append(job)
+            return
+
+        # Jobs can finish out of creation order; insert at the sorted position.
+        # A full history drops its oldest job, which may be this one
+        if len(history) == history.maxlen:
+            if job.created_at < history[0].created_at:
+                return
+            history.popleft()
+        index = bisect_right(history, job.created_at, key=lambda j: j.created_at)
+        history.insert(index, job)
 
     # ========================================================================
     # Scheduled Syncs
@@ -403,13 +535,13 @@ class SyncScheduler:
         Returns:
             Created ScheduledSync
         """
-        schedule_id = f"schedule_{uuid.uuid4().hex[:8]}"
+        schedule_id = f"schedule_{secrets.token_hex(4)}"
 
         schedule = ScheduledSync(
             schedule_id=schedule_id,
-            source_id=source_id,
-            source_name=source_name,
-            streams=streams,
+            source_id=sys.intern(source_id),
+            source_name=sys.intern(source_name),
+            streams=_intern_names(streams),
             sync_mode=sync_mode,
             cron_expression=cron_expression,
             next_run_at=self._calculate_next_run(cron_expression),
@@ -418,32 +550,15 @@ class SyncScheduler:
 
         with self._lock:
             self._schedules[schedule_id] = schedule
+            self._push_due(schedule)
 
         logger.info(f"Created schedule {schedule_id} for {source_name}: {cron_expression}")
         return schedule
 
     def _calculate_next_run(self, cron_expression: str) -> datetime:
-        """Calculate next run time from cron expression (simplified)."""
-        # Simplified: just add 1 hour for demo
-        # In production, use croniter library
-        parts = cron_expression.split()
-        if len(parts) >= 5:
-            minute = parts[0]
-            hour = parts[1]
-
-            now = datetime.utcnow()
-
-            if minute == "*" and hour == "*":
-                # Every minute
-                return now + timedelta(minutes=1)
-            elif minute.isdigit() and hour == "*":
-                # Every hour at minute X
-                return now.replace(minute=int(minute), second=0, microsecond=0) + timedelta(hours=1)
-            elif minute.isdigit() and hour.isdigit():
-                # Daily at specific time
-                return now.replace(hour=int(hour), minute=int(minute), second=0, microsecond=0) + timedelta(days=1)
-
-        return datetime.utcnow() + timedelta(hours=1)
+        """Calculate next run time from cron expression."""
+        now = datetime.utcnow()
+        return _next_run_for(cron_expression, int((now - _EPOCH).total_seconds() // 60))
 
     def get_schedule(self, schedule_id: str) -> Optional[ScheduledSync]:
         """Get a schedule by ID."""
@@ -497,7 +612,10 @@ class SyncScheduler:
             schedule.next_run_at = self._calculate_next_run(cron_expression)
 
         if streams is not None:
-            schedule.streams = streams
+            schedule.streams = _intern_names(streams)
+
+        with self._lock:
+            self._push_due(schedule)
 
         logger.info(f"Updated schedule {schedule_id}")
         return schedule
@@ -543,27 +661,153 @@ class SyncScheduler:
         schedule.next_run_at = self._calculate_next_run(schedule.cron_expression)
         schedule.run_count += 1
 
+        with self._lock:
+            self._push_due(schedule)
+
         return job
 
+    async def run_due_schedules(self, now: Optional[datetime] = None) -> List[SyncJob]:
+        """
+        Run every enabled schedule whose next run time has passed.
+
+        Waits for the started jobs; the tick loop (see start()) fires due
+        schedules without waiting. Only due schedules are visited.
+
+        Args:
+            now: Reference time (defaults to the current UTC time)
+
+        Returns:
+            Jobs started for the due schedules
+        """
+        due = self._pop_due_schedules(now or datetime.utcnow())
+
+        results = await asyncio.gather(
+            *(self.run_scheduled_sync(schedule_id) for schedule_id in due),
+            return_exceptions=True
+        )
+
+        jobs = []
+        for schedule, result in zip(due.values(), results):
+            if isinstance(result, Exception):
+                # Keep it due so the next call retries it
+                logger.warning(f"Scheduled sync {schedule.schedule_id} not run: {result}")
+                with self._lock:
+                    self._push_due(schedule)
+            elif result is not None:
+                jobs.append(result)
+        return jobs
+
+    def _pop_due_schedules(self, now: datetime) -> Dict[str, ScheduledSync]:
+        """Remove and return the enabled schedules due at or before now."""
+        due: Dict[str, ScheduledSync] = {}
+        with self._lock:
+            heap = self._due_heap
+            while heap and heap[0][0] <= now:
+                run_at, schedule_id = heapq.heappop(heap)
+                schedule = self._schedules.get(schedule_id)
+                if schedule and schedule.enabled and schedule.next_run_at == run_at:
+                    due[schedule_id] = schedule
+        return due
+
+    def _push_due(self, schedule: ScheduledSync) -> None:
+        """Queue a schedule's next run. Caller must hold the lock."""
+        if schedule.enabled and schedule.next_run_at is not None:
+            entry = (schedule.next_run_at, schedule.schedule_id)
+            heapq.heappush(self._due_heap, entry)
+            # An earlier deadline than the one the tick loop sleeps towards.
+            # The loop may have closed without stop() (e.g. an aborted lifespan)
+            if (
+                self._due_heap[0] is entry
+                and self._tick_wakeup is not None
+                and not self._tick_loop.is_closed()
+            ):
+                self._tick_loop.call_soon_threadsafe(self._tick_wakeup.set)
+
     # ========================================================================
-    # Statistics
+    # Tick Loop
     # ========================================================================
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get scheduler statistics."""
-        all_jobs = list(self._jobs.values()) + self._job_history
+    def start(self) -> None:
+        """Start firing due schedules in the background."""
+        if self._tick_task is not None and not self._tick_task.done():
+            return
+
+        self._tick_loop = asyncio.get_running_loop()
+        self._tick_wakeup = asyncio.Event()
+        self._tick_task = asyncio.create_task(self._tick())
+        self._tick_task.add_done_callback(self._tick_stopped)
+        logger.info("Sync scheduler started")
+
+    def _tick_stopped(self, task: asyncio.Task) -> None:
+        """Stop waking the tick loop once it has ended, however it ended."""
+        if self._tick_task in (task, None):
+            self._tick_wakeup = None
+
+    async def stop(self) -> None:
+        """Stop the tick loop and cancel scheduled syncs still running."""
+        task, self._tick_task = self._tick_task, None
+        self._tick_wakeup = None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        running = list(self._scheduled_tasks)
+        for scheduled in running:
+            scheduled.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+    async def _tick(self) -> None:
+        """Sleep until the earliest due schedule, then start every due one."""
+        wakeup = self._tick_wakeup
+
+        while True:
+            # Cleared before reading the heap, so a push made after the read
+            # still cuts the sleep short
+            wakeup.clear()
+            with self._lock:
+                next_run_at = self._due_heap[0][0] if self._due_heap else None
+
+            timeout = _MAX_TICK_SECONDS
+            if next_run_at is not None:
+                delay = (next_run_at - datetime.utcnow()).total_seconds()
+                timeout = min(max(delay, 0.0), _MAX_TICK_SECONDS)
+
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout)
+
+            self._start_due_schedules()
+
+    def _start_due_schedules(self) -> None:
+        """Start each due schedule as its own task, without waiting for it."""
+        for schedule in self._pop_due_schedules(datetime.utcnow()).values():
+            task = asyncio.create_task(self.run_scheduled_sync(schedule.schedule_id))
+            self._scheduled_tasks.add(task)
+            task.add_done_callback(partial(self._scheduled_sync_done, schedule))
 
-        completed_jobs = [j for j in all_jobs if j.status == SyncStatus.COMPLETED]
-        failed_jobs = [j for j in all_jobs if j.status == SyncStatus.FAILED]
+    def _scheduled_sync_done(self, schedule: ScheduledSync, task: asyncio.Task) -> None:
+        """Forget a finished scheduled sync; if it did not run, skip to its next slot."""
+        self._scheduled_tasks.discard(task)
+        if task.cancelled() or task.exception() is None:
+            return
 
-        total_records = sum(j.records_synced for j in completed_jobs)
+        logger.warning(f"Scheduled sync {schedule.schedule_id} not run: {task.exception()}")
+        schedule.next_run_at = self._calculate_next_run(schedule.cron_expression)
+        with self._lock:
+            self._push_due(schedule)
+
+    # ========================================================================
+    # Statistics
+    # ========================================================================
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
         return {
-            "total_jobs": len(all_jobs),
+            "total_jobs": len(self._jobs),
             "running_jobs": len(self._running_jobs),
-            "completed_jobs": len(completed_jobs),
-            "failed_jobs": len(failed_jobs),
-            "total_records_synced": total_records,
+            "completed_jobs": self._stat_completed,
+            "failed_jobs": self._stat_failed,
+            "total_records_synced": self._stat_records,
             "active_schedules": sum(1 for s in self._schedules.values() if s.enabled),
             "total_schedules": len(self._schedules),
             "max_concurrent_jobs": self._max_concurrent
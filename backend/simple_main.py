@@ -20,6 +20,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 from pydantic import BaseModel
 
+from app.connectors.airbyte.executor import close_docker_executor, get_docker_executor
+from app.connectors.airbyte.sync_scheduler import get_sync_scheduler
 from app.connectors.base import ConnectionConfig
 from app.connectors.registry import ConnectorRegistry
 from app.monitoring.health import router as health_router
@@ -85,9 +87,18 @@ async def lifespan(app: FastAPI):
             logger.error(f"❌ Database connection failed: {e}")
             logger.warning("Falling back to in-memory mode")
 
+    # Pull configured connector images without blocking startup
+    get_docker_executor().start_prewarm()
+
+    # Fire scheduled syncs as they come due
+    get_sync_scheduler().start()
+
     yield  # Application runs here
 
     # Shutdown
+    await get_sync_scheduler().stop()
+    await close_docker_executor()
+
     if DB_AVAILABLE:
         try:
             db = await get_database()
@@ -8,6 +8,7 @@ Some tests require Docker to be available.
 
 import asyncio
 import json
+import sys
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,7 +18,9 @@ from app.connectors.airbyte.executor import (
     ExecutionResult,
     AirbyteCommand,
     get_docker_executor,
+    close_docker_executor,
     pull_image,
+    is_image_pulled,
     check_docker_available,
 )
 from app.connectors.airbyte.protocol import (
@@ -26,6 +29,22 @@ from app.connectors.airbyte.protocol import (
 )
 
 
+def make_process(stdout: bytes = b"", stderr: bytes = b"", returncode: int = 0) -> MagicMock:
+    """Create a mocked subprocess whose pipes yield the given output."""
+    process = MagicMock()
+    process.stdout = asyncio.StreamReader()
+    process.stdout.feed_data(stdout)
+    process.stdout.feed_eof()
+    process.stderr = asyncio.StreamReader()
+    process.stderr.feed_data(stderr)
+    process.stderr.feed_eof()
+    process.communicate = AsyncMock(return_value=(stdout, stderr))
+    process.returncode = returncode
+    process.kill = MagicMock()
+    process.wait = AsyncMock()
+    return process
+
+
 class TestExecutorConfig:
     """Test ExecutorConfig defaults."""
 
@@ -40,6 +59,14 @@ class TestExecutorConfig:
         assert config.cpu_limit == 2.0
         assert config.pull_policy == "if_not_present"
         assert config.working_dir == "/tmp/airbyte"
+        assert config.container_reuse_strategy == "none"
+        assert config.idle_ttl_seconds == 300
+        assert config.stdout_capture == "pipe"
+        assert config.cache_ttl_seconds == 3600
+        assert config.stream_buffer == 1024
+        assert config.log_driver == "none"
+        assert config.ipc_mode == "private"
+        assert config.pids_limit is None
 
     def test_custom_config(self):
         """Test custom configuration."""
@@ -85,6 +112,30 @@ class TestExecutionResult:
         assert result.error == "Connection refused"
         assert result.exit_code == 1
 
+    def test_messages_partitioned(self):
+        """Test records, errors and last state are derived from messages."""
+        from app.connectors.airbyte.protocol import (
+            AirbyteMessage,
+            create_error_trace,
+            create_record_message,
+            create_state_message,
+        )
+
+        messages = [
+            create_record_message("users", {"id": 1}),
+            create_state_message("users", None, {"cursor": "1"}),
+            create_error_trace("Something failed"),
+            create_record_message("users", {"id": 2}),
+            create_state_message("users", None, {"cursor": "2"}),
+            AirbyteMessage(type=AirbyteMessageType.LOG),
+        ]
+
+        result = ExecutionResult(success=True, command=AirbyteCommand.READ, messages=messages)
+
+        assert [r.data["id"] for r in result.records] == [1, 2]
+        assert [e.message for e in result.errors] == ["Something failed"]
+        assert result.last_state.stream.stream_state == {"cursor": "2"}
+
 
 class TestAirbyteCommand:
     """Test AirbyteCommand enum."""
@@ -113,6 +164,52 @@ class TestAirbyteDockerExecutor:
         assert self.executor.config.timeout_seconds == 60
         assert self.executor.config.working_dir == "/tmp/airbyte_test"
 
+    @pytest.mark.asyncio
+    async def test_prepare_temp_files(self, tmp_path):
+        """Test config, catalog and state are written as JSON."""
+        from app.connectors.airbyte.protocol import (
+            ConfiguredAirbyteCatalog,
+            ConfiguredAirbyteStream,
+            AirbyteStream,
+            SyncMode,
+        )
+
+        executor = AirbyteDockerExecutor(ExecutorConfig(working_dir=str(tmp_path)))
+        catalog = ConfiguredAirbyteCatalog(
+            streams=[
+                ConfiguredAirbyteStream(
+                    stream=AirbyteStream(name="users"),
+                    sync_mode=SyncMode.INCREMENTAL,
+                )
+            ]
+        )
+
+        temp_files = await executor._prepare_temp_files(
+            {"host": "localhost", "port": 5432},
+            catalog,
+            {"users": {"cursor": "2024-01-01"}},
+        )
+
+        import os
+        import stat
+
+        # Traversable for a non-root connector user, but not listable
+        assert stat.S_IMODE(os.stat(temp_files["dir"]).st_mode) == 0o711
+        with open(temp_files["config"]) as f:
+            assert json.load(f) == {"host": "localhost", "port": 5432}
+        with open(temp_files["catalog"]) as f:
+            assert json.load(f)["streams"][0]["sync_mode"] == "incremental"
+        with open(temp_files["state"]) as f:
+            assert json.load(f) == {"users": {"cursor": "2024-01-01"}}
+
+        other = await executor._prepare_temp_files({"host": "other"}, None, None)
+        assert other["dir"] != temp_files["dir"]
+
+        await executor._cleanup_temp_files(temp_files)
+        await executor._cleanup_temp_files(other)
+        await executor.aclose()
+        assert list(tmp_path.iterdir()) == []
+
     def test_build_docker_command_spec(self):
         """Test building docker command for SPEC."""
         temp_files = {}
@@ -127,10 +224,17 @@ class TestAirbyteDockerExecutor:
         assert "--rm" in cmd
         assert "airbyte/source-postgres:latest" in cmd
         assert "spec" in cmd
+        assert "-v" not in cmd
+        assert "--network=none" in cmd
+        assert "--log-driver=none" in cmd
+        assert "--ipc=private" in cmd
 
     def test_build_docker_command_check(self):
         """Test building docker command for CHECK."""
-        temp_files = {"config": "/tmp/airbyte_test/config.json"}
+        temp_files = {
+            "dir": "/tmp/airbyte_test/ab-1",
+            "config": "/tmp/airbyte_test/ab-1/config.json",
+        }
         cmd = self.executor._build_docker_command(
             "airbyte/source-postgres:latest",
             AirbyteCommand.CHECK,
@@ -140,10 +244,16 @@ class TestAirbyteDockerExecutor:
         assert "check" in cmd
         assert "--config" in cmd
         assert "/data/config.json" in cmd
+        assert "--network=host" in cmd
+        assert not any(arg.startswith("--pids-limit") for arg in cmd)
+        assert "/tmp/airbyte_test/ab-1:/data" in cmd
 
     def test_build_docker_command_discover(self):
         """Test building docker command for DISCOVER."""
-        temp_files = {"config": "/tmp/airbyte_test/config.json"}
+        temp_files = {
+            "dir": "/tmp/airbyte_test/ab-1",
+            "config": "/tmp/airbyte_test/ab-1/config.json",
+        }
         cmd = self.executor._build_docker_command(
             "airbyte/source-postgres:latest",
             AirbyteCommand.DISCOVER,
@@ -156,8 +266,9 @@ class TestAirbyteDockerExecutor:
     def test_build_docker_command_read(self):
         """Test building docker command for READ."""
         temp_files = {
-            "config": "/tmp/airbyte_test/config.json",
-            "catalog": "/tmp/airbyte_test/catalog.json",
+            "dir": "/tmp/airbyte_test/ab-1",
+            "config": "/tmp/airbyte_test/ab-1/config.json",
+            "catalog": "/tmp/airbyte_test/ab-1/catalog.json",
         }
         cmd = self.executor._build_docker_command(
             "airbyte/source-postgres:latest",
@@ -173,9 +284,10 @@ class TestAirbyteDockerExecutor:
     def test_build_docker_command_read_with_state(self):
         """Test building docker command for READ with state."""
         temp_files = {
-            "config": "/tmp/airbyte_test/config.json",
-            "catalog": "/tmp/airbyte_test/catalog.json",
-            "state": "/tmp/airbyte_test/state.json",
+            "dir": "/tmp/airbyte_test/ab-1",
+            "config": "/tmp/airbyte_test/ab-1/config.json",
+            "catalog": "/tmp/airbyte_test/ab-1/catalog.json",
+            "state": "/tmp/airbyte_test/ab-1/state.json",
         }
         cmd = self.executor._build_docker_command(
             "airbyte/source-postgres:latest",
@@ -196,6 +308,25 @@ class TestExecutorWithMockedDocker:
         config = ExecutorConfig(working_dir="/tmp/airbyte_test")
         return AirbyteDockerExecutor(config)
 
+    @staticmethod
+    def users_catalog():
+        """Build a configured catalog with a single users stream."""
+        from app.connectors.airbyte.protocol import (
+            ConfiguredAirbyteCatalog,
+            ConfiguredAirbyteStream,
+            AirbyteStream,
+            SyncMode,
+        )
+
+        return ConfiguredAirbyteCatalog(
+            streams=[
+                ConfiguredAirbyteStream(
+                    stream=AirbyteStream(name="users"),
+                    sync_mode=SyncMode.FULL_REFRESH,
+                )
+            ]
+        )
+
     @pytest.mark.asyncio
     async def test_spec_success(self, executor):
         """Test successful SPEC command."""
@@ -213,12 +344,7 @@ class TestExecutorWithMockedDocker:
         })
 
         with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = MagicMock()
-            mock_process.communicate = AsyncMock(return_value=(spec_output.encode(), b""))
-            mock_process.returncode = 0
-            mock_process.kill = MagicMock()
-            mock_process.wait = AsyncMock()
-            mock_exec.return_value = mock_process
+            mock_exec.return_value = make_process(spec_output.encode())
 
             spec = await executor.spec("airbyte/source-postgres:latest")
 
@@ -237,12 +363,7 @@ class TestExecutorWithMockedDocker:
         })
 
         with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = MagicMock()
-            mock_process.communicate = AsyncMock(return_value=(check_output.encode(), b""))
-            mock_process.returncode = 0
-            mock_process.kill = MagicMock()
-            mock_process.wait = AsyncMock()
-            mock_exec.return_value = mock_process
+            mock_exec.return_value = make_process(check_output.encode())
 
             status = await executor.check(
                 "airbyte/source-postgres:latest",
@@ -264,12 +385,7 @@ class TestExecutorWithMockedDocker:
         })
 
         with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = MagicMock()
-            mock_process.communicate = AsyncMock(return_value=(check_output.encode(), b""))
-            mock_process.returncode = 0
-            mock_process.kill = MagicMock()
-            mock_process.wait = AsyncMock()
-            mock_exec.return_value = mock_process
+            mock_exec.return_value = make_process(check_output.encode())
 
             status = await executor.check(
                 "airbyte/source-postgres:latest",
@@ -301,12 +417,7 @@ class TestExecutorWithMockedDocker:
         })
 
         with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = MagicMock()
-            mock_process.communicate = AsyncMock(return_value=(discover_output.encode(), b""))
-            mock_process.returncode = 0
-            mock_process.kill = MagicMock()
-            mock_process.wait = AsyncMock()
-            mock_exec.return_value = mock_process
+            mock_exec.return_value = make_process(discover_output.encode())
 
             catalog = await executor.discover(
                 "airbyte/source-postgres:latest",
@@ -344,12 +455,7 @@ class TestExecutorWithMockedDocker:
         )
 
         with patch("asyncio.create_subprocess_exec") as mock_exec:
-            mock_process = MagicMock()
-            mock_process.communicate = AsyncMock(return_value=(read_output.encode(), b""))
-            mock_process.returncode = 0
-            mock_process.kill = MagicMock()
-            mock_process.wait = AsyncMock()
-            mock_exec.return_value = mock_process
+            mock_exec.return_value = make_process(read_output.encode())
 
             result = await executor.read(
                 "airbyte/source-postgres:latest",
@@ -361,6 +467,169 @@ class TestExecutorWithMockedDocker:
             assert result.records_count == 2
             assert result.command == AirbyteCommand.READ
 
+    @pytest.mark.asyncio
+    async def test_read_stream_yields_in_order(self, executor):
+        """Test streamed messages arrive in connector output order."""
+        executor.config.stream_buffer = 2
+        lines = [
+            json.dumps({"type": "RECORD", "record": {"stream": "users", "data": {"id": i}, "emitted_at": 1704067200000}})
+            for i in range(10)
+        ]
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = make_process("\n".join(lines).encode())
+
+            ids = [
+                msg.record.data["id"]
+                async for msg in executor.read_stream(
+                    "airbyte/source-postgres:latest",
+                    {"host": "localhost"},
+                    self.users_catalog(),
+                )
+            ]
+
+            assert ids == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_read_stream_message_types(self, executor):
+        """Test unwanted message types are dropped from the stream."""
+        output = "\n".join([
+            json.dumps({"type": "LOG", "log": {"level": "INFO", "message": "Starting"}}),
+            json.dumps({"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1704067200000}}),
+            json.dumps({"log": {"level": "INFO", "message": "Key order varies"}, "type": "LOG"}),
+            json.dumps({"type": "STATE", "state": {"type": "STREAM", "stream": {"stream_descriptor": {"name": "users"}}}}),
+        ])
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = make_process(output.encode())
+
+            types = [
+                msg.type
+                async for msg in executor.read_stream(
+                    "airbyte/source-postgres:latest",
+                    {"host": "localhost"},
+                    self.users_catalog(),
+                    message_types=frozenset({AirbyteMessageType.RECORD, AirbyteMessageType.STATE}),
+                )
+            ]
+
+            assert types == [AirbyteMessageType.RECORD, AirbyteMessageType.STATE]
+
+    @pytest.mark.asyncio
+    async def test_read_records_raw(self, executor):
+        """Test raw record tuples with STATE delivered in order."""
+        output = "\n".join([
+            json.dumps({"type": "LOG", "log": {"level": "INFO", "message": "Starting"}}),
+            json.dumps({"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1704067200000}}),
+            json.dumps({"type": "STATE", "state": {"type": "STREAM", "stream": {"stream_descriptor": {"name": "users"}, "stream_state": {"cursor": "1"}}}}),
+            json.dumps({"type": "RECORD", "record": {"stream": "users", "data": {"id": 2}, "emitted_at": 1704067200001}}),
+        ])
+        events = []
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = make_process(output.encode())
+
+            async for stream, data, emitted_at in executor.read_records_raw(
+                "airbyte/source-postgres:latest",
+                {"host": "localhost"},
+                self.users_catalog(),
+                on_state=lambda state: events.append(("state", state.stream.stream_state)),
+            ):
+                events.append((stream, data, emitted_at))
+
+        assert events == [
+            ("users", {"id": 1}, 1704067200000),
+            ("state", {"cursor": "1"}),
+            ("users", {"id": 2}, 1704067200001),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_stream_early_exit_kills_process(self):
+        """Test abandoning a stream stops the connector and its reader tasks."""
+        executor = AirbyteDockerExecutor(
+            ExecutorConfig(working_dir="/tmp/airbyte_test", stream_buffer=2)
+        )
+        lines = b"".join(
+            json.dumps({"type": "RECORD", "record": {"stream": "users", "data": {"id": i}, "emitted_at": 1704067200000}}).encode() + b"\n"
+            for i in range(10)
+        )
+
+        def reader_tasks():
+            return [
+                task for task in asyncio.all_tasks()
+                if task.get_coro().__qualname__.endswith(("produce", "read_stderr"))
+            ]
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            process = make_process()
+            process.stdout = asyncio.StreamReader()
+            process.stdout.feed_data(lines)  # No EOF: connector still running
+            process.returncode = None
+            mock_exec.return_value = process
+
+            stream = executor.read_stream(
+                "airbyte/source-postgres:latest",
+                {"host": "localhost"},
+                self.users_catalog(),
+            )
+            msg = await stream.__anext__()
+
+            # Let the producer fill the buffer and block on it
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert reader_tasks()
+
+            await stream.aclose()
+
+            assert msg.record.data == {"id": 0}
+            process.kill.assert_called_once()
+            assert reader_tasks() == []
+
+    @pytest.mark.asyncio
+    async def test_file_stdout_capture(self, executor):
+        """Test parsing connector output spooled to a file."""
+        executor.config.stdout_capture = "file"
+        output = "\n".join([
+            json.dumps({"type": "LOG", "log": {"level": "INFO", "message": "Starting"}}),
+            json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}}),
+        ])
+
+        def fake_exec(*args, stdout=None, **kwargs):
+            stdout.write(output.encode())
+            stdout.flush()
+            return make_process()
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            result = await executor._execute(
+                "airbyte/source-postgres:latest",
+                AirbyteCommand.SPEC,
+            )
+
+            assert result.success is True
+            assert [m.type for m in result.messages] == [
+                AirbyteMessageType.LOG,
+                AirbyteMessageType.SPEC,
+            ]
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_reports_stderr(self, executor):
+        """Test stderr is surfaced when the connector exits with an error."""
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = make_process(
+                b"not json\n",
+                stderr=b"Traceback: boom\n",
+                returncode=1,
+            )
+
+            result = await executor._execute(
+                "airbyte/source-postgres:latest",
+                AirbyteCommand.SPEC,
+            )
+
+            assert result.success is False
+            assert result.messages == []
+            assert "boom" in result.error
+
     @pytest.mark.asyncio
     async def test_execution_timeout(self, executor):
         """Test execution timeout handling."""
@@ -384,13 +653,10 @@ class TestExecutorWithMockedDocker:
         executor.config.timeout_seconds = 0.1
 
         with patch("asyncio.create_subprocess_exec") as mock_exec:
+            # Pipes that never reach EOF simulate a hung connector
             mock_process = MagicMock()
-
-            async def slow_communicate():
-                await asyncio.sleep(1)  # Simulate slow execution
-                return (b"", b"")
-
-            mock_process.communicate = slow_communicate
+            mock_process.stdout = asyncio.StreamReader()
+            mock_process.stderr = asyncio.StreamReader()
             mock_process.kill = MagicMock()
             mock_process.wait = AsyncMock()
             mock_process.returncode = None
@@ -406,9 +672,351 @@ class TestExecutorWithMockedDocker:
             assert "timed out" in result.error.lower()
 
 
+class TestReadLineBatches:
+    """Test chunked line splitting of connector output."""
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self):
+        """Test lines are reassembled regardless of chunk boundaries."""
+        from app.connectors.airbyte.executor import _read_line_batches
+
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"first\nsec")
+        reader.feed_data(b"ond\nthi")
+        reader.feed_data(b"rd")
+        reader.feed_eof()
+
+        lines = [
+            line
+            async for batch in _read_line_batches(reader, chunk_size=4)
+            for line in batch
+        ]
+
+        assert lines == [b"first", b"second", b"third"]
+
+
+class TestParseCaptureFile:
+    """Test parsing spooled connector stdout."""
+
+    def test_lines_split_across_chunks(self):
+        """Test messages straddling or exceeding a chunk are parsed intact."""
+        import tempfile
+        from app.connectors.airbyte import executor
+
+        short = b'{"type": "RECORD", "record": {"stream": "s", "data": {"id": 1}, "emitted_at": 1}}\n'
+        long = (
+            b'{"type": "RECORD", "record": {"stream": "s", "data": {"pad": "'
+            + b"x" * 200
+            + b'"}, "emitted_at": 2}}'
+        )
+
+        with tempfile.TemporaryFile() as capture_file:
+            capture_file.write(short * 3 + long)
+            capture_file.flush()
+
+            with patch.object(executor, "_PARSE_CHUNK_SIZE", 100):
+                messages = executor._parse_capture_file(capture_file)
+
+        assert len(messages) == 4
+        assert messages[-1].record.data == {"pad": "x" * 200}
+
+
+class TestEnlargeStdoutPipe:
+    """Test growing the connector stdout pipe."""
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="F_SETPIPE_SZ is Linux only")
+    def test_pipe_enlarged(self):
+        """Test the stdout pipe capacity is raised."""
+        import fcntl
+        import os
+        from app.connectors.airbyte.executor import _STDOUT_PIPE_SIZE, _enlarge_stdout_pipe
+
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb") as pipe:
+            process = MagicMock()
+            process._transport.get_pipe_transport.return_value.get_extra_info.return_value = pipe
+
+            _enlarge_stdout_pipe(process)
+
+            assert fcntl.fcntl(read_fd, fcntl.F_GETPIPE_SZ) == _STDOUT_PIPE_SIZE
+        os.close(write_fd)
+
+    def test_missing_transport_is_ignored(self):
+        """Test processes without the expected private transport are left alone."""
+        from types import SimpleNamespace
+        from app.connectors.airbyte.executor import _enlarge_stdout_pipe
+
+        _enlarge_stdout_pipe(SimpleNamespace())
+        _enlarge_stdout_pipe(SimpleNamespace(_transport=SimpleNamespace(get_pipe_transport=lambda fd: None)))
+
+
+class TestWarmContainerPool:
+    """Test warm container reuse for SPEC/CHECK/DISCOVER."""
+
+    @pytest.fixture
+    def executor(self):
+        """Create executor with container reuse enabled."""
+        config = ExecutorConfig(
+            working_dir="/tmp/airbyte_test",
+            container_reuse_strategy="warm",
+            cache_ttl_seconds=0,
+        )
+        return AirbyteDockerExecutor(config)
+
+    def test_should_reuse_container(self, executor):
+        """Test only short-lived commands use warm containers."""
+        assert executor._should_reuse_container(AirbyteCommand.SPEC) is True
+        assert executor._should_reuse_container(AirbyteCommand.CHECK) is True
+        assert executor._should_reuse_container(AirbyteCommand.DISCOVER) is True
+        assert executor._should_reuse_container(AirbyteCommand.READ) is False
+
+    def test_reuse_disabled_by_default(self):
+        """Test containers are not reused unless opted in."""
+        executor = AirbyteDockerExecutor(ExecutorConfig(working_dir="/tmp/airbyte_test"))
+        assert executor._should_reuse_container(AirbyteCommand.SPEC) is False
+
+    def test_build_exec_command(self, executor):
+        """Test building docker exec command for a warm container."""
+        from app.connectors.airbyte.executor import _WarmContainer
+
+        warm = _WarmContainer(
+            container_id="abc123",
+            entrypoint=["python", "/airbyte/integration_code/main.py"],
+            last_used=0.0,
+        )
+        cmd = executor._build_exec_command(
+            warm,
+            AirbyteCommand.CHECK,
+            {"dir": "/tmp/airbyte_test/ab-1", "config": "/tmp/airbyte_test/ab-1/config.json"},
+        )
+
+        assert cmd[:3] == ["docker", "exec", "abc123"]
+        assert cmd[3:5] == ["python", "/airbyte/integration_code/main.py"]
+        assert "check" in cmd
+        assert "/data/ab-1/config.json" in cmd
+
+    @pytest.mark.asyncio
+    async def test_spec_reuses_warm_container(self, executor):
+        """Test repeated SPEC calls start the container once."""
+        spec_output = json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}})
+
+        def fake_exec(*args, **kwargs):
+            if args[:3] == ("docker", "image", "inspect"):
+                return make_process(b'["python", "/airbyte/integration_code/main.py"]')
+            if args[:2] == ("docker", "run"):
+                return make_process(b"container123\n")
+            return make_process(spec_output.encode())
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec) as mock_exec:
+            await executor.spec("airbyte/source-postgres:latest")
+            await executor.spec("airbyte/source-postgres:latest")
+
+            run_calls = [c for c in mock_exec.call_args_list if c.args[:2] == ("docker", "run")]
+            exec_calls = [c for c in mock_exec.call_args_list if c.args[:2] == ("docker", "exec")]
+            assert len(run_calls) == 1
+            assert len(exec_calls) == 2
+
+            await executor.aclose()
+            assert executor._warm == {}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_docker_run(self, executor):
+        """Test SPEC still runs when the warm container cannot start."""
+        spec_output = json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}})
+
+        def fake_exec(*args, **kwargs):
+            if args[:3] == ("docker", "image", "inspect"):
+                return make_process(stderr=b"No such image", returncode=1)
+            return make_process(spec_output.encode())
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec) as mock_exec:
+            spec = await executor.spec("airbyte/source-postgres:latest")
+
+            assert spec.connectionSpecification == {}
+            assert mock_exec.call_args_list[-1].args[:2] == ("docker", "run")
+
+
+    @pytest.mark.asyncio
+    async def test_cold_start_does_not_block_other_images(self, executor):
+        """Test one image's container start does not hold up another image."""
+        spec_output = json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}})
+        slow_start = asyncio.Event()
+
+        async def fake_exec(*args, **kwargs):
+            if args[:3] == ("docker", "image", "inspect"):
+                return make_process(b'["python", "main.py"]')
+            if args[:2] == ("docker", "run"):
+                if "airbyte/source-slow:latest" in args:
+                    await slow_start.wait()
+                return make_process(b"container123\n")
+            return make_process(spec_output.encode())
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            slow = asyncio.create_task(executor.spec("airbyte/source-slow:latest"))
+            await asyncio.sleep(0)
+
+            spec = await asyncio.wait_for(executor.spec("airbyte/source-postgres:latest"), timeout=1)
+            assert spec.connectionSpecification == {}
+            assert not slow.done()
+
+            slow_start.set()
+            await slow
+            await executor.aclose()
+
+    @pytest.mark.asyncio
+    async def test_dead_warm_container_is_evicted(self, executor):
+        """Test a failed exec removes the warm container and falls back to docker run."""
+        spec_output = json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}})
+
+        def fake_exec(*args, **kwargs):
+            if args[:3] == ("docker", "image", "inspect"):
+                return make_process(b'["python", "main.py"]')
+            if args[:2] == ("docker", "run") and "-d" in args:
+                return make_process(b"container123\n")
+            if args[:2] == ("docker", "exec"):
+                return make_process(stderr=b"Error: No such container: container123", returncode=1)
+            if args[:2] == ("docker", "rm"):
+                return make_process()
+            return make_process(spec_output.encode())
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec) as mock_exec:
+            spec = await executor.spec("airbyte/source-postgres:latest")
+
+            commands = [c.args[:2] for c in mock_exec.call_args_list]
+            assert spec.connectionSpecification == {}
+            assert ("docker", "rm") in commands
+            assert commands[-1] == ("docker", "run")
+            assert executor._warm == {}
+
+
+    @pytest.mark.asyncio
+    async def test_timed_out_warm_container_is_evicted(self, executor):
+        """Test a warm container is removed when a command in it times out."""
+        executor.config.timeout_seconds = 0.1
+
+        def fake_exec(*args, **kwargs):
+            if args[:3] == ("docker", "image", "inspect"):
+                return make_process(b'["python", "main.py"]')
+            if args[:2] == ("docker", "run"):
+                return make_process(b"container123\n")
+            if args[:2] == ("docker", "exec"):
+                # Pipes that never reach EOF simulate a hung connector
+                process = make_process()
+                process.stdout = asyncio.StreamReader()
+                process.stderr = asyncio.StreamReader()
+                return process
+            return make_process()
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec) as mock_exec:
+            result = await executor._execute("airbyte/source-postgres:latest", AirbyteCommand.SPEC)
+
+            removed = [c.args for c in mock_exec.call_args_list if c.args[:2] == ("docker", "rm")]
+            assert result.success is False
+            assert "timed out" in result.error
+            assert removed == [("docker", "rm", "-f", "container123")]
+            assert executor._warm == {}
+
+    @pytest.mark.asyncio
+    async def test_reaper_interval_is_at_least_a_second(self, executor):
+        """Test a zero idle TTL does not make the reaper spin on busy containers."""
+        from app.connectors.airbyte.executor import _WarmContainer
+
+        executor.config.idle_ttl_seconds = 0
+        warm = _WarmContainer(container_id="abc123", entrypoint=["main"], last_used=0.0)
+        await warm.lock.acquire()
+        executor._warm["airbyte/source-postgres:latest"] = warm
+
+        with patch("asyncio.sleep", side_effect=asyncio.CancelledError) as mock_sleep:
+            with pytest.raises(asyncio.CancelledError):
+                await executor._reap_idle_containers()
+
+        mock_sleep.assert_called_once_with(1)
+
+
+class TestResultCache:
+    """Test caching of SPEC/DISCOVER results by image ID."""
+
+    @pytest.fixture
+    def executor(self):
+        """Create executor for testing."""
+        return AirbyteDockerExecutor(ExecutorConfig(working_dir="/tmp/airbyte_test"))
+
+    @staticmethod
+    def fake_exec(output: str, image_id: bytes = b"sha256:abc123"):
+        """Return a subprocess factory answering image inspect with an ID."""
+        def fake(*args, **kwargs):
+            if args[:3] == ("docker", "image", "inspect"):
+                return make_process(image_id + b"\n")
+            return make_process(output.encode())
+        return fake
+
+    @staticmethod
+    def run_calls(mock_exec):
+        """Return the docker run calls made through the mock."""
+        return [c for c in mock_exec.call_args_list if c.args[:2] == ("docker", "run")]
+
+    @pytest.mark.asyncio
+    async def test_spec_cached(self, executor):
+        """Test a second SPEC for the same image skips the container."""
+        spec_output = json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}})
+
+        with patch("asyncio.create_subprocess_exec", side_effect=self.fake_exec(spec_output)) as mock_exec:
+            first = await executor.spec("airbyte/source-postgres:latest")
+            second = await executor.spec("airbyte/source-postgres:latest")
+
+            assert len(self.run_calls(mock_exec)) == 1
+            assert first == second
+            assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_discover_keyed_by_config(self, executor):
+        """Test DISCOVER results are cached per configuration."""
+        discover_output = json.dumps({"type": "CATALOG", "catalog": {"streams": []}})
+
+        with patch("asyncio.create_subprocess_exec", side_effect=self.fake_exec(discover_output)) as mock_exec:
+            await executor.discover("airbyte/source-postgres:latest", {"host": "a", "port": 1})
+            await executor.discover("airbyte/source-postgres:latest", {"port": 1, "host": "a"})
+            await executor.discover("airbyte/source-postgres:latest", {"host": "b", "port": 1})
+
+            assert len(self.run_calls(mock_exec)) == 2
+
+    @pytest.mark.asyncio
+    async def test_new_image_id_misses_cache(self, executor):
+        """Test a re-pulled tag with a new image ID is not served from cache."""
+        spec_output = json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}})
+
+        with patch("asyncio.create_subprocess_exec", side_effect=self.fake_exec(spec_output, b"sha256:old")):
+            await executor.spec("airbyte/source-postgres:latest")
+        with patch("asyncio.create_subprocess_exec", side_effect=self.fake_exec(spec_output, b"sha256:new")) as mock_exec:
+            await executor.spec("airbyte/source-postgres:latest")
+
+            assert len(self.run_calls(mock_exec)) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, executor):
+        """Test caching can be turned off."""
+        executor.config.cache_ttl_seconds = 0
+        spec_output = json.dumps({"type": "SPEC", "spec": {"connectionSpecification": {}}})
+
+        with patch("asyncio.create_subprocess_exec", side_effect=self.fake_exec(spec_output)) as mock_exec:
+            await executor.spec("airbyte/source-postgres:latest")
+            await executor.spec("airbyte/source-postgres:latest")
+
+            assert len(self.run_calls(mock_exec)) == 2
+            assert not any(c.args[:3] == ("docker", "image", "inspect") for c in mock_exec.call_args_list)
+
+
 class TestPullImage:
     """Test pull_image function."""
 
+    @pytest.fixture(autouse=True)
+    def reset_pulled_images(self):
+        """Forget images confirmed by other tests."""
+        import app.connectors.airbyte.executor as executor_module
+        executor_module._pulled_images.clear()
+        yield
+        executor_module._pulled_images.clear()
+
     @pytest.mark.asyncio
     async def test_pull_image_already_exists(self):
         """Test pull when image already exists."""
@@ -464,6 +1072,38 @@ class TestPullImage:
             # Should only call pull, not inspect
             assert "pull" in str(mock_exec.call_args)
 
+    @pytest.mark.asyncio
+    async def test_pulled_image_remembered(self):
+        """Test a confirmed image is not inspected again."""
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_process = MagicMock()
+            mock_process.wait = AsyncMock()
+            mock_process.returncode = 0
+            mock_exec.return_value = mock_process
+
+            assert await pull_image("airbyte/source-postgres:latest") is True
+            assert await pull_image("airbyte/source-postgres:latest") is True
+
+            assert mock_exec.call_count == 1
+            assert is_image_pulled("airbyte/source-postgres:latest")
+            assert not is_image_pulled("airbyte/source-postgres:latest", docker_host="tcp://other:2375")
+
+    def test_run_uses_pull_never_once_pulled(self):
+        """Test docker run skips the pull check for confirmed images."""
+        import app.connectors.airbyte.executor as executor_module
+        executor = AirbyteDockerExecutor(ExecutorConfig(working_dir="/tmp/airbyte_test"))
+
+        cmd = executor._build_docker_command("airbyte/source-postgres:latest", AirbyteCommand.SPEC, {})
+        assert "--pull=missing" in cmd
+
+        executor_module._pulled_images.add((None, "airbyte/source-postgres:latest"))
+        cmd = executor._build_docker_command("airbyte/source-postgres:latest", AirbyteCommand.SPEC, {})
+        assert "--pull=never" in cmd
+
+        executor.config.pull_policy = "always"
+        cmd = executor._build_docker_command("airbyte/source-postgres:latest", AirbyteCommand.SPEC, {})
+        assert "--pull=always" in cmd
+
 
 class TestCheckDockerAvailable:
     """Test check_docker_available function."""
@@ -504,6 +1144,20 @@ class TestCheckDockerAvailable:
 
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_docker_host_passed_in_env(self):
+        """Test that an explicit Docker host is set on the subprocess env."""
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_process = MagicMock()
+            mock_process.wait = AsyncMock()
+            mock_process.returncode = 0
+            mock_exec.return_value = mock_process
+
+            await check_docker_available(docker_host="tcp://docker:2375")
+
+            env = mock_exec.call_args.kwargs["env"]
+            assert env["DOCKER_HOST"] == "tcp://docker:2375"
+
 
 class TestGetDockerExecutor:
     """Test get_docker_executor singleton."""
@@ -521,3 +1175,17 @@ class TestGetDockerExecutor:
 
         # Reset again
         executor_module._executor = None
+
+    @pytest.mark.asyncio
+    async def test_close_resets_instance(self):
+        """Test that close_docker_executor drops the singleton."""
+        import app.connectors.airbyte.executor as executor_module
+        executor_module._executor = None
+
+        executor1 = get_docker_executor()
+        await close_docker_executor()
+        executor2 = get_docker_executor()
+
+        assert executor1 is not executor2
+
+        executor_module._executor = None
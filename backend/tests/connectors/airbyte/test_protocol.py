@@ -32,11 +32,15 @@ from app.connectors.airbyte.protocol import (
     AirbyteErrorTraceMessage,
     # Utilities
     parse_messages_from_output,
+    sniff_message_type,
     filter_records,
     filter_state,
+    filter_logs,
     get_last_state,
     get_errors,
+    partition_messages,
     create_record_message,
+    create_record_messages_batch,
     create_state_message,
     create_log_message,
     create_error_trace,
@@ -256,6 +260,15 @@ class TestAirbyteMessage:
         with pytest.raises(ValueError):
             AirbyteMessage.from_json("not valid json")
 
+    def test_parse_from_bytes(self):
+        """Test parsing a raw stdout line without decoding first."""
+        line = b'{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1704067200000}}'
+
+        msg = AirbyteMessage.from_json(line)
+
+        assert msg.type == AirbyteMessageType.RECORD
+        assert msg.record.data == {"id": 1}
+
 
 class TestParseMessagesFromOutput:
     """Test parsing multiple messages from connector output."""
@@ -290,6 +303,17 @@ not valid json
         # Should skip the invalid line
         assert len(messages) == 2
 
+    def test_invalid_lines_logged_once(self, caplog):
+        """Test skipped lines are reported in a single warning."""
+        output = "not valid json\nnor this\n"
+
+        with caplog.at_level("WARNING"):
+            messages = parse_messages_from_output(output)
+
+        assert messages == []
+        assert len(caplog.records) == 1
+        assert "Skipped 2 unparseable line(s)" in caplog.records[0].getMessage()
+
     def test_empty_output(self):
         """Test parsing empty output."""
         messages = parse_messages_from_output("")
@@ -298,6 +322,69 @@ not valid json
         messages = parse_messages_from_output("   \n   \n   ")
         assert len(messages) == 0
 
+    def test_parse_bytes_output(self):
+        """Test parsing raw stdout bytes."""
+        output = (
+            b'{"type": "LOG", "log": {"level": "INFO", "message": "Starting"}}\r\n'
+            b'{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1704067200000}}\n'
+        )
+
+        messages = parse_messages_from_output(output)
+
+        assert len(messages) == 2
+        assert messages[1].record.data == {"id": 1}
+
+    def test_parse_bytes_output_utf8(self):
+        """Test raw bytes are decoded by the parser, skipping invalid UTF-8."""
+        output = (
+            '{"type": "RECORD", "record": {"stream": "users", "data": {"name": "Zoë"}, "emitted_at": 1}}\n'.encode()
+            + b'{"type": "RECORD", "record": {"stream": "users", "data": {"name": "\xff"}, "emitted_at": 2}}\n'
+        )
+
+        messages = parse_messages_from_output(output)
+
+        assert len(messages) == 1
+        assert messages[0].record.data == {"name": "Zoë"}
+
+    def test_filter_message_types(self):
+        """Test only the requested message types are parsed and returned."""
+        output = (
+            '{"type": "LOG", "log": {"level": "INFO", "message": "Starting"}}\n'
+            '{"record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}, "type": "RECORD"}\n'
+            '{"type": "LOG", "log": {"level": "INFO", "message": "Done"}}\n'
+            '{"type": "STATE", "state": {"type": "LEGACY", "data": {"cursor": 1}}}\n'
+        )
+
+        messages = parse_messages_from_output(
+            output, message_types={AirbyteMessageType.RECORD, AirbyteMessageType.STATE}
+        )
+
+        assert [msg.type for msg in messages] == [
+            AirbyteMessageType.RECORD,
+            AirbyteMessageType.STATE,
+        ]
+
+
+class TestSniffMessageType:
+    """Test detecting message type from raw output lines."""
+
+    def test_sniff_leading_type(self):
+        """Test type is read from the leading key."""
+        assert sniff_message_type(b'{"type": "RECORD", "record": {}}') == AirbyteMessageType.RECORD
+        assert sniff_message_type(b'{"type":"STATE","state":{}}') == AirbyteMessageType.STATE
+        assert sniff_message_type(b'  { "type" : "LOG" }') == AirbyteMessageType.LOG
+
+    def test_sniff_undetermined(self):
+        """Test None when type is not the leading key or is unknown."""
+        assert sniff_message_type(b'{"record": {}, "type": "RECORD"}') is None
+        assert sniff_message_type(b'{"type": "UNKNOWN"}') is None
+        assert sniff_message_type(b"not json") is None
+
+    def test_sniff_text(self):
+        """Test decoded text lines are sniffed the same way."""
+        assert sniff_message_type('{"type": "RECORD", "record": {}}') == AirbyteMessageType.RECORD
+        assert sniff_message_type('{"record": {}, "type": "RECORD"}') is None
+
 
 class TestFilterFunctions:
     """Test message filtering functions."""
@@ -362,6 +449,27 @@ class TestFilterFunctions:
         last_state = get_last_state(messages)
         assert last_state is None
 
+    def test_filter_logs_by_level(self):
+        """Test LOG messages below the minimum level are dropped."""
+        messages = [
+            create_log_message(level, level.value)
+            for level in (AirbyteLogLevel.DEBUG, AirbyteLogLevel.INFO, AirbyteLogLevel.ERROR)
+        ]
+
+        assert [log.message for log in filter_logs(messages)] == ["INFO", "ERROR"]
+        assert [log.message for log in filter_logs(messages, AirbyteLogLevel.WARN)] == ["ERROR"]
+        assert len(filter_logs(messages, AirbyteLogLevel.TRACE)) == 3
+
+    def test_partition_messages(self):
+        """Test splitting messages by kind in one pass."""
+        buckets = partition_messages(self.messages)
+
+        assert buckets.records == filter_records(self.messages)
+        assert buckets.states == filter_state(self.messages)
+        assert [log.message for log in buckets.logs] == ["Starting"]
+        assert buckets.errors == []
+        assert buckets.last_state is self.messages[-1].state
+
 
 class TestGetErrors:
     """Test error extraction."""
@@ -423,6 +531,14 @@ class TestMessageBuilders:
 
         assert msg.record.namespace == "public"
 
+    def test_create_record_messages_batch(self):
+        """Test a batch of records shares one emitted_at timestamp."""
+        messages = create_record_messages_batch("users", [{"id": 1}, {"id": 2}], namespace="public")
+
+        assert [msg.record.data for msg in messages] == [{"id": 1}, {"id": 2}]
+        assert messages[0].record.emitted_at == messages[1].record.emitted_at
+        assert all(msg.record.namespace == "public" for msg in messages)
+
     def test_create_state_message(self):
         """Test creating a state message."""
         msg = create_state_message("users", None, {"cursor": "2024-01-01"})
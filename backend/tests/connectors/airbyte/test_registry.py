@@ -5,12 +5,16 @@ Tests for Airbyte Connector Registry
 Tests the connector registry with 100+ Airbyte Docker images.
 """
 
+import dataclasses
+
 import pytest
 
 from app.connectors.airbyte.registry import (
     ConnectorCategory,
     ConnectorInfo,
     AIRBYTE_CONNECTORS,
+    CONNECTORS_BY_CATEGORY,
+    INCREMENTAL_CONNECTORS,
     get_connector_image,
     get_connector_info,
     list_connectors,
@@ -49,6 +53,11 @@ class TestConnectorRegistry:
             assert connector.docker_image, f"Connector {name} missing docker_image"
             assert connector.category, f"Connector {name} missing category"
 
+    def test_registry_is_read_only(self):
+        """Test the registry mapping cannot be modified."""
+        with pytest.raises(TypeError):
+            AIRBYTE_CONNECTORS["source-new"] = AIRBYTE_CONNECTORS["source-postgres"]
+
     def test_docker_images_follow_pattern(self):
         """Test that Docker images follow airbyte/source-* pattern."""
         for name, connector in AIRBYTE_CONNECTORS.items():
@@ -107,6 +116,14 @@ class TestGetConnectorInfo:
         assert info is not None
         assert info.name == "source-postgres"
 
+    def test_get_info_normalizes_name(self):
+        """Test lookups ignore case and whitespace and accept display names."""
+        postgres = get_connector_info("source-postgres")
+
+        assert get_connector_info(" Postgres ") is postgres
+        assert get_connector_info("SOURCE-POSTGRES") is postgres
+        assert get_connector_info("PostgreSQL") is postgres
+
     def test_get_unknown_connector_returns_none(self):
         """Test that unknown connectors return None."""
         info = get_connector_info("source-unknown-connector")
@@ -141,6 +158,31 @@ class TestListConnectors:
         for c in connectors:
             assert c.category == ConnectorCategory.CRM
 
+    def test_list_by_category_name(self):
+        """Test categories resolve from member names regardless of case."""
+        assert list_connectors(category="CRM") == list_connectors(category="crm")
+
+        with pytest.raises(ValueError):
+            ConnectorCategory.from_str("not-a-category")
+
+    def test_list_returns_independent_copies(self):
+        """Test callers can modify the returned list without affecting the registry."""
+        connectors = list_connectors(category="database")
+        connectors.clear()
+
+        assert len(list_connectors(category="database")) >= 10
+        assert len(list_connectors()) == get_connector_count()
+
+    def test_category_index_matches_registry(self):
+        """Test the precomputed indexes agree with a scan of the registry."""
+        for category in ConnectorCategory:
+            expected = [c for c in AIRBYTE_CONNECTORS.values() if c.category == category]
+            assert list(CONNECTORS_BY_CATEGORY.get(category, ())) == expected
+
+        assert INCREMENTAL_CONNECTORS == {
+            name for name, c in AIRBYTE_CONNECTORS.items() if c.supports_incremental
+        }
+
 
 class TestListCategories:
     """Test list_categories function."""
@@ -192,6 +234,17 @@ class TestSearchConnectors:
         results = search_connectors("nonexistentconnector123")
         assert len(results) == 0
 
+    @pytest.mark.parametrize("query", ["go", "sql", "Google A", "source-", "hub", "3"])
+    def test_search_matches_full_scan(self, query):
+        """Test indexed search returns exactly what a linear scan would."""
+        q = query.lower()
+        expected = [
+            c for c in AIRBYTE_CONNECTORS.values()
+            if q in c.name.lower() or q in c.display_name.lower()
+        ]
+
+        assert search_connectors(query) == expected
+
 
 class TestGetCategoryCounts:
     """Test get_category_counts function."""
@@ -236,6 +289,13 @@ class TestConnectorInfo:
         assert info.supports_incremental is True
         assert info.supports_normalization is False
 
+    def test_connector_info_is_immutable(self):
+        """Test registry entries cannot be modified in place."""
+        info = get_connector_info("source-postgres")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            info.docker_image = "other/image:latest"
+
 
 class TestPopularConnectors:
     """Test that popular connectors are properly registered."""
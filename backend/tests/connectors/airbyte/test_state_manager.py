@@ -3,8 +3,13 @@ Tests for State Manager
 
 Tests state persistence, stream state tracking, and incremental sync support.
 """
+import gc
+import threading
+import weakref
+
+import orjson
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 
 from app.connectors.airbyte.state_manager import (
@@ -71,6 +76,23 @@ class TestStreamState:
         assert state.cursor_field == "created_at"
         assert state.records_synced == 500
 
+    def test_from_dict_naive_timestamp_is_utc(self):
+        """Test timestamps from older naive state files are read as UTC."""
+        state = StreamState.from_dict({
+            "stream_name": "customers",
+            "last_synced_at": "2024-01-15T10:00:00",
+        })
+        assert state.last_synced_at == datetime(2024, 1, 15, 10, tzinfo=timezone.utc)
+
+    def test_to_dict_keeps_naive_utc_format(self):
+        """Test timestamps serialize without an offset, converted to UTC."""
+        tz = timezone(timedelta(hours=2))
+        state = StreamState(
+            stream_name="customers",
+            last_synced_at=datetime(2024, 1, 15, 12, tzinfo=tz),
+        )
+        assert state.to_dict()["last_synced_at"] == "2024-01-15T10:00:00"
+
 
 class TestSourceState:
     """Tests for SourceState dataclass."""
@@ -261,6 +283,160 @@ class TestStateManager:
         manager.delete_state("src_delete")
         assert manager.get_state("src_delete") is None
 
+    def test_file_persistence_round_trip(self, tmp_path):
+        """Test state written to disk is restored by a new manager."""
+        manager = StateManager(storage_path=tmp_path)
+        manager.create_state("postgres", "src_persist", streams=["users"])
+        manager.update_stream_state(
+            "src_persist", "users", cursor_field="id", cursor_value=42,
+            records_synced=5, metadata={1: "non-string key"},
+        )
+        manager.flush()
+
+        restored = StateManager(storage_path=tmp_path).get_state("src_persist")
+
+        assert restored is not None
+        assert restored.source_name == "postgres"
+        assert restored.streams["users"].cursor_value == 42
+        assert restored.streams["users"].records_synced == 5
+        assert restored.streams["users"].metadata == {"1": "non-string key"}
+        assert restored.streams["users"].last_synced_at is not None
+
+    def test_update_stream_states_batch(self, tmp_path):
+        """Test several streams can be updated in one call."""
+        manager = StateManager(storage_path=tmp_path)
+        manager.create_state("postgres", "src_bulk", streams=["users"])
+
+        updated = manager.update_stream_states("src_bulk", [
+            {"stream_name": "users", "cursor_field": "id", "cursor_value": 7},
+            {"stream_name": "orders", "cursor_value": "2024-01-01", "records_synced": 3},
+        ])
+
+        assert [s.stream_name for s in updated] == ["users", "orders"]
+        state = manager.get_state("src_bulk")
+        assert state.streams["users"].cursor_value == 7
+        assert state.streams["orders"].records_synced == 3
+        assert state.streams["orders"].sync_mode == "incremental"
+        assert manager.update_stream_states("missing", []) is None
+
+    def test_sync_summary_totals(self, tmp_path):
+        """Test the sync summary aggregates records and the latest sync time."""
+        manager = StateManager(storage_path=tmp_path)
+        manager.create_state("postgres", "src_summary", streams=["users", "orders"])
+        manager.update_stream_state("src_summary", "users", records_synced=10)
+        manager.update_stream_state("src_summary", "orders", records_synced=5)
+
+        summary = manager.get_sync_summary("src_summary")
+        orders = manager.get_state("src_summary").streams["orders"]
+
+        assert summary["total_streams"] == 2
+        assert summary["total_records_synced"] == 15
+        assert summary["last_sync_at"] == orders.last_synced_at.replace(tzinfo=None).isoformat()
+        assert [s["stream_name"] for s in summary["streams"]] == ["users", "orders"]
+        assert manager.get_sync_summary("missing") is None
+
+    def test_corrupt_state_file_is_skipped(self, tmp_path):
+        """Test one unreadable file does not prevent loading the others."""
+        manager = StateManager(storage_path=tmp_path)
+        for i in range(5):
+            manager.create_state("postgres", f"src_load_{i}")
+        (tmp_path / "broken.json").write_text("{not json")
+
+        reloaded = StateManager(storage_path=tmp_path)
+
+        assert {s["source_id"] for s in reloaded.list_sources()} == {
+            f"src_load_{i}" for i in range(5)
+        }
+
+    def test_legacy_flat_state_files_are_migrated(self, tmp_path):
+        """Test state files from the flat layout are moved into shards and loaded."""
+        state = SourceState(source_id="src_flat", source_name="postgres")
+        (tmp_path / "src_flat.json").write_bytes(orjson.dumps(state.to_dict()))
+
+        manager = StateManager(storage_path=tmp_path)
+
+        assert manager.get_state("src_flat") is not None
+        assert manager._state_file("src_flat").exists()
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_unchanged_state_is_not_rewritten(self, tmp_path):
+        """Test persisting an unchanged state leaves the file untouched."""
+        manager = StateManager(storage_path=tmp_path)
+        manager.create_state("postgres", "src_same")
+        state_file = manager._state_file("src_same")
+        state_file.write_text("sentinel")
+
+        manager._persist_state("src_same")
+
+        assert state_file.read_text() == "sentinel"
+        assert list(tmp_path.rglob("*.tmp")) == []
+
+    def test_stream_updates_are_coalesced(self, tmp_path, monkeypatch):
+        """Test repeated stream updates are persisted once per flush."""
+        manager = StateManager(storage_path=tmp_path, persist_interval=60)
+        manager.create_state("postgres", "src_batch", streams=["users"])
+
+        written = []
+        monkeypatch.setattr(
+            manager, "_persist_state_to_file", lambda source_id, data: written.append(source_id)
+        )
+
+        for i in range(100):
+            manager.update_stream_state("src_batch", "users", cursor_value=i)
+        assert written == []
+
+        manager.flush()
+        assert written == ["src_batch"]
+
+        manager.flush()
+        assert written == ["src_batch"]
+
+    def test_flush_writes_outside_the_state_lock(self, tmp_path, monkeypatch):
+        """Test stream updates are not blocked while a flush writes to disk."""
+        manager = StateManager(storage_path=tmp_path, persist_interval=60)
+        manager.create_state("postgres", "src_slow", streams=["users"])
+        manager.update_stream_state("src_slow", "users", cursor_value=1)
+
+        writing = threading.Event()
+        release = threading.Event()
+        persist = manager._persist_state_to_file
+
+        def slow_persist(source_id, data):
+            writing.set()
+            release.wait(5)
+            persist(source_id, data)
+
+        monkeypatch.setattr(manager, "_persist_state_to_file", slow_persist)
+        flusher = threading.Thread(target=manager.flush)
+        flusher.start()
+        assert writing.wait(5)
+
+        # Completes while the flush is still writing the earlier snapshot
+        updater = threading.Thread(
+            target=manager.update_stream_state, args=("src_slow", "users"),
+            kwargs={"cursor_value": 2},
+        )
+        updater.start()
+        updater.join(1)
+        assert not updater.is_alive()
+        release.set()
+        flusher.join(5)
+        manager.flush()
+
+        restored = StateManager(storage_path=tmp_path).get_state("src_slow")
+        assert restored.streams["users"].cursor_value == 2
+        assert list(tmp_path.rglob("*.tmp")) == []
+
+    def test_managers_are_not_kept_alive(self, tmp_path):
+        """Test the exit-time flush hook does not pin state managers in memory."""
+        manager = StateManager(storage_path=tmp_path)
+        ref = weakref.ref(manager)
+
+        del manager
+        gc.collect()
+
+        assert ref() is None
+
     def test_export_state(self, manager):
         """Test exporting all state."""
         manager.create_state("exp_1", "export_test", streams=["data"])
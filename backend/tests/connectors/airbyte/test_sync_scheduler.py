@@ -14,7 +14,8 @@ from app.connectors.airbyte.sync_scheduler import (
     get_sync_scheduler,
     SyncJob,
     SyncStatus,
-    ScheduledSync
+    ScheduledSync,
+    _next_run_for,
 )
 
 
@@ -441,3 +442,265 @@ class TestConcurrencyLimits:
 
         can_start = scheduler.can_start_new_job()
         assert can_start is True
+
+
+class TestSchedulerBookkeeping:
+    """Tests for job, history and schedule bookkeeping."""
+
+    @pytest.mark.asyncio
+    async def test_running_jobs_tracks_execution(self):
+        """Test a job is listed as running only while it executes."""
+        scheduler = SyncScheduler()
+        job = scheduler.create_sync_job("src", "name", ["stream"])
+        scheduler.create_sync_job("src", "name", ["other"])
+        seen = []
+
+        async def executor(running_job):
+            seen.extend(scheduler.get_running_jobs())
+            return {"records_synced": 1}
+
+        await scheduler.run_sync_job(job.job_id, executor_fn=executor)
+
+        assert seen == [job]
+        assert scheduler.get_running_jobs() == []
+
+    @pytest.mark.asyncio
+    async def test_job_history_keeps_last_100(self):
+        """Test history is capped at the 100 most recently finished jobs."""
+        scheduler = SyncScheduler()
+
+        async def executor(job):
+            return {"records_synced": 1}
+
+        jobs = []
+        for i in range(105):
+            job = scheduler.create_sync_job(f"src_{i}", "name", ["stream"])
+            jobs.append(await scheduler.run_sync_job(job.job_id, executor_fn=executor))
+
+        history = scheduler.get_job_history(limit=200)
+        assert len(history) == 100
+        assert {j.job_id for j in history} == {j.job_id for j in jobs[5:]}
+
+    @pytest.mark.asyncio
+    async def test_registered_callbacks_fire(self):
+        """Test start and complete callbacks registered by event name are invoked."""
+        scheduler = SyncScheduler()
+        events = []
+        scheduler.register_callback("on_job_start", lambda job: events.append("start"))
+        scheduler.register_callback("on_job_complete", lambda job: events.append("complete"))
+
+        async def executor(job):
+            return {"records_synced": 1}
+
+        job = scheduler.create_sync_job("src", "name", ["stream"])
+        await scheduler.run_sync_job(job.job_id, executor_fn=executor)
+
+        assert events == ["start", "complete"]
+
+    @pytest.mark.asyncio
+    async def test_duration_uses_monotonic_clock(self):
+        """Test a finished job's duration ignores later wall-clock edits."""
+        scheduler = SyncScheduler()
+
+        async def executor(job):
+            return {"records_synced": 1}
+
+        job = scheduler.create_sync_job("src", "name", ["stream"])
+        await scheduler.run_sync_job(job.job_id, executor_fn=executor)
+        duration = job.to_dict()["duration_seconds"]
+        job.completed_at = job.started_at + timedelta(hours=1)
+
+        assert 0 <= duration < 60
+        assert job.to_dict()["duration_seconds"] == duration
+
+    @pytest.mark.asyncio
+    async def test_stats_count_finished_jobs(self):
+        """Test stats reflect each finished job exactly once."""
+        scheduler = SyncScheduler()
+
+        async def succeed(job):
+            return {"records_synced": 10}
+
+        async def fail(job):
+            raise RuntimeError("boom")
+
+        for executor in (succeed, succeed, fail):
+            job = scheduler.create_sync_job("src", "name", ["stream"])
+            await scheduler.run_sync_job(job.job_id, executor_fn=executor)
+        scheduler.create_sync_job("src", "name", ["stream"])
+
+        stats = scheduler.get_stats()
+        assert stats["total_jobs"] == 4
+        assert stats["completed_jobs"] == 2
+        assert stats["failed_jobs"] == 1
+        assert stats["total_records_synced"] == 20
+        assert stats["running_jobs"] == 0
+
+    @pytest.mark.asyncio
+    async def test_job_history_newest_created_first(self):
+        """Test history is ordered by creation time even if jobs finish out of order."""
+        scheduler = SyncScheduler()
+
+        async def executor(job):
+            return {"records_synced": 1}
+
+        first = scheduler.create_sync_job("src_a", "name", ["stream"])
+        second = scheduler.create_sync_job("src_b", "name", ["stream"])
+        third = scheduler.create_sync_job("src_a", "name", ["stream"])
+        for job in (second, third, first):
+            await scheduler.run_sync_job(job.job_id, executor_fn=executor)
+
+        assert scheduler.get_job_history() == [third, second, first]
+        assert scheduler.get_job_history(source_id="src_a") == [third, first]
+        assert scheduler.get_job_history(limit=1) == [third]
+
+    @pytest.mark.asyncio
+    async def test_full_history_drops_oldest_created(self):
+        """Test a job finishing late into a full history evicts the oldest job only."""
+        scheduler = SyncScheduler()
+
+        async def executor(job):
+            return {"records_synced": 1}
+
+        oldest = scheduler.create_sync_job("src_old", "name", ["stream"])
+        middle = scheduler.create_sync_job("src_mid", "name", ["stream"])
+        jobs = [scheduler.create_sync_job(f"src_{i}", "name", ["stream"]) for i in range(99)]
+        base = oldest.created_at
+        middle.created_at = base + timedelta(seconds=1)
+        for i, job in enumerate(jobs):
+            job.created_at = base + timedelta(seconds=2 + i)
+
+        for job in jobs:
+            await scheduler.run_sync_job(job.job_id, executor_fn=executor)
+        await scheduler.run_sync_job(middle.job_id, executor_fn=executor)
+        await scheduler.run_sync_job(oldest.job_id, executor_fn=executor)
+
+        history = scheduler.get_job_history(limit=200)
+        assert len(history) == 100
+        assert history[-1] is middle
+        assert oldest not in history
+        assert history[:99] == jobs[::-1]
+
+    @pytest.mark.asyncio
+    async def test_run_due_schedules(self, monkeypatch):
+        """Test only enabled schedules whose run time has passed are fired."""
+        scheduler = SyncScheduler()
+        ran = []
+
+        async def fake_run(job_id, executor_fn=None):
+            ran.append(scheduler.get_job(job_id).metadata["schedule_id"])
+
+        monkeypatch.setattr(scheduler, "run_sync_job", fake_run)
+
+        due = scheduler.create_schedule("src_1", "name", ["s"], "* * * * *")
+        scheduler.update_schedule(due.schedule_id, streams=["s", "t"])
+        disabled = scheduler.create_schedule("src_2", "name", ["s"], "* * * * *")
+        scheduler.update_schedule(disabled.schedule_id, enabled=False)
+        later = scheduler.create_schedule("src_3", "name", ["s"], "0 0 * * *")
+
+        now = due.next_run_at + timedelta(seconds=1)
+        jobs = await scheduler.run_due_schedules(now=now)
+
+        assert ran == [due.schedule_id]
+        assert len(jobs) == 1
+        assert due.run_count == 1
+        assert later.run_count == 0
+
+    @pytest.mark.asyncio
+    async def test_tick_loop_starts_due_schedules(self, monkeypatch):
+        """Test the background loop fires a schedule once due, without waiting on it."""
+        scheduler = SyncScheduler()
+        started = asyncio.Event()
+        ran = []
+
+        async def fake_run(job_id, executor_fn=None):
+            ran.append(job_id)
+            started.set()
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(scheduler, "run_sync_job", fake_run)
+
+        schedule = scheduler.create_schedule("src", "name", ["s"], "0 0 * * *")
+        scheduler.start()
+        with scheduler._lock:
+            schedule.next_run_at = datetime.utcnow() - timedelta(seconds=1)
+            scheduler._push_due(schedule)
+
+        await asyncio.wait_for(started.wait(), timeout=1)
+
+        assert len(ran) == 1
+        assert not scheduler._tick_task.done()
+        assert len(scheduler._scheduled_tasks) == 1
+
+        await scheduler.stop()
+        await asyncio.sleep(0)
+
+        assert scheduler._tick_task is None
+        assert scheduler._scheduled_tasks == set()
+
+    def test_schedules_work_after_tick_loop_closes(self):
+        """Test schedules can still be created after the tick loop's event loop closed without stop()."""
+        scheduler = SyncScheduler()
+
+        async def run():
+            scheduler.start()
+
+        asyncio.run(run())
+        schedule = scheduler.create_schedule("src", "name", ["s"], "* * * * *")
+
+        assert scheduler.get_schedule(schedule.schedule_id) is schedule
+        assert scheduler._tick_wakeup is None
+
+    @pytest.mark.asyncio
+    async def test_jobs_beyond_limit_wait_for_a_slot(self):
+        """Test excess jobs queue instead of failing when the limit is reached."""
+        scheduler = SyncScheduler(max_concurrent_jobs=2)
+        peak = 0
+
+        async def executor(job):
+            nonlocal peak
+            peak = max(peak, len(scheduler.get_running_jobs()))
+            await asyncio.sleep(0.01)
+            return {"records_synced": 1}
+
+        jobs = [scheduler.create_sync_job(f"src_{i}", "name", ["s"]) for i in range(5)]
+        results = await asyncio.gather(
+            *(scheduler.run_sync_job(job.job_id, executor_fn=executor) for job in jobs)
+        )
+
+        assert all(job.status == SyncStatus.COMPLETED for job in results)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_job_cannot_be_started_twice(self):
+        """Test concurrent run requests for one job execute it only once."""
+        scheduler = SyncScheduler(max_concurrent_jobs=1)
+        calls = []
+
+        async def executor(job):
+            calls.append(job.job_id)
+            await asyncio.sleep(0.01)
+            return {"records_synced": 1}
+
+        blocker = scheduler.create_sync_job("src_0", "name", ["s"])
+        job = scheduler.create_sync_job("src_1", "name", ["s"])
+        results = await asyncio.gather(
+            scheduler.run_sync_job(blocker.job_id, executor_fn=executor),
+            scheduler.run_sync_job(job.job_id, executor_fn=executor),
+            scheduler.run_sync_job(job.job_id, executor_fn=executor),
+            return_exceptions=True,
+        )
+
+        assert calls == [blocker.job_id, job.job_id]
+        assert isinstance(results[2], ValueError)
+
+    def test_next_run_is_shared_within_a_minute(self):
+        """Test next runs are computed once per cron expression and minute."""
+        start = datetime(2024, 1, 15, 10, 5)
+        minute = (start - datetime(1970, 1, 1)) // timedelta(minutes=1)
+
+        first = _next_run_for("30 * * * *", minute)
+
+        assert _next_run_for("30 * * * *", minute) is first
+        assert first == datetime(2024, 1, 15, 10, 30)
+        assert _next_run_for("*/15 * * * *", minute) == datetime(2024, 1, 15, 10, 15)